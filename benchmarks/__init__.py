@@ -0,0 +1,10 @@
+"""
+The benchmarks of the custom implementations of the data structures.
+
+Each module of this package is a standalone script to measure one aspect of the
+implementations, and can be run from the root of the repository by:
+`python -m benchmarks.module_name`
+
+The benchmarks are not part of the test suite and print their results as plain
+text tables.
+"""
@@ -0,0 +1,60 @@
+"""Benchmark of ArenaLinkedList against DoublyLinkedList.
+
+This module compares the memory held per element, the number of objects tracked
+by the garbage collector and the time of a full collection while the list is
+alive, and the pushes per second, of the two doubly linked lists holding the
+same integers.
+
+Usage:
+    python -m benchmarks.bench_arena_linked_list [--max-exp 6]
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+import gc
+import tracemalloc
+from data_structures.sequence import DoublyLinkedList, ArenaLinkedList
+
+
+def _bench(cls, n_elms: int):
+    """Get the bytes per element, the number of the new GC-tracked objects,
+    the milliseconds of a full collection and the pushes per second."""
+    gc.collect()
+    n_tracked = len(gc.get_objects())
+    tracemalloc.start()
+    arr = cls[int]()
+    for i in range(n_elms):
+        arr.push(i)
+    n_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    n_tracked = len(gc.get_objects()) - n_tracked
+    start = perf_counter()
+    gc.collect()
+    t_collect = perf_counter() - start
+    del arr
+    arr = cls[int]()
+    start = perf_counter()
+    for i in range(n_elms):
+        arr.push(i)
+    t_push = perf_counter() - start
+    return n_bytes / n_elms, n_tracked, t_collect * 1e3, n_elms / t_push
+
+
+def main() -> None:
+    """Run the benchmark for the list sizes given in the command line."""
+    parser = ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--max-exp', type=int, default=6,
+                        help='the largest list size is 10^max-exp')
+    args = parser.parse_args()
+    print(f'{"list":<8}{"n":>10}{"B/elm":>8}{"gc objects":>12}'
+          f'{"gc ms":>9}{"push/s":>12}')
+    for exp in range(3, args.max_exp + 1):
+        n_elms = 10 ** exp
+        for name, cls in (('doubly', DoublyLinkedList),
+                          ('arena', ArenaLinkedList)):
+            b_elm, n_tracked, t_collect, push_rate = _bench(cls, n_elms)
+            print(f'{name:<8}{n_elms:>10}{b_elm:>8.1f}{n_tracked:>12}'
+                  f'{t_collect:>9.2f}{push_rate:>12,.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark of the bulk operations of FixedArray and DynamicArray.
+
+This module compares the per-element cost of the bulk operations, `extend`,
+`insert_many` and `delete_range`, against the equivalent loops of single element
+operations, `push`, `insert_at` and `delete_at`, for arrays of 10^3 to 10^7
+elements.
+
+The loop path of the middle insertion and deletion shifts the whole tail of the
+array for every element, so only a small batch is measured for it.
+
+Usage:
+    python -m benchmarks.bench_array_bulk_ops [--max-exp 7] [--batch 1000]
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Callable
+from data_structures.sequence import FixedArray, DynamicArray
+
+
+_LOOP_BATCH = 10
+"""The number of elements moved by the loop path of the middle operations."""
+
+
+def _time(func: Callable[[], None]) -> float:
+    """Get the wall time in seconds spent in calling the given function."""
+    start = perf_counter()
+    func()
+    return perf_counter() - start
+
+
+def bench_load(n_elms: int) -> None:
+    """Compare loading elements by `push` and by `extend`."""
+    vals = list(range(n_elms))
+
+    def loop():
+        arr = DynamicArray[int]()
+        for val in vals:
+            arr.push(val)
+
+    def bulk():
+        DynamicArray[int]().extend(vals)
+
+    _report('load', n_elms, _time(loop) / n_elms, _time(bulk) / n_elms)
+
+
+def bench_insert_middle(n_elms: int, batch: int) -> None:
+    """Compare inserting elements at the middle by `insert_at` and by
+    `insert_many`."""
+    arr = FixedArray[int](n_elms + batch)
+    arr.extend(range(n_elms))
+    idx = n_elms // 2
+
+    def loop():
+        for val in range(_LOOP_BATCH):
+            arr.insert_at(idx, val)
+
+    t_loop = _time(loop) / _LOOP_BATCH
+    arr.delete_range(idx, idx + _LOOP_BATCH)
+    t_bulk = _time(lambda: arr.insert_many(idx, range(batch))) / batch
+    _report('insert middle', n_elms, t_loop, t_bulk)
+
+
+def bench_delete_middle(n_elms: int, batch: int) -> None:
+    """Compare deleting elements at the middle by `delete_at` and by
+    `delete_range`."""
+    batch = min(batch, n_elms // 2)
+    arr = FixedArray[int](n_elms)
+    arr.extend(range(n_elms))
+    idx = (n_elms - batch - _LOOP_BATCH) // 2
+
+    def loop():
+        for _ in range(_LOOP_BATCH):
+            arr.delete_at(idx)
+
+    t_loop = _time(loop) / _LOOP_BATCH
+    t_bulk = _time(lambda: arr.delete_range(idx, idx + batch)) / batch
+    _report('delete middle', n_elms, t_loop, t_bulk)
+
+
+def _report(name: str, n_elms: int, t_loop: float, t_bulk: float) -> None:
+    """Print one row of the result table, the costs are in nanoseconds."""
+    print(f'{name:<15}{n_elms:>12}{t_loop * 1e9:>14.1f}{t_bulk * 1e9:>14.1f}'
+          f'{t_loop / t_bulk:>10.1f}x')
+
+
+def main() -> None:
+    """Run all the benchmarks for the array sizes given in the command line."""
+    parser = ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--max-exp', type=int, default=7,
+                        help='the largest array size is 10^max-exp')
+    parser.add_argument('--batch', type=int, default=1000,
+                        help='the number of elements moved by the bulk path')
+    args = parser.parse_args()
+    print(f'{"operation":<15}{"n":>12}{"loop ns/elm":>14}{"bulk ns/elm":>14}'
+          f'{"speedup":>11}')
+    for exp in range(3, args.max_exp + 1):
+        n_elms = 10 ** exp
+        bench_load(n_elms)
+        bench_insert_middle(n_elms, args.batch)
+        bench_delete_middle(n_elms, args.batch)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark of the bulk operations of ArrayQueue.
+
+This module compares the values moved per second through an ArrayQueue by a
+producer/consumer loop, pushing and popping the values in batches either one
+at a time or by `push_many()` and `pop_many()`.
+
+Usage:
+    python -m benchmarks.bench_array_queue [--n-vals 1000000]
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+from data_structures.sequence import ArrayQueue
+
+
+def _bench_single(n_vals: int, batch: int) -> float:
+    """Get the values moved per second by single pushes and pops."""
+    queue = ArrayQueue[int]()
+    vals = list(range(batch))
+    start = perf_counter()
+    for _ in range(n_vals // batch):
+        for val in vals:
+            queue.push(val)
+        for _ in range(batch):
+            queue.pop()
+    return n_vals / (perf_counter() - start)
+
+
+def _bench_bulk(n_vals: int, batch: int) -> float:
+    """Get the values moved per second by bulk pushes and pops."""
+    queue = ArrayQueue[int]()
+    vals = list(range(batch))
+    start = perf_counter()
+    for _ in range(n_vals // batch):
+        queue.push_many(vals)
+        queue.pop_many(batch)
+    return n_vals / (perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark for the number of values given in the command line."""
+    parser = ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--n-vals', type=int, default=1000000,
+                        help='the number of values moved per batch size')
+    args = parser.parse_args()
+    print(f'{"batch":>8}{"single/s":>14}{"bulk/s":>14}{"speedup":>9}')
+    for batch in (10, 100, 1000, 10000):
+        single = _bench_single(args.n_vals, batch)
+        bulk = _bench_bulk(args.n_vals, batch)
+        print(f'{batch:>8}{single:>14,.0f}{bulk:>14,.0f}'
+              f'{bulk / single:>9.1f}')
+
+
+if __name__ == '__main__':
+    main()
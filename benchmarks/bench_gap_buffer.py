@@ -0,0 +1,67 @@
+"""Benchmark of GapBuffer against DynamicArray on cursor-local edits.
+
+This module replays the same edit trace on the two sequences. The trace starts
+with a cursor in the middle of the sequence, then each edit moves the cursor by
+a few positions and inserts or deletes an element at the cursor, as a text
+editor does.
+
+Usage:
+    python -m benchmarks.bench_gap_buffer [--max-exp 6] [--n-edits 10000]
+"""
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+from typing import List, Tuple
+from data_structures.sequence import DynamicArray, GapBuffer
+
+
+def _edit_trace(n_elms: int, n_edits: int) -> List[Tuple[bool, int]]:
+    """Generate a trace of (is_insertion, index) edits around a cursor."""
+    rand = Random(n_elms)
+    trace = []
+    size, cursor = n_elms, n_elms // 2
+    for _ in range(n_edits):
+        cursor = min(max(cursor + rand.randint(-3, 3), 0), size - 1)
+        is_insertion = rand.random() < 0.6
+        trace.append((is_insertion, cursor))
+        size += 1 if is_insertion else -1
+    return trace
+
+
+def _replay(seq, trace: List[Tuple[bool, int]]) -> float:
+    """Replay the edit trace on the sequence and get the seconds spent."""
+    start = perf_counter()
+    for i, (is_insertion, idx) in enumerate(trace):
+        if is_insertion:
+            seq.insert_at(idx, i)
+        else:
+            seq.delete_at(idx)
+    return perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark for the sequence sizes given in the command line."""
+    parser = ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--max-exp', type=int, default=6,
+                        help='the largest sequence size is 10^max-exp')
+    parser.add_argument('--n-edits', type=int, default=10000,
+                        help='the number of edits in the trace')
+    args = parser.parse_args()
+    print(f'{"n":>10}{"array us/edit":>15}{"gap us/edit":>13}{"speedup":>9}')
+    for exp in range(3, args.max_exp + 1):
+        n_elms = 10 ** exp
+        trace = _edit_trace(n_elms, args.n_edits)
+        arr = DynamicArray[int]()
+        arr.extend(range(n_elms))
+        gap = GapBuffer[int]()
+        for val in range(n_elms):
+            gap.push(val)
+        t_arr = _replay(arr, trace) / args.n_edits
+        t_gap = _replay(gap, trace) / args.n_edits
+        assert arr.traverse() == gap.traverse()
+        print(f'{n_elms:>10}{t_arr * 1e6:>15.2f}{t_gap * 1e6:>13.2f}'
+              f'{t_arr / t_gap:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
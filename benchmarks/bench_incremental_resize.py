@@ -0,0 +1,55 @@
+"""Benchmark of the push latency of DynamicArray and IncrementalDynamicArray.
+
+This module pushes the same integers into the two arrays one by one and reports
+the percentiles of the latency of a single push. The amortised resizing of
+DynamicArray shows up in the maximum latency, which grows linearly with the
+size, while the incremental resizing keeps it flat.
+
+Usage:
+    python -m benchmarks.bench_incremental_resize [--max-exp 7]
+"""
+from argparse import ArgumentParser
+from time import perf_counter_ns
+from typing import List
+from data_structures.sequence import DynamicArray, IncrementalDynamicArray
+
+
+def _push_latencies(arr, n_elms: int) -> List[int]:
+    """Push `n_elms` integers into the array and get the sorted latencies in
+    nanoseconds."""
+    latencies = [0] * n_elms
+    for i in range(n_elms):
+        start = perf_counter_ns()
+        arr.push(i)
+        latencies[i] = perf_counter_ns() - start
+    latencies.sort()
+    return latencies
+
+
+def _percentile(latencies: List[int], pct: float) -> float:
+    """Get the given percentile of the sorted latencies in microseconds."""
+    return latencies[min(int(len(latencies) * pct), len(latencies) - 1)] / 1e3
+
+
+def main() -> None:
+    """Run the benchmark for the array sizes given in the command line."""
+    parser = ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--max-exp', type=int, default=7,
+                        help='the largest array size is 10^max-exp')
+    args = parser.parse_args()
+    print(f'{"array":<13}{"n":>10}{"p50 us":>10}{"p99 us":>10}'
+          f'{"p99.9 us":>10}{"max us":>12}')
+    for exp in range(3, args.max_exp + 1):
+        n_elms = 10 ** exp
+        for name, cls in (('amortised', DynamicArray),
+                          ('incremental', IncrementalDynamicArray)):
+            latencies = _push_latencies(cls[int](), n_elms)
+            print(f'{name:<13}{n_elms:>10}'
+                  f'{_percentile(latencies, 0.5):>10.2f}'
+                  f'{_percentile(latencies, 0.99):>10.2f}'
+                  f'{_percentile(latencies, 0.999):>10.2f}'
+                  f'{latencies[-1] / 1e3:>12.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark of IndexedDynamicArray against DynamicArray.
+
+This module measures the write overhead of keeping the hash index, for pushes,
+updates and middle insertions, and the speedup of `index_of` it buys, so that
+one can choose the array per workload.
+
+Usage:
+    python -m benchmarks.bench_indexed_dynamic_array [--max-exp 6]
+"""
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+from data_structures.sequence import DynamicArray, IndexedDynamicArray
+
+
+_N_SAMPLES = 1000
+"""The number of updates, middle insertions and lookups to measure."""
+
+
+def _bench(cls, n_elms: int):
+    """Get the microseconds per push, update, middle insertion and lookup."""
+    rand = Random(n_elms)
+    arr = cls[int]()
+    start = perf_counter()
+    for i in range(n_elms):
+        arr.push(i)
+    t_push = (perf_counter() - start) / n_elms
+    idxes = [rand.randrange(n_elms) for _ in range(_N_SAMPLES)]
+    start = perf_counter()
+    for i in idxes:
+        arr.update_at(i, -i)
+    t_update = (perf_counter() - start) / _N_SAMPLES
+    start = perf_counter()
+    for i in idxes[:_N_SAMPLES // 10]:
+        arr.insert_at(i, -i)
+    t_insert = (perf_counter() - start) / (_N_SAMPLES // 10)
+    start = perf_counter()
+    for i in idxes:
+        arr.index_of(i)
+    t_lookup = (perf_counter() - start) / _N_SAMPLES
+    return t_push * 1e6, t_update * 1e6, t_insert * 1e6, t_lookup * 1e6
+
+
+def main() -> None:
+    """Run the benchmark for the array sizes given in the command line."""
+    parser = ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--max-exp', type=int, default=6,
+                        help='the largest array size is 10^max-exp')
+    args = parser.parse_args()
+    print(f'{"array":<9}{"n":>10}{"push us":>10}{"update us":>11}'
+          f'{"insert us":>11}{"index_of us":>13}')
+    for exp in range(3, args.max_exp + 1):
+        n_elms = 10 ** exp
+        for name, cls in (('plain', DynamicArray),
+                          ('indexed', IndexedDynamicArray)):
+            t_push, t_update, t_insert, t_lookup = _bench(cls, n_elms)
+            print(f'{name:<9}{n_elms:>10}{t_push:>10.2f}{t_update:>11.2f}'
+                  f'{t_insert:>11.1f}{t_lookup:>13.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark of the linked list nodes before and after the slot-based nodes.
+
+This module measures the bytes per node and the pushes per second of a
+DoublyLinkedList built with the former nodes, which had an instance `__dict__`
+and were created through a generic alias like `self.Node[GT](val)`, against the
+slot-based nodes, with and without the free-list of deleted nodes. The churn
+column pops and pushes back the whole list, which is where the free-list helps.
+
+Usage:
+    python -m benchmarks.bench_linked_list_nodes [--max-exp 6]
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Generic, TypeVar
+import tracemalloc
+from data_structures.sequence import DoublyLinkedList
+
+
+GT = TypeVar('GT')
+
+
+class _DictNode(Generic[GT]):
+    # pylint: disable=too-few-public-methods
+    """The former doubly linked node, with an instance `__dict__`."""
+
+    def __init__(self, val: GT):
+        self.val = val
+        self.next = None
+        self.prev = None
+
+
+class _FormerDoublyLinkedList(DoublyLinkedList[GT]):
+    """The DoublyLinkedList creating its nodes as it formerly did."""
+
+    Node = _DictNode
+
+    def _new_node(self, val: GT) -> _DictNode[GT]:
+        return self.Node[GT](val)
+
+
+def _bench(factory, n_elms: int):
+    """Get the bytes per node, and the pushes and the churn pops and pushes
+    per second, of a list created by the given factory."""
+    tracemalloc.start()
+    arr = factory()
+    for i in range(n_elms):
+        arr.push(i)
+    n_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # measure the time without the tracing overhead
+    arr = factory()
+    start = perf_counter()
+    for i in range(n_elms):
+        arr.push(i)
+    t_push = perf_counter() - start
+    start = perf_counter()
+    for _ in range(n_elms):
+        arr.pop()
+    for i in range(n_elms):
+        arr.push(i)
+    t_churn = perf_counter() - start
+    return n_bytes / n_elms, n_elms / t_push, 2 * n_elms / t_churn
+
+
+def main() -> None:
+    """Run the benchmark for the list sizes given in the command line."""
+    parser = ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--max-exp', type=int, default=6,
+                        help='the largest list size is 10^max-exp')
+    args = parser.parse_args()
+    print(f'{"nodes":<12}{"n":>10}{"B/node":>9}{"push/s":>12}{"churn/s":>12}')
+    for exp in range(3, args.max_exp + 1):
+        n_elms = 10 ** exp
+        for name, factory in (
+                ('former', _FormerDoublyLinkedList[int]),
+                ('slots', DoublyLinkedList[int]),
+                ('slots+pool', lambda n=n_elms: DoublyLinkedList[int](n))):
+            b_node, push_rate, churn_rate = _bench(factory, n_elms)
+            print(f'{name:<12}{n_elms:>10}{b_node:>9.1f}{push_rate:>12,.0f}'
+                  f'{churn_rate:>12,.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark of the pushes of SinglyLinkedList with and without its tail node.
+
+This module measures how the cost of building a list by pushes and of using it
+as a FIFO, by pushes and `pop_left()`, scales with the list size. A push used to
+walk the whole list to find the last node, which the former column shows for
+the sizes small enough to finish.
+
+Usage:
+    python -m benchmarks.bench_singly_linked_list [--max-exp 6]
+        [--former-max-exp 4]
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import TypeVar
+from data_structures.sequence import SinglyLinkedList
+
+
+GT = TypeVar('GT')
+
+
+class _FormerSinglyLinkedList(SinglyLinkedList[GT]):
+    """The SinglyLinkedList pushing as it formerly did, by walking the list."""
+
+    def push(self, val: GT) -> None:
+        if self.size:
+            self._insert_after(val, self.node_at(self.size - 1))
+        else:
+            self._insert_head(val)
+
+
+def _bench_build(cls, n_elms: int) -> float:
+    """Get the microseconds per push to build a list of `n_elms` elements."""
+    arr = cls[int]()
+    start = perf_counter()
+    for i in range(n_elms):
+        arr.push(i)
+    return (perf_counter() - start) / n_elms * 1e6
+
+
+def _bench_fifo(n_elms: int) -> float:
+    """Get the microseconds per push and `pop_left()` pair on a list holding
+    `n_elms` elements."""
+    arr = SinglyLinkedList[int]()
+    for i in range(n_elms):
+        arr.push(i)
+    start = perf_counter()
+    for i in range(n_elms):
+        arr.push(i)
+        arr.pop_left()
+    return (perf_counter() - start) / n_elms * 1e6
+
+
+def main() -> None:
+    """Run the benchmark for the list sizes given in the command line."""
+    parser = ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--max-exp', type=int, default=6,
+                        help='the largest list size is 10^max-exp')
+    parser.add_argument('--former-max-exp', type=int, default=4,
+                        help='the largest list size for the former pushes')
+    args = parser.parse_args()
+    print(f'{"n":>10}{"push us":>10}{"fifo us":>10}{"former push us":>16}')
+    for exp in range(4, args.max_exp + 1):
+        n_elms = 10 ** exp
+        t_push = _bench_build(SinglyLinkedList, n_elms)
+        t_fifo = _bench_fifo(n_elms)
+        former = f'{_bench_build(_FormerSinglyLinkedList, n_elms):.2f}' \
+            if exp <= args.former_max_exp else '-'
+        print(f'{n_elms:>10}{t_push:>10.2f}{t_fifo:>10.2f}{former:>16}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark of TypedDynamicArray against DynamicArray.
+
+This module compares the memory held by the two arrays after pushing the same
+integers in, and the time of a full scan by `index_of` for a missing value.
+
+Usage:
+    python -m benchmarks.bench_typed_dynamic_array [--max-exp 7]
+"""
+from argparse import ArgumentParser
+from time import perf_counter
+import tracemalloc
+from data_structures.sequence import DynamicArray, TypedDynamicArray
+
+
+def _measure(factory, n_elms: int):
+    """Build an array of `n_elms` integers by the given factory and get the
+    number of bytes allocated for it and the seconds of a full scan."""
+    tracemalloc.start()
+    arr = factory()
+    arr.extend(range(1000, 1000 + n_elms))
+    n_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start = perf_counter()
+    arr.index_of(-1)
+    return n_bytes, perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark for the array sizes given in the command line."""
+    parser = ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--max-exp', type=int, default=7,
+                        help='the largest array size is 10^max-exp')
+    args = parser.parse_args()
+    print(f'{"n":>10}{"list B/elm":>12}{"typed B/elm":>13}{"ratio":>8}'
+          f'{"list scan ms":>14}{"typed scan ms":>15}{"speedup":>9}')
+    for exp in range(3, args.max_exp + 1):
+        n_elms = 10 ** exp
+        b_list, t_list = _measure(DynamicArray[int], n_elms)
+        b_typed, t_typed = _measure(
+            lambda: TypedDynamicArray[int]('int64'), n_elms)
+        print(f'{n_elms:>10}{b_list / n_elms:>12.1f}{b_typed / n_elms:>13.1f}'
+              f'{b_list / b_typed:>7.1f}x{t_list * 1e3:>14.2f}'
+              f'{t_typed * 1e3:>15.2f}{t_list / t_typed:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark of UnrolledLinkedList against the other linked lists.
+
+This module compares the memory held per element, the time of a full traversal
+and the time of an insertion at a random middle index for SinglyLinkedList,
+DoublyLinkedList and UnrolledLinkedList of a few block capacities.
+
+Usage:
+    python -m benchmarks.bench_unrolled_linked_list [--max-exp 5]
+"""
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+import tracemalloc
+from data_structures.sequence import SinglyLinkedList, DoublyLinkedList, \
+    UnrolledLinkedList
+
+
+_N_INSERTS = 100
+"""The number of middle insertions to measure."""
+
+
+def _bench(factory, n_elms: int):
+    """Get the bytes per element, the milliseconds of a traversal and the
+    microseconds per middle insertion of a list created by the factory."""
+    rand = Random(n_elms)
+    tracemalloc.start()
+    arr = factory()
+    for i in range(n_elms):
+        arr.push(i)
+    n_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start = perf_counter()
+    arr.traverse()
+    t_traverse = perf_counter() - start
+    idxes = [rand.randrange(n_elms // 4, n_elms * 3 // 4)
+             for _ in range(_N_INSERTS)]
+    start = perf_counter()
+    for i in idxes:
+        arr.insert_at(i, -i)
+    t_insert = (perf_counter() - start) / _N_INSERTS
+    return n_bytes / n_elms, t_traverse * 1e3, t_insert * 1e6
+
+
+def main() -> None:
+    """Run the benchmark for the list sizes given in the command line."""
+    parser = ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--max-exp', type=int, default=5,
+                        help='the largest list size is 10^max-exp')
+    args = parser.parse_args()
+    print(f'{"list":<13}{"n":>10}{"B/elm":>8}{"traverse ms":>13}'
+          f'{"insert us":>11}')
+    for exp in range(3, args.max_exp + 1):
+        n_elms = 10 ** exp
+        for name, factory in (
+                ('singly', SinglyLinkedList[int]),
+                ('doubly', DoublyLinkedList[int]),
+                ('unrolled-16', lambda: UnrolledLinkedList[int](16)),
+                ('unrolled-64', lambda: UnrolledLinkedList[int](64)),
+                ('unrolled-256', lambda: UnrolledLinkedList[int](256))):
+            b_elm, t_traverse, t_insert = _bench(factory, n_elms)
+            print(f'{name:<13}{n_elms:>10}{b_elm:>8.1f}{t_traverse:>13.2f}'
+                  f'{t_insert:>11.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,17 @@
+"""
+The custom implementations of the common cache data structures.
+
+This package includes the custom implementations of the common caches like the
+least recently used and the least frequently used caches, built on the doubly
+linked list of the `sequence` package, and a decorator to memoize a function by
+a cache. These implementations are only for learning purpose and have no
+practical usage.
+
+All the implemented classes are flatly imported here so that one can easily
+import them by `data_structure.cache.ClassName` instead of adding the module
+file name before the class name in the path.
+"""
+from .custom_cache import CustomCache
+from .lru_cache import LRUCache
+from .lfu_cache import LFUCache
+from .memoize import memoize
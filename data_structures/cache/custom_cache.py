@@ -0,0 +1,96 @@
+"""The abstract base class for all the custom implementations of a cache."""
+from typing import TypeVar, Generic, Optional, Callable
+from abc import ABC, abstractmethod
+
+
+KT = TypeVar('KT')
+"""type: The generic type to represent the key type of the cache."""
+
+VT = TypeVar('VT')
+"""type: The generic type to represent the value type of the cache."""
+
+
+class CustomCache(Generic[KT, VT], ABC):
+    """The abstract base class for all custom implementations of a cache.
+
+    A cache holds the values of at most `capacity` in total weight, where the
+    weight of a value is given by `size_of`, or is 1 to count the values if not
+    given. The entries are evicted by the policy of the actual class to make
+    room for a new one, and a value heavier than the capacity is not cached.
+
+    Args:
+        capacity: the maximum total weight of the values
+        size_of: the function to get the weight of a value, or `None` to count
+            the values
+
+    Attributes:
+        capacity (int): the maximum total weight of the values
+        weight (int): the current total weight of the values
+        hits (int): the number of the lookups finding their keys
+        misses (int): the number of the lookups not finding their keys
+        evictions (int): the number of the entries evicted to make room
+    """
+
+    def __init__(
+            self,
+            capacity: int,
+            size_of: Optional[Callable[[VT], int]] = None
+        ):
+        self.capacity = capacity
+        self.size_of = size_of
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _weigh(self, val: VT) -> int:
+        """Get the weight of a value."""
+        return self.size_of(val) if self.size_of else 1
+
+    @abstractmethod
+    def get_size(self) -> int:
+        """Get the number of the entries in the cache.
+
+        Returns:
+            The number of the entries
+        """
+
+    @abstractmethod
+    def get(self, key: KT, default: Optional[VT] = None) -> Optional[VT]:
+        """Get the value of a key, counting a hit or a miss.
+
+        Args:
+            key: the key to look for
+            default: the value to return if the key is not cached
+
+        Returns:
+            The value of the key or the default value if not cached
+        """
+
+    @abstractmethod
+    def put(self, key: KT, val: VT) -> None:
+        """Put a value for a key into the cache, evicting the other entries if
+        needed to make room.
+
+        Args:
+            key: the key of the value
+            val: the value to cache
+        """
+
+    @abstractmethod
+    def delete(self, key: KT) -> bool:
+        """Delete the entry of a key.
+
+        Args:
+            key: the key to delete
+
+        Returns:
+            `True` if the key was cached or `False` otherwise
+        """
+
+    @abstractmethod
+    def __contains__(self, key: KT) -> bool:
+        """Check if a key is cached, without counting a hit or a miss."""
+
+    def __len__(self) -> int:
+        return self.get_size()
@@ -0,0 +1,153 @@
+"""Custom implementation of a least frequently used cache.
+
+This module implements a cache which evicts the entry used the fewest times, by
+keeping its entries as the nodes of one doubly linked list per number of uses.
+It has no practical usage but only serves as an data structure exercise.
+"""
+from typing import TypeVar, Optional, Callable, Dict
+from data_structures.sequence import DoublyLinkedList
+from .custom_cache import CustomCache
+
+
+KT = TypeVar('KT')
+"""type: The generic type to represent the key type of the cache."""
+
+VT = TypeVar('VT')
+"""type: The generic type to represent the value type of the cache."""
+
+
+class LFUCache(CustomCache[KT, VT]):
+    """
+    `LFUCache[K, V](n)` -> an empty LFU cache of at most `n` values.
+    `LFUCache[K, V](n, size_of)` -> an empty LFU cache of values of at most `n`
+    in total weight given by `size_of`.
+
+    This is a custom implementation of a Least Frequently Used cache for
+    learning purpose. Each entry is a node of the doubly linked list of the
+    entries used the same number of times, ordered from the least to the most
+    recently used, and a hash map finds the node of a key. A hit moves the node
+    to the end of the list of the next frequency, and an eviction removes the
+    head node of the list of the lowest frequency, so the least recently used
+    among the least frequently used, both by relinking the node in O(1).
+
+    The lowest frequency is tracked on the hits, the updates and the
+    insertions. It is only searched among the frequencies in use when a
+    deletion or an update has emptied its list before an eviction. An update
+    of a stored key never evicts the entry being updated.
+
+    Args:
+        capacity: the maximum total weight of the values
+        size_of: the function to get the weight of a value, or `None` to count
+            the values
+    """
+
+    class Entry(DoublyLinkedList.Node):
+        # pylint: disable=too-few-public-methods
+        """
+        The doubly linked node of an entry, with its key, the weight of its
+        value and its number of uses.
+        """
+        __slots__ = ('key', 'weight', 'freq')
+
+        def __init__(self, key: KT, val: VT, weight: int, freq: int):
+            super().__init__(val)
+            self.key = key
+            self.weight = weight
+            self.freq = freq
+
+    def __init__(
+            self,
+            capacity: int,
+            size_of: Optional[Callable[[VT], int]] = None
+        ):
+        super().__init__(capacity, size_of)
+        self._map: Dict[KT, LFUCache.Entry] = {}
+        # the entries of each frequency from the least to the most recently
+        # used, without empty lists
+        self._buckets: Dict[int, DoublyLinkedList[VT]] = {}
+        self._min_freq = 0
+
+    def _link(self, entry: Entry) -> None:
+        """Link an entry at the end of the list of its frequency."""
+        bucket = self._buckets.get(entry.freq)
+        if bucket is None:
+            bucket = self._buckets[entry.freq] = DoublyLinkedList[VT]()
+        bucket.append_node(entry)
+
+    def _unlink(self, entry: Entry) -> None:
+        """Unlink an entry from the list of its frequency."""
+        bucket = self._buckets[entry.freq]
+        bucket.remove_node(entry)
+        if not bucket.size:
+            del self._buckets[entry.freq]
+
+    def _touch(self, entry: Entry) -> None:
+        """Count a use of an entry by moving it to the next frequency."""
+        self._unlink(entry)
+        if self._min_freq == entry.freq and entry.freq not in self._buckets:
+            self._min_freq += 1
+        entry.freq += 1
+        self._link(entry)
+
+    def _remove(self, entry: Entry) -> None:
+        """Remove an entry from its list and the map."""
+        self._unlink(entry)
+        del self._map[entry.key]
+        self.weight -= entry.weight
+
+    def _evict(self) -> None:
+        """Evict the least recently used entry of the lowest frequency."""
+        if self._min_freq not in self._buckets:
+            self._min_freq = min(self._buckets)
+        self._remove(self._buckets[self._min_freq].head)
+        self.evictions += 1
+
+    def get_size(self) -> int:
+        return len(self._map)
+
+    def get(self, key: KT, default: Optional[VT] = None) -> Optional[VT]:
+        entry = self._map.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(entry)
+        return entry.val
+
+    def put(self, key: KT, val: VT) -> None:
+        weight = self._weigh(val)
+        entry = self._map.get(key)
+        if weight > self.capacity:
+            if entry is not None:
+                self._remove(entry)
+            return
+        if entry is not None:
+            # an update counts as a use, and only evicts the other entries to
+            # make room, so the entry is out of the lists during the evictions
+            self._unlink(entry)
+            self.weight -= entry.weight
+            while self.weight + weight > self.capacity:
+                self._evict()
+            entry.val = val
+            entry.weight = weight
+            entry.freq += 1
+            self._link(entry)
+            self._min_freq = min(self._min_freq, entry.freq)
+        else:
+            while self.weight + weight > self.capacity:
+                self._evict()
+            entry = self.Entry(key, val, weight, 1)
+            self._link(entry)
+            self._map[key] = entry
+            self._min_freq = 1
+        self.weight += weight
+
+    def delete(self, key: KT) -> bool:
+        entry = self._map.get(key)
+        if entry is None:
+            return False
+        self._remove(entry)
+        return True
+
+    def __contains__(self, key: KT) -> bool:
+        return key in self._map
@@ -0,0 +1,102 @@
+"""Custom implementation of a least recently used cache.
+
+This module implements a cache which evicts the entry used the longest time
+ago, by keeping its entries as the nodes of a doubly linked list in the order
+of their uses. It has no practical usage but only serves as an data structure
+exercise.
+"""
+from typing import TypeVar, Optional, Callable, Dict
+from data_structures.sequence import DoublyLinkedList
+from .custom_cache import CustomCache
+
+
+KT = TypeVar('KT')
+"""type: The generic type to represent the key type of the cache."""
+
+VT = TypeVar('VT')
+"""type: The generic type to represent the value type of the cache."""
+
+
+class LRUCache(CustomCache[KT, VT]):
+    """
+    `LRUCache[K, V](n)` -> an empty LRU cache of at most `n` values.
+    `LRUCache[K, V](n, size_of)` -> an empty LRU cache of values of at most `n`
+    in total weight given by `size_of`.
+
+    This is a custom implementation of a Least Recently Used cache for learning
+    purpose. Each entry is a node of a doubly linked list ordered from the
+    least to the most recently used, and a hash map finds the node of a key. A
+    hit moves the node to the end of the list and an eviction removes the head
+    node, both by relinking the node in O(1).
+
+    Args:
+        capacity: the maximum total weight of the values
+        size_of: the function to get the weight of a value, or `None` to count
+            the values
+    """
+
+    class Entry(DoublyLinkedList.Node):
+        # pylint: disable=too-few-public-methods
+        """
+        The doubly linked node of an entry, with its key and the weight of its
+        value.
+        """
+        __slots__ = ('key', 'weight')
+
+        def __init__(self, key: KT, val: VT, weight: int):
+            super().__init__(val)
+            self.key = key
+            self.weight = weight
+
+    def __init__(
+            self,
+            capacity: int,
+            size_of: Optional[Callable[[VT], int]] = None
+        ):
+        super().__init__(capacity, size_of)
+        self._map: Dict[KT, LRUCache.Entry] = {}
+        # the entries from the least to the most recently used
+        self._order = DoublyLinkedList[VT]()
+
+    def _remove(self, entry: Entry) -> None:
+        """Remove an entry from the list and the map."""
+        self._order.remove_node(entry)
+        del self._map[entry.key]
+        self.weight -= entry.weight
+
+    def get_size(self) -> int:
+        return len(self._map)
+
+    def get(self, key: KT, default: Optional[VT] = None) -> Optional[VT]:
+        entry = self._map.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._order.move_to_end(entry)
+        return entry.val
+
+    def put(self, key: KT, val: VT) -> None:
+        weight = self._weigh(val)
+        entry = self._map.get(key)
+        if entry is not None:
+            self._remove(entry)
+        if weight > self.capacity:
+            return
+        while self.weight + weight > self.capacity:
+            self._remove(self._order.head)
+            self.evictions += 1
+        entry = self.Entry(key, val, weight)
+        self._order.append_node(entry)
+        self._map[key] = entry
+        self.weight += weight
+
+    def delete(self, key: KT) -> bool:
+        entry = self._map.get(key)
+        if entry is None:
+            return False
+        self._remove(entry)
+        return True
+
+    def __contains__(self, key: KT) -> bool:
+        return key in self._map
@@ -0,0 +1,45 @@
+"""The decorator to memoize a function by a custom cache."""
+from functools import wraps
+from typing import Callable
+from .custom_cache import CustomCache
+
+
+_MISSING = object()
+"""The sentinel for a value not cached, as `None` can be a cached value."""
+
+_KWARGS_MARK = object()
+"""The separator between the positional and the keyword arguments in a key."""
+
+
+def memoize(cache: CustomCache) -> Callable[[Callable], Callable]:
+    """Create a decorator to memoize a function by the given cache.
+
+    The function is called only if its arguments are not cached, and the result
+    is put into the cache. The arguments must be hashable. The cache is exposed
+    as the `cache` attribute of the decorated function.
+
+    Example:
+        @memoize(LRUCache(128))
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    Args:
+        cache: the cache to keep the results
+
+    Returns:
+        The decorator to memoize a function
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            val = cache.get(key, _MISSING)
+            if val is _MISSING:
+                val = func(*args, **kwargs)
+                cache.put(key, val)
+            return val
+        wrapper.cache = cache
+        return wrapper
+    return decorator
@@ -11,12 +11,27 @@ file name before the class name in the path.
 """
 # array
 from .custom_sequence import CustomSequence
+from .array.array_view import ArrayView
 from .array.fixed_array import FixedArray
+from .array.growth_policy import GrowthPolicy
 from .array.dynamic_array import DynamicArray
+from .array.typed_dynamic_array import TypedDynamicArray
+from .array.incremental_dynamic_array import IncrementalDynamicArray
+from .array.indexed_dynamic_array import IndexedDynamicArray
+from .array.sorted_array import SortedArray
+from .array.sparse_array import SparseArray
+from .array.bit_array import BitArray
+from .array.persistent_array import PersistentArray
+from .array.gap_buffer import GapBuffer
+from .array.chunked_sequence import ChunkedSequence
+from .array.mmap_fixed_array import MmapFixedArray
 # linked list
 from .linked_list.custom_linked_list import LinkedListMixin
 from .linked_list.singly_linked_list import SinglyLinkedList
 from .linked_list.doubly_linked_list import DoublyLinkedList
+from .linked_list.indexable_skip_list import IndexableSkipList
+from .linked_list.unrolled_linked_list import UnrolledLinkedList
+from .linked_list.arena_linked_list import ArenaLinkedList
 # abstract base classes for stack and queue
 from .stack_queue.custom_stack_queue import CustomStackQueue
 from .stack_queue.custom_stack_queue import CustomStack, CustomQueue
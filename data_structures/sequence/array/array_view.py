@@ -0,0 +1,147 @@
+"""Custom implementation of a read-only view over a part of an array.
+
+This module implements a view which exposes a slice of an array without copying
+any element. It is only for learning purpose and serves as an exercise of
+sharing the storage of a data structure.
+"""
+from __future__ import annotations
+from typing import TypeVar, Generic, Optional, Sequence, Iterator
+from ..custom_sequence import CustomSequence
+
+
+GT = TypeVar('GT')
+"""type: The generic type to represent the type of the array element."""
+
+
+class ArrayView(Generic[GT]):
+    """
+    `ArrayView[T](arr, lo, hi, step)` -> a read-only view of the elements of
+    `arr` at the indexes of `range(lo, hi, step)`.
+
+    This is a custom implementation of a view for learning purpose. The view
+    keeps a reference to the parent array and translates its own indexes into
+    the indexes of the parent, so creating or slicing a view copies nothing. The
+    bounds follow the Python slice semantics and are clipped to the size of the
+    parent when the view is created.
+
+    The view records the version of the parent when created. The parent bumps
+    its version whenever it is resized, i.e. its size or its internal list
+    changes, after which the view is stale and any access raises a
+    `RuntimeError`. An in-place update of the parent is visible through the
+    view.
+
+    Args:
+        parent: the array to view, which has a `_version` attribute
+        lo: the first index of the parent in the view, inclusive
+        hi: the last index of the parent in the view, exclusive
+        step: the step between two indexes of the parent in the view
+
+    Attributes:
+        parent (CustomSequence[T]): the viewed array
+    """
+
+    def __init__(
+            self,
+            parent: CustomSequence[GT],
+            lo: Optional[int] = None,
+            hi: Optional[int] = None,
+            step: Optional[int] = None
+        ):
+        self.parent = parent
+        self._range = range(*slice(lo, hi, step).indices(parent.get_size()))
+        self._version = parent._version  # pylint: disable=protected-access
+
+    def is_valid(self) -> bool:
+        """
+        Check if the view is still valid, i.e. the parent is not resized since.
+
+        Returns:
+            `True` if the view is valid or `False` otherwise
+        """
+        return self._version == self.parent._version  # pylint: disable=protected-access
+
+    def _check(self) -> None:
+        """Raise a `RuntimeError` if the view is stale."""
+        if not self.is_valid():
+            raise RuntimeError('The array is resized after the view created.')
+
+    def view(
+            self,
+            lo: Optional[int] = None,
+            hi: Optional[int] = None,
+            step: Optional[int] = None
+        ) -> ArrayView[GT]:
+        """
+        Get a view of a slice of this view, sharing the same parent.
+
+        Args:
+            lo: the first index of the slice, inclusive
+            hi: the last index of the slice, exclusive
+            step: the step between two indexes of the slice
+
+        Returns:
+            The view of the slice
+        """
+        self._check()
+        sub = ArrayView[GT](self.parent)
+        sub._range = self._range[lo:hi:step]
+        sub._version = self._version
+        return sub
+
+    def get_size(self) -> int:
+        """
+        Get the size of the view.
+
+        Returns:
+            The size of the view
+        """
+        self._check()
+        return len(self._range)
+
+    def index_of(self, val: GT) -> int:
+        """
+        Get the index in the view of a value, or -1 if not found.
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the value or -1 if not found
+        """
+        for i, value in enumerate(self):
+            if value == val:
+                return i
+        return -1
+
+    def value_at(self, idx: int) -> Optional[GT]:
+        """
+        Get the value at the given index of the view.
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The value at the given index or `None` if index not valid
+        """
+        self._check()
+        if 0 <= idx < len(self._range):
+            return self.parent.value_at(self._range[idx])
+        return None
+
+    def traverse(self) -> Sequence[GT]:
+        """
+        Traverse all elements in the view and return them in a list.
+
+        Returns:
+            A list containing all elements of the view in order
+        """
+        return list(self)
+
+    def __iter__(self) -> Iterator[GT]:
+        self._check()
+        for i in self._range:
+            self._check()
+            yield self.parent.value_at(i)
+
+    def __len__(self) -> int:
+        return self.get_size()
@@ -0,0 +1,352 @@
+"""Custom implementation of a bit-packed boolean array.
+
+This module implements a fixed length array of booleans which packs eight of
+them into a byte, instead of holding a reference of 8 bytes per boolean like a
+list. It has no practical usage but only serves as an data structure exercise.
+"""
+from operator import and_, or_, xor
+from typing import Optional, Sequence, Iterator, Callable
+from ..custom_sequence import CustomSequence
+
+
+_POPCOUNT = bytes(bin(i).count('1') for i in range(256))
+"""The table of the number of the set bits in each byte value."""
+
+_CHUNK = 512
+"""The number of bytes scanned at once by the searches and the counts."""
+
+
+class BitArray(CustomSequence[bool]):
+    """
+    `BitArray(n)` -> a bit-packed array of maximum size `n` for booleans.
+
+    This is a custom implementation of a Bit Array for learning purpose. The
+    elements are stored as bits in a `bytearray`, the element at index `i`
+    being the bit `i % 8` of the byte `i // 8`, so that the array takes one bit
+    per element.
+
+    The bitwise operators `&`, `|`, `^` and `~` combine arrays of the same size
+    into a new array, word by word instead of bit by bit, by viewing the whole
+    buffer as a Python integer. An insertion or a deletion in the middle shifts
+    the buffer in the same way. The searches and the counts scan the buffer in
+    place chunk by chunk instead, and stop at the chunk holding the result.
+
+    Args:
+        max_size: the maximum size of the array
+
+    Attributes:
+        data (bytearray): the buffer of `ceil(max_size / 8)` bytes to store
+            the bits, whose bits after the current size are always cleared
+        max_size (int): the maximum size of the array
+        curr_size (int): the current size of the array
+    """
+
+    def __init__(self, max_size: int):
+        super().__init__()
+        self.data = bytearray((max_size + 7) // 8)
+        self.max_size = max_size
+        self.curr_size = 0
+
+    def _to_int(self) -> int:
+        """View the buffer as an integer, the bit `i` being the element `i`."""
+        return int.from_bytes(self.data, 'little')
+
+    def _from_int(self, bits: int) -> None:
+        """Write the given integer back to the buffer."""
+        self.data[:] = bits.to_bytes(len(self.data), 'little')
+
+    def _find_first(self, val: bool) -> int:
+        """
+        Get the index of the first element of the given value, viewing the
+        buffer chunk by chunk as integers.
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the first element of the value or -1 if not found
+        """
+        with memoryview(self.data) as view:
+            for pos in range(0, (self.curr_size + 7) >> 3, _CHUNK):
+                word = int.from_bytes(view[pos:pos + _CHUNK], 'little')
+                if not val:
+                    n_bits = min(_CHUNK << 3, self.curr_size - (pos << 3))
+                    word = ~word & ((1 << n_bits) - 1)
+                if word:
+                    return (pos << 3) + (word & -word).bit_length() - 1
+        return -1
+
+    def _count(self, start: int, stop: int) -> int:
+        """
+        Count the set bits in the given range of bytes, chunk by chunk.
+
+        Args:
+            start: the position of the first byte
+            stop: the position after the last byte
+
+        Returns:
+            The number of the set bits in the bytes
+        """
+        return sum(
+            sum(self.data[pos:min(pos + _CHUNK, stop)].translate(_POPCOUNT))
+            for pos in range(start, stop, _CHUNK)
+        )
+
+    def _set_bit(self, idx: int, val: bool) -> None:
+        """Set or clear the bit at the given index."""
+        if val:
+            self.data[idx >> 3] |= 1 << (idx & 7)
+        else:
+            self.data[idx >> 3] &= ~(1 << (idx & 7)) & 0xff
+
+    def get_size(self) -> int:
+        """
+        Get the current size of the array.
+
+        Returns:
+            The current size of the array
+        """
+        return self.curr_size
+
+    def index_of(self, val: bool) -> int:
+        """
+        Get the index of a value, or -1 if not found.
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the value or -1 if not found
+        """
+        if val is None or val not in (False, True):
+            return -1
+        return self._find_first(val)
+
+    def value_at(self, idx: int) -> Optional[bool]:
+        """
+        Get the value at the given index.
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The value at the given index or `None` if index not valid
+        """
+        if 0 <= idx < self.curr_size:
+            return bool(self.data[idx >> 3] >> (idx & 7) & 1)
+        return None
+
+    def insert_at(self, idx: int, val: bool) -> bool:
+        """
+        Insert a value at the given index.
+
+        Note:
+            The value will not be inserted if the index is not valid or the
+            array is already full.
+
+        Args:
+            idx: the index to insert at
+            val: the value to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        if 0 <= idx <= self.curr_size < self.max_size:
+            if idx < self.curr_size:
+                bits = self._to_int()
+                low = bits & ((1 << idx) - 1)
+                self._from_int(low | (bits >> idx << (idx + 1)))
+            self._set_bit(idx, val)
+            self.curr_size += 1
+            return True
+        return False
+
+    def delete_at(self, idx: int) -> bool:
+        """
+        Delete an element at the given index.
+
+        Note:
+            The deletion will not perform if the index is not valid.
+
+        Args:
+            idx: the index to perform deletion
+
+        Returns:
+            `True` if deletion is successful or `False` otherwise
+        """
+        if 0 <= idx < self.curr_size:
+            if idx < self.curr_size - 1:
+                bits = self._to_int()
+                low = bits & ((1 << idx) - 1)
+                self._from_int(low | (bits >> (idx + 1) << idx))
+            else:
+                self._set_bit(idx, False)
+            self.curr_size -= 1
+            return True
+        return False
+
+    def update_at(self, idx: int, val: bool) -> bool:
+        """
+        Update an element at the given index by the given value.
+
+        Note:
+            The update will not perform if the index is not valid.
+
+        Args:
+            idx: the index to update
+            val: the new value
+
+        Returns:
+            `True` if update is successful or `False` otherwise
+        """
+        if 0 <= idx < self.curr_size:
+            self._set_bit(idx, val)
+            return True
+        return False
+
+    def push(self, val: bool) -> None:
+        """
+        Push a value into the array's end.
+
+        Note:
+            Nothing will happen if the array is already full.
+
+        Args:
+            val: the value to push in
+        """
+        self.insert_at(self.curr_size, val)
+
+    def pop(self) -> Optional[bool]:
+        """
+        Pop a value out of the array's end and return the value.
+
+        Returns:
+            The popped value or `None` if empty array
+        """
+        if not self.curr_size:
+            return None
+        val = self.value_at(self.curr_size - 1)
+        self.delete_at(self.curr_size - 1)
+        return val
+
+    def traverse(self) -> Sequence[bool]:
+        """
+        Traverse all elements in the array and return them in a list.
+
+        Returns:
+            A list containing all elements of the array in order
+        """
+        return list(self)
+
+    def __iter__(self) -> Iterator[bool]:
+        for i in range(self.curr_size):
+            yield bool(self.data[i >> 3] >> (i & 7) & 1)
+
+    def __reversed__(self) -> Iterator[bool]:
+        for i in range(self.curr_size - 1, -1, -1):
+            yield bool(self.data[i >> 3] >> (i & 7) & 1)
+
+    def popcount(self) -> int:
+        """
+        Count the elements which are `True`.
+
+        Returns:
+            The number of the set bits
+        """
+        return self._count(0, len(self.data))
+
+    def find_first_set(self) -> int:
+        """
+        Get the index of the first element which is `True`, skipping the
+        cleared chunks at once.
+
+        Returns:
+            The index of the first set bit or -1 if none
+        """
+        return self._find_first(True)
+
+    def rank(self, idx: int) -> int:
+        """
+        Count the elements which are `True` before the given index.
+
+        Args:
+            idx: the index to count up to, exclusive
+
+        Returns:
+            The number of the set bits in the index range `[0, idx)`
+        """
+        idx = max(0, min(idx, self.curr_size))
+        count = self._count(0, idx >> 3)
+        if idx & 7:
+            count += _POPCOUNT[self.data[idx >> 3] & ((1 << (idx & 7)) - 1)]
+        return count
+
+    def select(self, k: int) -> int:
+        """
+        Get the index of the `k`-th element which is `True`, counting from 0,
+        so that `rank(select(k)) == k`.
+
+        Args:
+            k: the number of the set bits to skip
+
+        Returns:
+            The index of the `k`-th set bit or -1 if not that many set bits
+        """
+        if k < 0:
+            return -1
+        # skip the whole chunks, then the whole bytes of the chunk found
+        for start in range(0, len(self.data), _CHUNK):
+            count = self._count(start, min(start + _CHUNK, len(self.data)))
+            if k < count:
+                break
+            k -= count
+        else:
+            return -1
+        pos = start
+        while k >= _POPCOUNT[self.data[pos]]:
+            k -= _POPCOUNT[self.data[pos]]
+            pos += 1
+        # the number of the set bits to skip in the byte found
+        byte = self.data[pos]
+        for _ in range(k):
+            byte &= byte - 1
+        return (pos << 3) + (byte & -byte).bit_length() - 1
+
+    def _combine(
+            self, other: 'BitArray', operator: Callable[[int, int], int]
+        ) -> 'BitArray':
+        """
+        Combine this array and another array of the same size bitwise.
+
+        Args:
+            other: the other array
+            operator: the bitwise operator on the buffers viewed as integers
+
+        Returns:
+            The new array of the combined bits
+
+        Raises:
+            ValueError: if the other array is not a BitArray of the same size
+        """
+        if not isinstance(other, BitArray) or \
+                other.curr_size != self.curr_size:
+            raise ValueError('Can only combine BitArrays of the same size.')
+        res = BitArray(self.max_size)
+        res.curr_size = self.curr_size
+        res._from_int(operator(self._to_int(), other._to_int()))
+        return res
+
+    def __and__(self, other: 'BitArray') -> 'BitArray':
+        return self._combine(other, and_)
+
+    def __or__(self, other: 'BitArray') -> 'BitArray':
+        return self._combine(other, or_)
+
+    def __xor__(self, other: 'BitArray') -> 'BitArray':
+        return self._combine(other, xor)
+
+    def __invert__(self) -> 'BitArray':
+        res = BitArray(self.max_size)
+        res.curr_size = self.curr_size
+        res._from_int(~self._to_int() & ((1 << self.curr_size) - 1))
+        return res
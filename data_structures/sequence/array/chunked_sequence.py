@@ -0,0 +1,355 @@
+"""Custom implementation of a chunked sequence.
+
+This module implements a sequence which stores its elements in small arrays,
+the chunks, under a counted balanced tree, in the way of a B+ tree indexed by
+positions instead of keys. It has no practical usage but only serves as an data
+structure exercise.
+"""
+from __future__ import annotations
+from typing import TypeVar, Generic, Optional, Sequence, List, Union, Tuple, \
+    Iterator
+from ..custom_sequence import CustomSequence
+
+
+GT = TypeVar('GT')
+"""type: The generic type to represent the element type of the sequence."""
+
+
+class ChunkedSequence(CustomSequence[GT]):
+    """
+    `ChunkedSequence[T]()` -> an empty chunked sequence of type `T`.
+    `ChunkedSequence[T](chunk_size)` -> an empty chunked sequence of type `T`
+    whose chunks and tree nodes hold at most `chunk_size` items.
+
+    This is a custom implementation of a chunked sequence for learning purpose.
+    The elements are stored in order in the leaves, each a list of at most
+    `chunk_size` values. The leaves are the bottom level of a balanced tree, in
+    which each branch keeps its children and the number of elements under each
+    child. A position is located by walking down the tree and skipping the
+    children before it, so the positional operations cost O(log n) while a
+    scan runs over the leaf lists almost at the speed of a single list.
+
+    A node splits in halves when it overflows and merges with or borrows from a
+    sibling when it drops below half full, which keeps all the leaves at the
+    same depth.
+
+    Args:
+        chunk_size: the maximum number of items in a leaf or a branch
+
+    Attributes:
+        root (Union[Leaf[T], Branch[T]]): the root node of the tree
+        size (int): the size of the sequence
+        chunk_size (int): the maximum number of items in a leaf or a branch
+    """
+
+    class Leaf(Generic[GT]):
+        # pylint: disable=too-few-public-methods
+        """
+        The leaf node which stores a chunk of the elements.
+        """
+        __slots__ = ('vals',)
+
+        def __init__(self, vals: List[GT]):
+            self.vals = vals
+
+    class Branch(Generic[GT]):
+        # pylint: disable=too-few-public-methods
+        """
+        The branch node which stores the child nodes and their sizes.
+        """
+        __slots__ = ('children', 'sizes')
+
+        def __init__(self, children: List, sizes: List[int]):
+            self.children = children
+            self.sizes = sizes
+
+    _DEFAULT_CHUNK_SIZE: int = 64
+    """The default maximum number of items in a leaf or a branch."""
+
+    def __init__(self, chunk_size: int = _DEFAULT_CHUNK_SIZE):
+        super().__init__()
+        self.chunk_size = max(chunk_size, 4)
+        self.root = self.Leaf[GT]([])
+        self.size = 0
+
+    @staticmethod
+    def _n_items(node: Union[Leaf[GT], Branch[GT]]) -> int:
+        """Get the number of values of a leaf or children of a branch."""
+        if isinstance(node, ChunkedSequence.Leaf):
+            return len(node.vals)
+        return len(node.children)
+
+    @staticmethod
+    def _size_of(node: Union[Leaf[GT], Branch[GT]]) -> int:
+        """Get the number of elements under a leaf or a branch."""
+        if isinstance(node, ChunkedSequence.Leaf):
+            return len(node.vals)
+        return sum(node.sizes)
+
+    def _leaf_at(self, idx: int) -> Tuple[Leaf[GT], int]:
+        """
+        Get the leaf holding the element at the given valid index and the index
+        of the element inside the leaf.
+        """
+        node = self.root
+        while isinstance(node, self.Branch):
+            i = 0
+            while idx >= node.sizes[i]:
+                idx -= node.sizes[i]
+                i += 1
+            node = node.children[i]
+        return node, idx
+
+    def get_size(self) -> int:
+        """
+        Get the current size.
+
+        Returns:
+            The current size
+        """
+        return self.size
+
+    def _leaves(self, reverse: bool = False) -> Iterator[Leaf[GT]]:
+        """Iterate the leaves in order, or in reverse order if required."""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, self.Leaf):
+                yield node
+            elif reverse:
+                stack.extend(node.children)
+            else:
+                stack.extend(reversed(node.children))
+
+    def index_of(self, val: GT) -> int:
+        """
+        Get the index of a value, or -1 if not found.
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the value or -1 if not found
+        """
+        offset = 0
+        for leaf in self._leaves():
+            if val in leaf.vals:
+                return offset + leaf.vals.index(val)
+            offset += len(leaf.vals)
+        return -1
+
+    def value_at(self, idx: int) -> Optional[GT]:
+        """
+        Get the value at the given index.
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The value at the given index or `None` if index not valid
+        """
+        if 0 <= idx < self.size:
+            leaf, i = self._leaf_at(idx)
+            return leaf.vals[i]
+        return None
+
+    def _split(self, node: Union[Leaf[GT], Branch[GT]]) -> Union[
+            Leaf[GT], Branch[GT]]:
+        """
+        Split the second half of an overflowed node into a new node.
+
+        Returns:
+            The new node holding the second half
+        """
+        half = self._n_items(node) // 2
+        if isinstance(node, self.Leaf):
+            new_node = self.Leaf[GT](node.vals[half:])
+            del node.vals[half:]
+        else:
+            new_node = self.Branch[GT](node.children[half:], node.sizes[half:])
+            del node.children[half:]
+            del node.sizes[half:]
+        return new_node
+
+    def _insert(self, node: Union[Leaf[GT], Branch[GT]], idx: int,
+                val: GT) -> Optional[Union[Leaf[GT], Branch[GT]]]:
+        """
+        Insert a value at the given valid index under the given node.
+
+        Returns:
+            The new sibling node if the given node is split, or `None`
+        """
+        if isinstance(node, self.Leaf):
+            node.vals.insert(idx, val)
+        else:
+            # an index at the end of a child is appended to that child
+            i = 0
+            while idx > node.sizes[i]:
+                idx -= node.sizes[i]
+                i += 1
+            new_child = self._insert(node.children[i], idx, val)
+            node.sizes[i] += 1
+            if new_child:
+                new_size = self._size_of(new_child)
+                node.children.insert(i + 1, new_child)
+                node.sizes.insert(i + 1, new_size)
+                node.sizes[i] -= new_size
+        if self._n_items(node) > self.chunk_size:
+            return self._split(node)
+        return None
+
+    def insert_at(self, idx: int, val: GT) -> bool:
+        """
+        Insert a value at the given index.
+
+        Note:
+            The value will not be inserted if the index is not valid.
+
+        Args:
+            idx: the index to insert at
+            val: the value to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        if not 0 <= idx <= self.size:
+            return False
+        new_node = self._insert(self.root, idx, val)
+        self.size += 1
+        if new_node:
+            # grow the tree by one level with a new root
+            new_size = self._size_of(new_node)
+            self.root = self.Branch[GT](
+                [self.root, new_node], [self.size - new_size, new_size])
+        return True
+
+    def _rebalance(self, node: Branch[GT], i: int) -> None:
+        """
+        Merge the child at the given index with a sibling, or move items from
+        the sibling, if the child is less than half full.
+        """
+        child = node.children[i]
+        if self._n_items(child) >= self.chunk_size // 2 or \
+                len(node.children) == 1:
+            return
+        left = i - 1 if i + 1 == len(node.children) else i
+        l_node, r_node = node.children[left], node.children[left + 1]
+        if isinstance(l_node, self.Leaf):
+            l_node.vals.extend(r_node.vals)
+        else:
+            l_node.children.extend(r_node.children)
+            l_node.sizes.extend(r_node.sizes)
+        if self._n_items(l_node) <= self.chunk_size:
+            # merge the right sibling into the left one
+            del node.children[left + 1]
+            node.sizes[left] += node.sizes.pop(left + 1)
+        else:
+            # split the merged items evenly back into the two siblings
+            node.children[left + 1] = self._split(l_node)
+            node.sizes[left + 1] = self._size_of(node.children[left + 1])
+            node.sizes[left] = self._size_of(l_node)
+
+    def _delete(self, node: Union[Leaf[GT], Branch[GT]], idx: int) -> GT:
+        """
+        Delete the element at the given valid index under the given node.
+
+        Returns:
+            The deleted value
+        """
+        if isinstance(node, self.Leaf):
+            return node.vals.pop(idx)
+        i = 0
+        while idx >= node.sizes[i]:
+            idx -= node.sizes[i]
+            i += 1
+        val = self._delete(node.children[i], idx)
+        node.sizes[i] -= 1
+        self._rebalance(node, i)
+        return val
+
+    def _delete_at(self, idx: int) -> GT:
+        """Delete the element at the given valid index and return its value."""
+        val = self._delete(self.root, idx)
+        self.size -= 1
+        # shrink the tree by one level if the root has a single child
+        if isinstance(self.root, self.Branch) and len(self.root.children) == 1:
+            self.root = self.root.children[0]
+        return val
+
+    def delete_at(self, idx: int) -> bool:
+        """
+        Delete an element at the given index.
+
+        Note:
+            The deletion will not perform if the index is not valid.
+
+        Args:
+            idx: the index to perform deletion
+
+        Returns:
+            `True` if deletion is successful or `False` otherwise
+        """
+        if 0 <= idx < self.size:
+            self._delete_at(idx)
+            return True
+        return False
+
+    def update_at(self, idx: int, val: GT) -> bool:
+        """
+        Update an element at the given index by the given value.
+
+        Note:
+            The update will not perform if the index is not valid.
+
+        Args:
+            idx: the index to update
+            val: the new value
+
+        Returns:
+            `True` if update is successful or `False` otherwise
+        """
+        if 0 <= idx < self.size:
+            leaf, i = self._leaf_at(idx)
+            leaf.vals[i] = val
+            return True
+        return False
+
+    def push(self, val: GT) -> None:
+        """
+        Push a value into the sequence's end.
+
+        Args:
+            val: the value to push in
+        """
+        self.insert_at(self.size, val)
+
+    def pop(self) -> Optional[GT]:
+        """
+        Pop a value out of the sequence's end and return the value.
+
+        Returns:
+            The popped value or `None` if empty
+        """
+        if self.size:
+            return self._delete_at(self.size - 1)
+        return None
+
+    def traverse(self) -> Sequence[GT]:
+        """
+        Traverse all elements and return them in a list.
+
+        Returns:
+            A list containing all elements in order
+        """
+        ret = []
+        for leaf in self._leaves():
+            ret.extend(leaf.vals)
+        return ret
+
+    def __iter__(self) -> Iterator[GT]:
+        for leaf in self._leaves():
+            yield from leaf.vals
+
+    def __reversed__(self) -> Iterator[GT]:
+        for leaf in self._leaves(reverse=True):
+            yield from reversed(leaf.vals)
@@ -4,8 +4,9 @@ This module illustrates the foundation knowledge of a dynamic array by
 implementing it. It has no practical usage but only serves as an data structure
 exercise.
 """
-from typing import TypeVar
+from typing import TypeVar, Iterable, Sequence, Optional
 from .fixed_array import FixedArray
+from .growth_policy import GrowthPolicy
 
 
 GT = TypeVar('GT')
@@ -15,22 +16,110 @@ GT = TypeVar('GT')
 class DynamicArray(FixedArray[GT]):
     """
     `DynamicArray[T]()` -> a dynamic array for values of type `T`.
+    `DynamicArray[T](policy)` -> a dynamic array for values of type `T` which
+    resizes by the given growth policy.
 
     This is a custom implementation of a Dynamic Array for learning purpose. The
     implementation uses a list to store data, but only the creation of a list of
     given length and access/assignment of element by index/subscription is
     permitted.
 
+    By default, the internal list starts with a length of 8 and doubles when
+    full. It halves when a deletion leaves at most a quarter of it used, but
+    never shrinks below the length of 8, so that a small array does not resize
+    back and forth.
+
+    Args:
+        policy: the growth policy to decide the resizes, or the default policy
+            if not given
+
     Attributes:
         data (List[Optional[GT]]): the list to store data
         curr_size (int): the current size of the array
+        policy (GrowthPolicy): the growth policy to decide the resizes
+        grow_count (int): the number of resizes which grew the internal list
+        shrink_count (int): the number of resizes which shrank the internal list
+        copy_count (int): the number of elements copied by all the resizes
     """
 
-    _BASE_LENGTH: int = 8
-    """The starting length of the internal list."""
+    def __init__(self, policy: Optional[GrowthPolicy] = None):
+        self.policy = policy or GrowthPolicy()
+        super().__init__(self.policy.min_capacity)
+        self.grow_count = 0
+        self.shrink_count = 0
+        self.copy_count = 0
+
+    def get_capacity(self) -> int:
+        """
+        Get the current capacity, the length of the internal list.
+
+        Returns:
+            The current capacity
+        """
+        return len(self.data)
 
-    def __init__(self):
-        super().__init__(self._BASE_LENGTH)
+    def reserve(self, capacity: int) -> None:
+        """
+        Grow the internal list to at least the given capacity in one resize, so
+        that the array can hold this many elements without resizing again.
+
+        Note:
+            Nothing will happen if the current capacity is already enough. The
+            reserved capacity may be shrunk by later deletions.
+
+        Args:
+            capacity: the capacity to reserve
+        """
+        if capacity > len(self.data):
+            self._reallocate(capacity, self.curr_size, self.curr_size, [])
+
+    def shrink_to_fit(self) -> None:
+        """
+        Shrink the internal list to the current size, but not below the
+        minimum capacity of the growth policy.
+        """
+        capacity = max(self.curr_size, self.policy.min_capacity)
+        if capacity < len(self.data):
+            self._reallocate(capacity, self.curr_size, self.curr_size, [])
+
+    def _count_resize(self, capacity: int, n_copied: int) -> None:
+        """
+        Update the resize counters for a resize to the given capacity.
+
+        Args:
+            capacity: the length of the new internal list
+            n_copied: the number of elements to copy into the new internal list
+        """
+        if capacity > len(self.data):
+            self.grow_count += 1
+        elif capacity < len(self.data):
+            self.shrink_count += 1
+        self.copy_count += n_copied
+
+    def _reallocate(
+            self, capacity: int, lo: int, hi: int, vals: Sequence[GT]
+        ) -> None:
+        """
+        Move the elements into a new internal list of the given length and
+        replace the elements in the index range `[lo, hi)` by the given values
+        during the move, so that each element is copied only once.
+
+        Args:
+            capacity: the length of the new internal list
+            lo: the first index to replace, inclusive
+            hi: the last index to replace, exclusive
+            vals: the values to put in place of the replaced elements
+        """
+        mid = lo + len(vals)
+        end = self.curr_size - (hi - lo) + len(vals)
+        self._count_resize(capacity, self.curr_size - (hi - lo))
+        tmp = self._allocate(capacity)
+        tmp[:lo] = self.data[:lo]
+        tmp[lo:mid] = vals
+        tmp[mid:end] = self.data[hi:self.curr_size]
+        self.data = tmp
+        self.curr_size = end
+        self._version += 1
 
     def insert_at(self, idx: int, val: GT) -> bool:
         """
@@ -47,14 +136,8 @@ class DynamicArray(FixedArray[GT]):
             `True` if insertion is successful or `False` otherwise
         """
         if 0 <= idx <= self.curr_size == len(self.data):
-            tmp = [None] * (2 * len(self.data))
-            for i in range(idx):
-                tmp[i] = self.data[i]
-            tmp[idx] = val
-            for i in range(idx, self.curr_size):
-                tmp[i + 1] = self.data[i]
-            self.data = tmp
-            self.curr_size += 1
+            capacity = self.policy.grow(len(self.data), self.curr_size + 1)
+            self._reallocate(capacity, idx, idx, [val])
             return True
         return super().insert_at(idx, val)
 
@@ -71,13 +154,60 @@ class DynamicArray(FixedArray[GT]):
         Returns:
             `True` if deletion is successful or `False` otherwise
         """
-        if 0 <= idx < self.curr_size <= len(self.data) // 4:
-            tmp = [None] * (len(self.data) // 2)
-            for i in range(idx):
-                tmp[i] = self.data[i]
-            for i in range(idx, self.curr_size - 1):
-                tmp[i] = self.data[i + 1]
-            self.data = tmp
-            self.curr_size -= 1
-            return True
+        if 0 <= idx < self.curr_size:
+            capacity = self.policy.shrink(len(self.data), self.curr_size - 1)
+            if capacity < len(self.data):
+                self._reallocate(capacity, idx, idx + 1, [])
+                return True
         return super().delete_at(idx)
+
+    def insert_many(self, idx: int, vals: Iterable[GT]) -> bool:
+        """
+        Insert all the given values in order starting at the given index.
+
+        The internal list is resized at most once, directly to the capacity
+        that the growth policy would reach for all the values, and the resize
+        moves the existing elements to their final positions.
+
+        Note:
+            No value will be inserted if the index is not valid.
+
+        Args:
+            idx: the index to insert at
+            vals: the values to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        vals = list(vals)
+        needed = self.curr_size + len(vals)
+        if 0 <= idx <= self.curr_size and needed > len(self.data):
+            capacity = self.policy.grow(len(self.data), needed)
+            self._reallocate(capacity, idx, idx, vals)
+            return True
+        return super().insert_many(idx, vals)
+
+    def delete_range(self, lo: int, hi: int) -> bool:
+        """
+        Delete all elements in the index range `[lo, hi)`.
+
+        The internal list is resized at most once, directly to the capacity
+        that the growth policy would shrink to for the remaining elements.
+
+        Note:
+            The deletion will not perform if the range is not valid.
+
+        Args:
+            lo: the first index to delete, inclusive
+            hi: the last index to delete, exclusive
+
+        Returns:
+            `True` if deletion is successful or `False` otherwise
+        """
+        if 0 <= lo <= hi <= self.curr_size:
+            end = self.curr_size - (hi - lo)
+            capacity = self.policy.shrink(len(self.data), end)
+            if capacity < len(self.data):
+                self._reallocate(capacity, lo, hi, [])
+                return True
+        return super().delete_range(lo, hi)
@@ -4,8 +4,10 @@ This module illustrates the foundation knowledge of a fixed length array by
 implementing it. It has no practical usage but only serves as an data structure
 exercise.
 """
-from typing import TypeVar, Optional, Sequence
+from typing import TypeVar, Optional, Sequence, Iterable, MutableSequence, \
+    Iterator, List
 from ..custom_sequence import CustomSequence
+from .array_view import ArrayView
 
 
 GT = TypeVar('GT')
@@ -33,8 +35,23 @@ class FixedArray(CustomSequence[GT]):
 
     def __init__(self, max_size: int):
         super().__init__()
-        self.data = [None] * max_size
+        self.data = self._allocate(max_size)
         self.curr_size = 0
+        # bumped whenever the size or the internal list changes
+        self._version = 0
+
+    def _allocate(self, length: int) -> MutableSequence[Optional[GT]]:
+        # pylint: disable=no-self-use
+        """
+        Create a new internal list of the given length with all slots empty.
+
+        Args:
+            length: the length of the internal list
+
+        Returns:
+            The new internal list
+        """
+        return [None] * length
 
     def get_size(self) -> int:
         """
@@ -94,6 +111,7 @@ class FixedArray(CustomSequence[GT]):
                 self.data[i] = self.data[i - 1]
             self.data[idx] = val
             self.curr_size += 1
+            self._version += 1
             return True
         return False
 
@@ -114,6 +132,7 @@ class FixedArray(CustomSequence[GT]):
             for i in range(idx, self.curr_size - 1):
                 self.data[i] = self.data[i + 1]
             self.curr_size -= 1
+            self._version += 1
             return True
         return False
 
@@ -157,7 +176,7 @@ class FixedArray(CustomSequence[GT]):
         """
         if not self.curr_size:
             return None
-        val = self.data[self.curr_size - 1]
+        val = self.value_at(self.curr_size - 1)
         self.delete_at(self.curr_size - 1)
         return val
 
@@ -170,3 +189,170 @@ class FixedArray(CustomSequence[GT]):
         """
         # return a copy of the array instead the original
         return [self.data[i] for i in range(self.curr_size)]
+
+    def __iter__(self) -> Iterator[GT]:
+        for i in range(self.curr_size):
+            yield self.data[i]
+
+    def __reversed__(self) -> Iterator[GT]:
+        for i in range(self.curr_size - 1, -1, -1):
+            yield self.data[i]
+
+    def value_at_many(self, idxes: Iterable[int]) -> List[Optional[GT]]:
+        """
+        Get the values at the given indexes in a single pass.
+
+        Args:
+            idxes: the indexes to fetch
+
+        Returns:
+            A list of the value at each index or `None` if the index not valid
+        """
+        data, size = self.data, self.curr_size
+        return [data[i] if 0 <= i < size else None for i in idxes]
+
+    def update_many(
+            self, idxes: Iterable[int], vals: Iterable[GT]
+        ) -> List[bool]:
+        """
+        Update the elements at the given indexes by the given values pairwise
+        in a single pass.
+
+        Note:
+            The update will not perform for an index not valid. For a repeated
+            index, the last value is kept.
+
+        Args:
+            idxes: the indexes to update
+            vals: the new values, one for each index
+
+        Returns:
+            A list of `True` for each successful update or `False` otherwise
+        """
+        data, size = self.data, self.curr_size
+        ret = []
+        for i, val in zip(idxes, vals):
+            if 0 <= i < size:
+                data[i] = val
+                ret.append(True)
+            else:
+                ret.append(False)
+        return ret
+
+    def view(
+            self,
+            lo: Optional[int] = None,
+            hi: Optional[int] = None,
+            step: Optional[int] = None
+        ) -> ArrayView[GT]:
+        """
+        Get a read-only view of the elements at the indexes of
+        `range(lo, hi, step)`, without copying any element.
+
+        Note:
+            The view becomes stale once the array is resized, i.e. its size or
+            its internal list changes, and raises a `RuntimeError` on access.
+
+        Args:
+            lo: the first index in the view, inclusive
+            hi: the last index in the view, exclusive
+            step: the step between two indexes in the view
+
+        Returns:
+            The view of the elements
+        """
+        return ArrayView[GT](self, lo, hi, step)
+
+    def extend(self, vals: Iterable[GT]) -> bool:
+        """
+        Push all the given values into the array's end.
+
+        Note:
+            No value will be pushed in if the array has not enough room for all
+            of them.
+
+        Args:
+            vals: the values to push in
+
+        Returns:
+            `True` if the values are pushed in or `False` otherwise
+        """
+        return self.insert_many(self.curr_size, vals)
+
+    def insert_many(self, idx: int, vals: Iterable[GT]) -> bool:
+        """
+        Insert all the given values in order starting at the given index.
+
+        The elements after the index are shifted by a single slice assignment
+        instead of one element at a time.
+
+        Note:
+            No value will be inserted if the index is not valid or the array
+            has not enough room for all of them.
+
+        Args:
+            idx: the index to insert at
+            vals: the values to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        vals = list(vals)
+        n_vals = len(vals)
+        if 0 <= idx <= self.curr_size and \
+                self.curr_size + n_vals <= len(self.data):
+            end = self.curr_size + n_vals
+            self.data[idx + n_vals:end] = self.data[idx:self.curr_size]
+            self.data[idx:idx + n_vals] = vals
+            self.curr_size = end
+            self._version += 1
+            return True
+        return False
+
+    def delete_range(self, lo: int, hi: int) -> bool:
+        """
+        Delete all elements in the index range `[lo, hi)`.
+
+        The elements after the range are shifted by a single slice assignment
+        instead of one element at a time.
+
+        Note:
+            The deletion will not perform if the range is not valid.
+
+        Args:
+            lo: the first index to delete, inclusive
+            hi: the last index to delete, exclusive
+
+        Returns:
+            `True` if deletion is successful or `False` otherwise
+        """
+        if 0 <= lo <= hi <= self.curr_size:
+            end = self.curr_size - (hi - lo)
+            self.data[lo:end] = self.data[hi:self.curr_size]
+            # release the references held by the freed slots
+            self.data[end:self.curr_size] = self._allocate(hi - lo)
+            self.curr_size = end
+            self._version += 1
+            return True
+        return False
+
+    def update_range(self, lo: int, vals: Iterable[GT]) -> bool:
+        """
+        Update the elements starting at the given index by the given values.
+
+        Note:
+            The update will not perform if any of the indexes to update is not
+            valid.
+
+        Args:
+            lo: the first index to update
+            vals: the new values
+
+        Returns:
+            `True` if update is successful or `False` otherwise
+        """
+        vals = list(vals)
+        if 0 <= lo and lo + len(vals) <= self.curr_size:
+            self.data[lo:lo + len(vals)] = vals
+            return True
+        return False
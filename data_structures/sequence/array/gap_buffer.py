@@ -0,0 +1,250 @@
+"""Custom implementation of a gap buffer.
+
+This module illustrates the foundation knowledge of a gap buffer by implementing
+it. A gap buffer is an array with a movable gap of empty slots, which makes the
+insertions and deletions around a moving cursor cheap, as in a text editor. It
+has no practical usage but only serves as an data structure exercise.
+"""
+from typing import TypeVar, Optional, Sequence, Iterator
+from ..custom_sequence import CustomSequence
+from .growth_policy import GrowthPolicy
+
+
+GT = TypeVar('GT')
+"""type: The generic type to represent the type of the buffer element."""
+
+
+class GapBuffer(CustomSequence[GT]):
+    """
+    `GapBuffer[T]()` -> a gap buffer for values of type `T`.
+    `GapBuffer[T](policy)` -> a gap buffer for values of type `T` which resizes
+    by the given growth policy.
+
+    This is a custom implementation of a Gap Buffer for learning purpose. The
+    implementation uses a list to store data, of which the slots in the index
+    range `[gap_start, gap_end)` are empty and form the gap. The elements before
+    the gap keep their indexes and the elements after the gap are shifted by
+    the length of the gap.
+
+    An insertion or a deletion first moves the gap to the given index, which
+    only copies the elements between the old and the new gap positions, and
+    then fills or extends the gap in O(1). Therefore, the edits clustered around
+    a cursor are O(1) amortised, while an edit far from the previous one costs
+    the distance between them.
+
+    Args:
+        policy: the growth policy to decide the resizes, or the default policy
+            if not given
+
+    Attributes:
+        data (List[Optional[GT]]): the list to store data
+        gap_start (int): the index of the first slot of the gap
+        gap_end (int): the index after the last slot of the gap
+        policy (GrowthPolicy): the growth policy to decide the resizes
+    """
+
+    def __init__(self, policy: Optional[GrowthPolicy] = None):
+        super().__init__()
+        self.policy = policy or GrowthPolicy()
+        self.data = [None] * self.policy.min_capacity
+        self.gap_start = 0
+        self.gap_end = self.policy.min_capacity
+
+    def get_size(self) -> int:
+        """
+        Get the current size of the buffer.
+
+        Returns:
+            The current size of the buffer
+        """
+        return len(self.data) - (self.gap_end - self.gap_start)
+
+    def _move_gap(self, idx: int) -> None:
+        """
+        Move the gap to start at the given index.
+
+        Args:
+            idx: the index for the gap to start at, which must be valid
+        """
+        if idx < self.gap_start:
+            # move the elements in [idx, gap_start) to the end of the gap
+            n_moved = self.gap_start - idx
+            self.data[self.gap_end - n_moved:self.gap_end] = \
+                self.data[idx:self.gap_start]
+            self.data[idx:min(self.gap_start, self.gap_end - n_moved)] = \
+                [None] * min(n_moved, self.gap_end - self.gap_start)
+            self.gap_start, self.gap_end = idx, self.gap_end - n_moved
+        elif idx > self.gap_start:
+            # move the elements after the gap to the start of the gap
+            n_moved = idx - self.gap_start
+            end = self.gap_end + n_moved
+            self.data[self.gap_start:idx] = self.data[self.gap_end:end]
+            self.data[max(idx, self.gap_end):end] = \
+                [None] * min(n_moved, self.gap_end - self.gap_start)
+            self.gap_start, self.gap_end = idx, end
+
+    def _reallocate(self, capacity: int, idx: int) -> None:
+        """
+        Move the elements into a new internal list of the given length with the
+        gap starting at the given index.
+
+        Args:
+            capacity: the length of the new internal list
+            idx: the index for the gap to start at, which must be valid
+        """
+        self._move_gap(idx)
+        n_after = len(self.data) - self.gap_end
+        tmp = [None] * capacity
+        tmp[:self.gap_start] = self.data[:self.gap_start]
+        tmp[capacity - n_after:] = self.data[self.gap_end:]
+        self.data = tmp
+        self.gap_end = capacity - n_after
+
+    def index_of(self, val: GT) -> int:
+        """
+        Get the index of a value, or -1 if not found.
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the value or -1 if not found
+        """
+        for i in range(self.gap_start):
+            if self.data[i] == val:
+                return i
+        for i in range(self.gap_end, len(self.data)):
+            if self.data[i] == val:
+                return i - (self.gap_end - self.gap_start)
+        return -1
+
+    def value_at(self, idx: int) -> Optional[GT]:
+        """
+        Get the value at the given index.
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The value at the given index or `None` if index not valid
+        """
+        if 0 <= idx < self.gap_start:
+            return self.data[idx]
+        if self.gap_start <= idx < self.get_size():
+            return self.data[idx + self.gap_end - self.gap_start]
+        return None
+
+    def insert_at(self, idx: int, val: GT) -> bool:
+        """
+        Insert a value at the given index.
+
+        Note:
+            The value will not be inserted if the index is not valid.
+
+        Args:
+            idx: the index to insert at
+            val: the value to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        size = self.get_size()
+        if not 0 <= idx <= size:
+            return False
+        if self.gap_start == self.gap_end:
+            self._reallocate(self.policy.grow(len(self.data), size + 1), idx)
+        else:
+            self._move_gap(idx)
+        self.data[self.gap_start] = val
+        self.gap_start += 1
+        return True
+
+    def delete_at(self, idx: int) -> bool:
+        """
+        Delete an element at the given index.
+
+        Note:
+            The deletion will not perform if the index is not valid.
+
+        Args:
+            idx: the index to perform deletion
+
+        Returns:
+            `True` if deletion is successful or `False` otherwise
+        """
+        size = self.get_size()
+        if not 0 <= idx < size:
+            return False
+        self._move_gap(idx)
+        self.data[self.gap_end] = None
+        self.gap_end += 1
+        capacity = self.policy.shrink(len(self.data), size - 1)
+        if capacity < len(self.data):
+            self._reallocate(capacity, idx)
+        return True
+
+    def update_at(self, idx: int, val: GT) -> bool:
+        """
+        Update an element at the given index by the given value.
+
+        Note:
+            The update will not perform if the index is not valid.
+
+        Args:
+            idx: the index to update
+            val: the new value
+
+        Returns:
+            `True` if update is successful or `False` otherwise
+        """
+        if 0 <= idx < self.gap_start:
+            self.data[idx] = val
+            return True
+        if self.gap_start <= idx < self.get_size():
+            self.data[idx + self.gap_end - self.gap_start] = val
+            return True
+        return False
+
+    def push(self, val: GT) -> None:
+        """
+        Push a value into the buffer's end.
+
+        Args:
+            val: the value to push in
+        """
+        self.insert_at(self.get_size(), val)
+
+    def pop(self) -> Optional[GT]:
+        """
+        Pop a value out of the buffer's end and return the value.
+
+        Returns:
+            The popped value or `None` if empty buffer
+        """
+        size = self.get_size()
+        if not size:
+            return None
+        val = self.value_at(size - 1)
+        self.delete_at(size - 1)
+        return val
+
+    def traverse(self) -> Sequence[GT]:
+        """
+        Traverse all elements in the buffer and return them in a list.
+
+        Returns:
+            A list containing all elements of the buffer in order
+        """
+        return self.data[:self.gap_start] + self.data[self.gap_end:]
+
+    def __iter__(self) -> Iterator[GT]:
+        for i in range(self.gap_start):
+            yield self.data[i]
+        for i in range(self.gap_end, len(self.data)):
+            yield self.data[i]
+
+    def __reversed__(self) -> Iterator[GT]:
+        for i in range(len(self.data) - 1, self.gap_end - 1, -1):
+            yield self.data[i]
+        for i in range(self.gap_start - 1, -1, -1):
+            yield self.data[i]
@@ -0,0 +1,83 @@
+"""The growth policy to decide the resizes of a dynamic array.
+
+This module defines how a dynamic array chooses the new length of its internal
+list when it is full or when it becomes too sparse. The policy is separated from
+the array so that the same array implementation can be tuned for different
+workloads.
+"""
+
+
+class GrowthPolicy():
+    """
+    `GrowthPolicy(factor, min_capacity, shrink_load)` -> a policy to grow the
+    capacity by `factor` and to shrink it when the load drops to `shrink_load`.
+
+    The capacity of an array is the length of its internal list and the load is
+    the ratio of the size to the capacity. The array grows when it is full and
+    shrinks when the load drops to or below `shrink_load`, but never below
+    `min_capacity`.
+
+    The gap between a full array and the shrink load is the hysteresis which
+    prevents an array from thrashing between growing and shrinking under
+    alternating pushes and pops. The product of `shrink_load` and `factor` must
+    be less than one, so that a shrunk array is never full again.
+
+    Args:
+        factor: the factor to multiply the capacity by in each growth step
+        min_capacity: the minimum capacity of the array
+        shrink_load: the load at or below which the array shrinks
+
+    Raises:
+        ValueError: if the arguments are not consistent
+    """
+
+    def __init__(
+            self,
+            factor: float = 2.0,
+            min_capacity: int = 8,
+            shrink_load: float = 0.25
+        ):
+        if factor <= 1:
+            raise ValueError('The growth factor must be greater than 1.')
+        if min_capacity < 1:
+            raise ValueError('The minimum capacity must be positive.')
+        if not 0 <= shrink_load * factor < 1:
+            raise ValueError(
+                'The shrink load must be in [0, 1 / factor) to keep a '
+                'hysteresis between growing and shrinking.')
+        self.factor = factor
+        self.min_capacity = min_capacity
+        self.shrink_load = shrink_load
+
+    def grow(self, capacity: int, needed: int) -> int:
+        """
+        Get the capacity to grow to in order to hold the needed number of
+        elements.
+
+        Args:
+            capacity: the current capacity
+            needed: the number of elements to hold
+
+        Returns:
+            The new capacity, which is the current capacity if already enough
+        """
+        capacity = max(capacity, self.min_capacity)
+        while capacity < needed:
+            capacity = max(int(capacity * self.factor), capacity + 1)
+        return capacity
+
+    def shrink(self, capacity: int, size: int) -> int:
+        """
+        Get the capacity to shrink to for the given number of elements.
+
+        Args:
+            capacity: the current capacity
+            size: the number of elements to hold
+
+        Returns:
+            The new capacity, which is the current capacity if no need to shrink
+        """
+        while capacity > self.min_capacity and \
+                size <= capacity * self.shrink_load:
+            capacity = max(int(capacity / self.factor), self.min_capacity)
+        return capacity
@@ -0,0 +1,200 @@
+"""Custom implementation of a dynamic array with incremental resizing.
+
+This module implements a dynamic array which never copies all its elements in a
+single push or pop. It is only for learning purpose and serves as an exercise of
+turning an amortised time bound into a worst case time bound.
+"""
+from typing import TypeVar, Optional, Sequence, Iterable, Iterator, List
+from .dynamic_array import DynamicArray
+from .growth_policy import GrowthPolicy
+
+
+GT = TypeVar('GT')
+"""The generic type to represent the type of the array element."""
+
+
+class IncrementalDynamicArray(DynamicArray[GT]):
+    """
+    `IncrementalDynamicArray[T]()` -> a dynamic array for values of type `T`
+    which resizes incrementally.
+    `IncrementalDynamicArray[T](policy)` -> the same but resizes by the given
+    growth policy.
+
+    This is a custom implementation of a de-amortised Dynamic Array for learning
+    purpose. When a push or a pop triggers a resize, the new internal list is
+    allocated but the elements are not copied at once. Instead, the old and the
+    new internal lists coexist, and each later push or pop migrates a bounded
+    number of elements from the old list to the new one. The number is chosen
+    so that the migration completes before the next resize is due, therefore
+    no push or pop copies O(n) elements. Only the allocation of the new list,
+    which fills the empty slots in C, remains proportional to the capacity.
+
+    During a migration, the elements in the index range `[moved, pending)` are
+    still in the old list while all the others are in the new list. Operations
+    which are O(n) anyway, like a middle insertion or `index_of`, complete the
+    migration before they start.
+
+    Args:
+        policy: the growth policy to decide the resizes, or the default policy
+            if not given
+
+    Attributes:
+        data (List[Optional[GT]]): the list to store data
+        curr_size (int): the current size of the array
+        policy (GrowthPolicy): the growth policy to decide the resizes
+        grow_count (int): the number of resizes which grew the internal list
+        shrink_count (int): the number of resizes which shrank the internal list
+        copy_count (int): the number of elements copied by all the resizes
+    """
+
+    def __init__(self, policy: Optional[GrowthPolicy] = None):
+        super().__init__(policy)
+        self._old = None
+        self._moved = 0
+        self._pending = 0
+        self._step = 0
+
+    def _in_old(self, idx: int) -> bool:
+        """Check if the element at the given index is still in the old list."""
+        return self._old is not None and self._moved <= idx < self._pending
+
+    def _migrate(self) -> None:
+        """Migrate the next batch of elements from the old list."""
+        if self._old is not None:
+            end = min(self._moved + self._step, self._pending)
+            self.data[self._moved:end] = self._old[self._moved:end]
+            self._moved = end
+            if self._moved >= self._pending:
+                self._old = None
+
+    def _finish_migration(self) -> None:
+        """Migrate all the remaining elements from the old list at once."""
+        if self._old is not None:
+            self.data[self._moved:self._pending] = \
+                self._old[self._moved:self._pending]
+            self._old = None
+
+    def _reallocate(
+            self, capacity: int, lo: int, hi: int, vals: Sequence[GT]
+        ) -> None:
+        # only a resize at the end of the array can be done incrementally
+        self._finish_migration()
+        if hi != self.curr_size:
+            super()._reallocate(capacity, lo, hi, vals)
+            return
+        self._count_resize(capacity, lo)
+        new_size = lo + len(vals)
+        tmp = self._allocate(capacity)
+        tmp[lo:new_size] = vals
+        self._old, self.data = self.data, tmp
+        self._moved, self._pending = 0, lo
+        self.curr_size = new_size
+        self._version += 1
+        # the number of pushes or pops which can be done before the next
+        # resize is due, including the current one
+        slack = min(
+            capacity - new_size + 1,
+            new_size - int(capacity * self.policy.shrink_load),
+        )
+        self._step = -(-lo // max(slack, 1))
+
+    def reserve(self, capacity: int) -> None:
+        # an explicit resize is expected to copy all the elements at once
+        super().reserve(capacity)
+        self._finish_migration()
+
+    def shrink_to_fit(self) -> None:
+        super().shrink_to_fit()
+        self._finish_migration()
+
+    def index_of(self, val: GT) -> int:
+        self._finish_migration()
+        return super().index_of(val)
+
+    def value_at(self, idx: int) -> Optional[GT]:
+        if self._in_old(idx):
+            return self._old[idx]
+        return super().value_at(idx)
+
+    def insert_at(self, idx: int, val: GT) -> bool:
+        """
+        Insert a value at the given index.
+
+        Note:
+            The value will not be inserted if the index is not valid. Only the
+            insertion at the end, i.e. a push, keeps the incremental resizing,
+            the others complete the ongoing migration first.
+
+        Args:
+            idx: the index to insert at
+            val: the value to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        if idx != self.curr_size:
+            self._finish_migration()
+        ret = super().insert_at(idx, val)
+        self._migrate()
+        return ret
+
+    def delete_at(self, idx: int) -> bool:
+        """
+        Delete an element at the given index.
+
+        Note:
+            The deletion will not perform if the index is not valid. Only the
+            deletion at the end, i.e. a pop, keeps the incremental resizing,
+            the others complete the ongoing migration first.
+
+        Args:
+            idx: the index to perform deletion
+
+        Returns:
+            `True` if deletion is successful or `False` otherwise
+        """
+        if idx != self.curr_size - 1:
+            self._finish_migration()
+        ret = super().delete_at(idx)
+        # the deleted element no longer needs a migration
+        self._pending = min(self._pending, self.curr_size)
+        self._migrate()
+        return ret
+
+    def update_at(self, idx: int, val: GT) -> bool:
+        if self._in_old(idx):
+            self._old[idx] = val
+            return True
+        return super().update_at(idx, val)
+
+    def value_at_many(self, idxes: Iterable[int]) -> List[Optional[GT]]:
+        return [self.value_at(i) for i in idxes]
+
+    def update_many(
+            self, idxes: Iterable[int], vals: Iterable[GT]
+        ) -> List[bool]:
+        return [self.update_at(i, val) for i, val in zip(idxes, vals)]
+
+    def traverse(self) -> Sequence[GT]:
+        self._finish_migration()
+        return super().traverse()
+
+    def __iter__(self) -> Iterator[GT]:
+        self._finish_migration()
+        yield from super().__iter__()
+
+    def __reversed__(self) -> Iterator[GT]:
+        self._finish_migration()
+        yield from super().__reversed__()
+
+    def insert_many(self, idx: int, vals: Iterable[GT]) -> bool:
+        self._finish_migration()
+        return super().insert_many(idx, vals)
+
+    def delete_range(self, lo: int, hi: int) -> bool:
+        self._finish_migration()
+        return super().delete_range(lo, hi)
+
+    def update_range(self, lo: int, vals: Iterable[GT]) -> bool:
+        self._finish_migration()
+        return super().update_range(lo, vals)
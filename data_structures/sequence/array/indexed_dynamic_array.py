@@ -0,0 +1,145 @@
+"""Custom implementation of a dynamic array with a hash index of its values.
+
+This module implements a dynamic array which keeps a side index from each value
+to its positions, so that looking up a value does not scan the array. It is only
+for learning purpose and serves as an exercise of trading the write cost for the
+read cost.
+"""
+from typing import TypeVar, Optional, Iterable, Dict, List
+from bisect import bisect_left, insort
+from .dynamic_array import DynamicArray
+from .growth_policy import GrowthPolicy
+
+
+GT = TypeVar('GT')
+"""The generic type to represent the type of the array element."""
+
+
+class IndexedDynamicArray(DynamicArray[GT]):
+    """
+    `IndexedDynamicArray[T]()` -> a dynamic array for hashable values of type
+    `T` with a hash index of its values.
+    `IndexedDynamicArray[T](policy)` -> the same but resizes by the given growth
+    policy.
+
+    This is a custom implementation of an indexed Dynamic Array for learning
+    purpose. Besides the elements, it keeps a dict from each stored value to the
+    sorted list of its positions, so `index_of` and `in` are O(1) on average.
+
+    The index is maintained by every write. An update or a push costs an extra
+    O(log k) for a value stored k times. An insertion or a deletion in the
+    middle also shifts the positions of all the following elements, which is
+    O(n) like the shift of the elements themselves but with a larger constant.
+
+    Note:
+        All the stored values must be hashable. A write of an unhashable value
+        raises `TypeError` before changing the array or its index.
+
+    Args:
+        policy: the growth policy to decide the resizes, or the default policy
+            if not given
+
+    Attributes:
+        data (List[Optional[GT]]): the list to store data
+        curr_size (int): the current size of the array
+        positions (Dict[GT, List[int]]): the sorted positions of each value
+    """
+
+    def __init__(self, policy: Optional[GrowthPolicy] = None):
+        super().__init__(policy)
+        self.positions: Dict[GT, List[int]] = {}
+
+    @staticmethod
+    def _check_hashable(vals: Iterable[GT]) -> None:
+        """
+        Check the values can be recorded in the index, before any change.
+
+        Raises:
+            TypeError: if a value is not hashable
+        """
+        for val in vals:
+            hash(val)
+
+    def _add(self, val: GT, idx: int) -> None:
+        """Record the value at the given position in the index."""
+        insort(self.positions.setdefault(val, []), idx)
+
+    def _remove(self, val: GT, idx: int) -> None:
+        """Remove the value at the given position from the index."""
+        idxes = self.positions[val]
+        del idxes[bisect_left(idxes, idx)]
+        if not idxes:
+            del self.positions[val]
+
+    def _shift(self, lo: int, delta: int) -> None:
+        """Shift the recorded positions of the elements from the given index to
+        the end by `delta`."""
+        for val in set(self.data[lo:self.curr_size]):
+            idxes = self.positions[val]
+            for i in range(bisect_left(idxes, lo), len(idxes)):
+                idxes[i] += delta
+
+    def index_of(self, val: GT) -> int:
+        """
+        Get the index of a value, or -1 if not found, in O(1) on average.
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the value or -1 if not found
+        """
+        idxes = self.positions.get(val)
+        return idxes[0] if idxes else -1
+
+    def insert_at(self, idx: int, val: GT) -> bool:
+        if 0 <= idx <= self.curr_size:
+            self._check_hashable((val,))
+            self._shift(idx, 1)
+            self._add(val, idx)
+        return super().insert_at(idx, val)
+
+    def delete_at(self, idx: int) -> bool:
+        if 0 <= idx < self.curr_size:
+            self._remove(self.data[idx], idx)
+            self._shift(idx + 1, -1)
+        return super().delete_at(idx)
+
+    def update_at(self, idx: int, val: GT) -> bool:
+        if 0 <= idx < self.curr_size:
+            self._check_hashable((val,))
+            self._remove(self.data[idx], idx)
+            self._add(val, idx)
+        return super().update_at(idx, val)
+
+    def update_many(
+            self, idxes: Iterable[int], vals: Iterable[GT]
+        ) -> List[bool]:
+        pairs = list(zip(idxes, vals))
+        self._check_hashable(val for _, val in pairs)
+        return [self.update_at(i, val) for i, val in pairs]
+
+    def insert_many(self, idx: int, vals: Iterable[GT]) -> bool:
+        vals = list(vals)
+        if 0 <= idx <= self.curr_size:
+            self._check_hashable(vals)
+            self._shift(idx, len(vals))
+            for i, val in enumerate(vals):
+                self._add(val, idx + i)
+        return super().insert_many(idx, vals)
+
+    def delete_range(self, lo: int, hi: int) -> bool:
+        if 0 <= lo <= hi <= self.curr_size:
+            for i in range(lo, hi):
+                self._remove(self.data[i], i)
+            self._shift(hi, lo - hi)
+        return super().delete_range(lo, hi)
+
+    def update_range(self, lo: int, vals: Iterable[GT]) -> bool:
+        vals = list(vals)
+        if 0 <= lo and lo + len(vals) <= self.curr_size:
+            self._check_hashable(vals)
+            for i, val in enumerate(vals):
+                self._remove(self.data[lo + i], lo + i)
+                self._add(val, lo + i)
+        return super().update_range(lo, vals)
@@ -0,0 +1,298 @@
+"""Custom implementation of a fixed length array backed by a memory-mapped file.
+
+This module implements a fixed length array of fixed-width records, which lives
+in a file mapped into the memory instead of a list. It is only for learning
+purpose and serves as an exercise of the `mmap` and `struct` modules.
+"""
+from typing import TypeVar, Optional, Sequence, Iterator
+import hashlib
+import mmap
+import os
+import struct
+from ..custom_sequence import CustomSequence
+
+
+GT = TypeVar('GT')
+"""type: The generic type to represent the type of the array element."""
+
+
+class MmapFixedArray(CustomSequence[GT]):
+    """
+    `MmapFixedArray[T](path, fmt, n)` -> a fixed length array of size `n` for
+    records of the struct format `fmt`, stored in the file at `path`.
+
+    This is a custom implementation of a Fixed Length Array over a memory-mapped
+    file for learning purpose. The file starts with a header, which records the
+    current size, the maximum size, the record width and a digest of the struct
+    format, followed by the slots of `max_size` records packed by the format.
+    The values are read and written in place in the mapped memory, so opening
+    an existing file costs nothing and the processes mapping the same file
+    share the OS page cache.
+
+    A record of a single field is exposed as a scalar value, and a record of
+    several fields as a tuple.
+
+    Note:
+        The changes reach the file when the OS writes the dirty pages back, or
+        when `flush()` or `close()` is called. The array can also be used as a
+        context manager which closes it on exit.
+
+    Args:
+        path: the path of the file, created if it does not exist or is empty
+        fmt: the struct format of a record, e.g. `'<q'` or `'<dii'`
+        max_size: the maximum size of a new array, ignored if the file already
+            holds an array
+
+    Raises:
+        ValueError: if the file is not an array of records of the given format,
+            or is too short to hold its header and all its slots
+
+    Attributes:
+        path (str): the path of the file
+        record (struct.Struct): the struct of a record
+        curr_size (int): the current size of the array
+        max_size (int): the maximum size of the array
+    """
+
+    _HEADER = struct.Struct('<4sQQQ8s')
+    """The struct of the file header: magic, size, maximum size, record width
+    and format digest"""
+
+    _MAGIC = b'MFA2'
+    """The magic bytes identifying the files of this class."""
+
+    _SCAN_BLOCK = 4096
+    """The number of records to unpack at once in a scan."""
+
+    def __init__(self, path: str, fmt: str, max_size: int = 0):
+        super().__init__()
+        self.path = path
+        self.record = struct.Struct(fmt)
+        self._single = len(self.record.unpack(bytes(self.record.size))) == 1
+        digest = hashlib.sha1(fmt.encode()).digest()[:8]
+        self._file = open(path, 'r+b' if os.path.exists(path) else 'w+b')
+        file_size = os.fstat(self._file.fileno()).st_size
+        if file_size == 0:
+            self._file.truncate(
+                self._HEADER.size + max_size * self.record.size)
+            self._file.flush()
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+            self._HEADER.pack_into(self._mm, 0, self._MAGIC, 0, max_size,
+                                   self.record.size, digest)
+        elif file_size < self._HEADER.size:
+            self._file.close()
+            raise ValueError(f'{path} is too short for an array header.')
+        else:
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+        magic, self.curr_size, self.max_size, width, file_digest = \
+            self._HEADER.unpack_from(self._mm, 0)
+        if magic != self._MAGIC or width != self.record.size or \
+                file_digest != digest:
+            self.close()
+            raise ValueError(f'{path} is not an array of {fmt!r} records.')
+        if len(self._mm) < self._offset(self.max_size) or \
+                self.curr_size > self.max_size:
+            self.close()
+            raise ValueError(f'{path} is truncated below its maximum size.')
+
+    def __enter__(self) -> 'MmapFixedArray[GT]':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        """
+        Write the changes in the mapped memory back to the file.
+        """
+        self._mm.flush()
+
+    def close(self) -> None:
+        """
+        Flush the changes and release the mapped memory and the file.
+
+        Note:
+            The array cannot be used any more once closed.
+        """
+        if not self._mm.closed:
+            self._mm.flush()
+            self._mm.close()
+        self._file.close()
+
+    def _offset(self, idx: int) -> int:
+        """Get the byte offset of the slot at the given index."""
+        return self._HEADER.size + idx * self.record.size
+
+    def _read(self, idx: int) -> GT:
+        """Read the record at the given valid index."""
+        val = self.record.unpack_from(self._mm, self._offset(idx))
+        return val[0] if self._single else val
+
+    def _pack(self, val: GT) -> bytes:
+        """Pack a value into the bytes of a record, before touching the file,
+        so that a value which cannot be packed leaves the array unchanged."""
+        if self._single:
+            return self.record.pack(val)
+        return self.record.pack(*val)
+
+    def _write(self, idx: int, data: bytes) -> None:
+        """Write the packed record at the given valid index."""
+        offset = self._offset(idx)
+        self._mm[offset:offset + self.record.size] = data
+
+    def _set_size(self, size: int) -> None:
+        """Set the current size and record it in the header."""
+        self.curr_size = size
+        struct.pack_into('<Q', self._mm, 4, size)
+
+    def get_size(self) -> int:
+        """
+        Get the current size of the array.
+
+        Returns:
+            The current size of the array
+        """
+        return self.curr_size
+
+    def index_of(self, val: GT) -> int:
+        """
+        Get the index of a value, or -1 if not found.
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the value or -1 if not found
+        """
+        for i, record in enumerate(self):
+            if record == val:
+                return i
+        return -1
+
+    def value_at(self, idx: int) -> Optional[GT]:
+        """
+        Get the value at the given index.
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The value at the given index or `None` if index not valid
+        """
+        if 0 <= idx < self.curr_size:
+            return self._read(idx)
+        return None
+
+    def insert_at(self, idx: int, val: GT) -> bool:
+        """
+        Insert a value at the given index.
+
+        Note:
+            The value will not be inserted if the index is not valid or the
+            array is already full.
+
+        Args:
+            idx: the index to insert at
+            val: the value to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        if 0 <= idx <= self.curr_size < self.max_size:
+            data = self._pack(val)
+            # shift the records after the index by a single memory move
+            self._mm.move(self._offset(idx + 1), self._offset(idx),
+                          (self.curr_size - idx) * self.record.size)
+            self._write(idx, data)
+            self._set_size(self.curr_size + 1)
+            return True
+        return False
+
+    def delete_at(self, idx: int) -> bool:
+        """
+        Delete an element at the given index.
+
+        Note:
+            The deletion will not perform if the index is not valid.
+
+        Args:
+            idx: the index to perform deletion
+
+        Returns:
+            `True` if deletion is successful or `False` otherwise
+        """
+        if 0 <= idx < self.curr_size:
+            self._mm.move(self._offset(idx), self._offset(idx + 1),
+                          (self.curr_size - idx - 1) * self.record.size)
+            self._set_size(self.curr_size - 1)
+            return True
+        return False
+
+    def update_at(self, idx: int, val: GT) -> bool:
+        """
+        Update an element at the given index by the given value.
+
+        Note:
+            The update will not perform if the index is not valid.
+
+        Args:
+            idx: the index to update
+            val: the new value
+
+        Returns:
+            `True` if update is successful or `False` otherwise
+        """
+        if 0 <= idx < self.curr_size:
+            self._write(idx, self._pack(val))
+            return True
+        return False
+
+    def push(self, val: GT) -> None:
+        """
+        Push a value into the array's end.
+
+        Note:
+            Nothing will happen if the array is already full.
+
+        Args:
+            val: the value to push in
+        """
+        self.insert_at(self.curr_size, val)
+
+    def pop(self) -> Optional[GT]:
+        """
+        Pop a value out of the array's end and return the value.
+
+        Returns:
+            The popped value or `None` if empty array
+        """
+        if not self.curr_size:
+            return None
+        val = self._read(self.curr_size - 1)
+        self._set_size(self.curr_size - 1)
+        return val
+
+    def traverse(self) -> Sequence[GT]:
+        """
+        Traverse all elements in the array and return them in a list.
+
+        Returns:
+            A list containing all elements of the array in order
+        """
+        records = self.record.iter_unpack(
+            self._mm[self._offset(0):self._offset(self.curr_size)])
+        if self._single:
+            return [record[0] for record in records]
+        return list(records)
+
+    def __iter__(self) -> Iterator[GT]:
+        # unpack the records block by block to avoid copying the whole file
+        for start in range(0, self.curr_size, self._SCAN_BLOCK):
+            end = min(start + self._SCAN_BLOCK, self.curr_size)
+            records = self.record.iter_unpack(
+                self._mm[self._offset(start):self._offset(end)])
+            if self._single:
+                for record in records:
+                    yield record[0]
+            else:
+                yield from records
@@ -0,0 +1,287 @@
+"""Custom implementation of a persistent array.
+
+This module implements an array whose snapshots are taken in O(1), by storing
+its elements in a radix trie of small chunks and copying only the path to an
+element when writing a chunk shared with a snapshot. It has no practical usage
+but only serves as an data structure exercise.
+"""
+from typing import TypeVar, Generic, Optional, Sequence, Iterator, List
+from ..custom_sequence import CustomSequence
+
+
+GT = TypeVar('GT')
+"""type: The generic type to represent the element type of the array."""
+
+
+class PersistentArray(CustomSequence[GT]):
+    """
+    `PersistentArray[T]()` -> an empty persistent array of type `T`.
+
+    This is a custom implementation of a Persistent Array for learning purpose.
+    The elements are stored in the leaves of a radix trie, each a list of at
+    most 32 values, and the branches hold at most 32 children. The element at
+    an index is located by taking the index 5 bits at a time from the top, so
+    an access costs O(log32 n), which is at most 6 steps for a billion
+    elements.
+
+    A snapshot shares the whole trie with the array, so that it is taken in
+    O(1). Each node records the owner which created it, and an array only
+    writes in place the nodes it owns. A write on a node shared with a
+    snapshot copies the nodes on the path from the root instead, O(log n) of
+    them, leaving the snapshot unchanged. Both the array and its snapshot are
+    persistent arrays which can be written afterwards independently.
+
+    An insertion or a deletion in the middle moves all the elements after it,
+    as in a dynamic array, so it costs O(n log n) in the worst case.
+
+    Attributes:
+        root (Node[T]): the root node of the trie
+        shift (int): the number of bits of the index below the root
+        size (int): the size of the array
+        copy_count (int): the number of nodes copied by the writes
+    """
+
+    class Node(Generic[GT]):
+        # pylint: disable=too-few-public-methods
+        """
+        The node of the trie, which stores the values in a leaf or the child
+        nodes in a branch.
+        """
+        __slots__ = ('owner', 'items')
+
+        def __init__(self, owner: object, items: List):
+            self.owner = owner
+            self.items = items
+
+    _BITS: int = 5
+    """The number of bits of the index taken at each level of the trie."""
+
+    _MASK: int = (1 << _BITS) - 1
+    """The mask of the bits of the index taken at each level of the trie."""
+
+    def __init__(self):
+        super().__init__()
+        # the token marking the nodes this array can write in place
+        self._owner = object()
+        self.root = self.Node(self._owner, [])
+        self.shift = 0
+        self.size = 0
+        self.copy_count = 0
+
+    def _writable(self, node: Node[GT]) -> Node[GT]:
+        """
+        Get the node itself if this array owns it, or a copy of it otherwise.
+
+        Args:
+            node: the node to write
+
+        Returns:
+            The node which can be written in place
+        """
+        if node.owner is self._owner:
+            return node
+        self.copy_count += 1
+        return self.Node(self._owner, list(node.items))
+
+    def snapshot(self) -> 'PersistentArray[GT]':
+        """
+        Take a snapshot of the array in O(1).
+
+        The snapshot and the array share all the nodes, and later writes on
+        either one copy the shared nodes they touch, so they never see each
+        other's writes.
+
+        Returns:
+            The snapshot of the current elements
+        """
+        snap = PersistentArray[GT]()
+        snap.root = self.root
+        snap.shift = self.shift
+        snap.size = self.size
+        # none of the existing nodes can be written in place anymore
+        self._owner = object()
+        return snap
+
+    def get_size(self) -> int:
+        """
+        Get the current size of the array.
+
+        Returns:
+            The current size of the array
+        """
+        return self.size
+
+    def index_of(self, val: GT) -> int:
+        """
+        Get the index of a value, or -1 if not found.
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the value or -1 if not found
+        """
+        for i, tmp in enumerate(self):
+            if tmp == val:
+                return i
+        return -1
+
+    def value_at(self, idx: int) -> Optional[GT]:
+        """
+        Get the value at the given index.
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The value at the given index or `None` if index not valid
+        """
+        if 0 <= idx < self.size:
+            node = self.root
+            for level in range(self.shift, 0, -self._BITS):
+                node = node.items[(idx >> level) & self._MASK]
+            return node.items[idx & self._MASK]
+        return None
+
+    def insert_at(self, idx: int, val: GT) -> bool:
+        """
+        Insert a value at the given index.
+
+        Note:
+            The value will not be inserted if the index is not valid.
+
+        Args:
+            idx: the index to insert at
+            val: the value to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        if 0 <= idx <= self.size:
+            moved = [self.pop() for _ in range(idx, self.size)]
+            self.push(val)
+            for tmp in reversed(moved):
+                self.push(tmp)
+            return True
+        return False
+
+    def delete_at(self, idx: int) -> bool:
+        """
+        Delete an element at the given index.
+
+        Note:
+            The deletion will not perform if the index is not valid.
+
+        Args:
+            idx: the index to perform deletion
+
+        Returns:
+            `True` if deletion is successful or `False` otherwise
+        """
+        if 0 <= idx < self.size:
+            moved = [self.pop() for _ in range(idx + 1, self.size)]
+            self.pop()
+            for tmp in reversed(moved):
+                self.push(tmp)
+            return True
+        return False
+
+    def update_at(self, idx: int, val: GT) -> bool:
+        """
+        Update an element at the given index by the given value.
+
+        Note:
+            The update will not perform if the index is not valid.
+
+        Args:
+            idx: the index to update
+            val: the new value
+
+        Returns:
+            `True` if update is successful or `False` otherwise
+        """
+        if 0 <= idx < self.size:
+            self.root = node = self._writable(self.root)
+            for level in range(self.shift, 0, -self._BITS):
+                pos = (idx >> level) & self._MASK
+                node.items[pos] = node = self._writable(node.items[pos])
+            node.items[idx & self._MASK] = val
+            return True
+        return False
+
+    def push(self, val: GT) -> None:
+        """
+        Push a value into the array's end.
+
+        Args:
+            val: the value to push in
+        """
+        if self.size == 1 << (self.shift + self._BITS):
+            # the trie is full, grow a new root above it
+            self.root = self.Node(self._owner, [self.root])
+            self.shift += self._BITS
+        else:
+            self.root = self._writable(self.root)
+        node = self.root
+        for level in range(self.shift, 0, -self._BITS):
+            pos = (self.size >> level) & self._MASK
+            if pos == len(node.items):
+                node.items.append(self.Node(self._owner, []))
+            else:
+                node.items[pos] = self._writable(node.items[pos])
+            node = node.items[pos]
+        node.items.append(val)
+        self.size += 1
+
+    def pop(self) -> Optional[GT]:
+        """
+        Pop a value out of the array's end and return the value.
+
+        Returns:
+            The popped value or `None` if empty array
+        """
+        if not self.size:
+            return None
+        self.size -= 1
+        self.root = node = self._writable(self.root)
+        # the nodes on the path, to remove those left empty afterwards
+        path = [node]
+        for level in range(self.shift, 0, -self._BITS):
+            pos = (self.size >> level) & self._MASK
+            node.items[pos] = node = self._writable(node.items[pos])
+            path.append(node)
+        val = node.items.pop()
+        for parent, child in zip(reversed(path[:-1]), reversed(path[1:])):
+            if child.items:
+                break
+            parent.items.pop()
+        if self.shift and len(self.root.items) == 1:
+            self.root = self.root.items[0]
+            self.shift -= self._BITS
+        return val
+
+    def traverse(self) -> Sequence[GT]:
+        """
+        Traverse all elements in the array and return them in a list.
+
+        Returns:
+            A list containing all elements of the array in order
+        """
+        return list(self)
+
+    def __iter__(self) -> Iterator[GT]:
+        yield from self._walk(self.root, self.shift)
+
+    def _walk(self, node: Node[GT], level: int) -> Iterator[GT]:
+        """
+        Iterate the values under the given node in order.
+
+        Args:
+            node: the node to walk
+            level: the number of bits of the index below the node
+        """
+        if not level:
+            yield from node.items
+        else:
+            for child in node.items:
+                yield from self._walk(child, level - self._BITS)
@@ -0,0 +1,238 @@
+"""Custom implementation of a sorted dynamic array.
+
+This module implements a dynamic array which keeps its elements in order, so
+that the lookups can use the binary search instead of a linear scan. It has no
+practical usage but only serves as an data structure exercise.
+"""
+from typing import TypeVar, Optional, Iterable, List, Callable, Sequence
+from functools import cmp_to_key
+from heapq import merge
+from techniques.binary_search import BinarySearch
+from .dynamic_array import DynamicArray
+from .array_view import ArrayView
+from .growth_policy import GrowthPolicy
+
+
+GT = TypeVar('GT')
+"""The generic type to represent the type of the array element."""
+
+
+def _compare(val_a: GT, val_b: GT) -> int:
+    """The default comparer for any values supporting `<` and `>`."""
+    return (val_a > val_b) - (val_a < val_b)
+
+
+class SortedArray(DynamicArray[GT]):
+    """
+    `SortedArray[T]()` -> a sorted dynamic array for values of type `T`.
+    `SortedArray[T](comparer, policy)` -> a sorted dynamic array for values of
+    type `T` ordered by the given comparer and resized by the given growth
+    policy.
+
+    This is a custom implementation of a sorted Dynamic Array for learning
+    purpose. The elements are kept in a non-decreasing order, and the lookups
+    are done by the binary search routines of `BinarySearch` in O(log n).
+
+    A push inserts the value at its sorted position, after the equal elements,
+    instead of at the end. The positional insertions and updates are only
+    permitted if they keep the order, otherwise they fail like for an invalid
+    index.
+
+    Args:
+        comparer: the function to compare two values, which returns a negative
+            number, zero or a positive number if the first value is less than,
+            equal to or greater than the second one
+        policy: the growth policy to decide the resizes, or the default policy
+            if not given
+
+    Attributes:
+        data (List[Optional[GT]]): the list to store data
+        curr_size (int): the current size of the array
+        comparer (Callable[[GT, GT], int]): the function to compare two values
+    """
+
+    def __init__(
+            self,
+            comparer: Callable[[GT, GT], int] = _compare,
+            policy: Optional[GrowthPolicy] = None
+        ):
+        super().__init__(policy)
+        self.comparer = comparer
+
+    def _fits(self, lo: int, hi: int, vals: Sequence[GT]) -> bool:
+        """
+        Check if putting the values in place of the elements in the index range
+        `[lo, hi)` keeps the order.
+        """
+        chain = self.data[max(lo - 1, 0):lo] + list(vals) + \
+            self.data[hi:min(hi + 1, self.curr_size)]
+        return all(
+            self.comparer(prev, nxt) <= 0
+            for prev, nxt in zip(chain, chain[1:])
+        )
+
+    def index_of(self, val: GT) -> int:
+        """
+        Get the index of the first occurrence of a value, or -1 if not found,
+        in O(log n).
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the value or -1 if not found
+        """
+        return BinarySearch.search_left_bound(self, val, self.comparer)
+
+    def count(self, val: GT) -> int:
+        """
+        Count the occurrences of a value in O(log n).
+
+        Args:
+            val: the value to count
+
+        Returns:
+            The number of the elements equal to the value
+        """
+        left = BinarySearch.search_left_bound(self, val, self.comparer)
+        if left < 0:
+            return 0
+        return BinarySearch.search_right_bound(self, val, self.comparer) - \
+            left + 1
+
+    def rank(self, val: GT) -> int:
+        """
+        Get the number of the elements less than a value in O(log n), which is
+        also the index where the value would be inserted before its equals.
+
+        Args:
+            val: the value to rank
+
+        Returns:
+            The number of the elements less than the value
+        """
+        return BinarySearch.search_insertion_left(self, val, self.comparer)
+
+    def range(self, lo: GT, hi: GT) -> ArrayView[GT]:
+        """
+        Get a view of the elements in the value range `[lo, hi)` in O(log n).
+
+        Args:
+            lo: the lower bound of the values, inclusive
+            hi: the upper bound of the values, exclusive
+
+        Returns:
+            A read-only view of the elements in the value range, which becomes
+            stale once the array is resized
+        """
+        start = BinarySearch.search_insertion_left(self, lo, self.comparer)
+        end = BinarySearch.search_insertion_left(self, hi, self.comparer)
+        return self.view(start, max(start, end))
+
+    def insert_at(self, idx: int, val: GT) -> bool:
+        """
+        Insert a value at the given index.
+
+        Note:
+            The value will not be inserted if the index is not valid or the
+            value does not fit the order at the index.
+
+        Args:
+            idx: the index to insert at
+            val: the value to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        if 0 <= idx <= self.curr_size and self._fits(idx, idx, (val,)):
+            return super().insert_at(idx, val)
+        return False
+
+    def update_at(self, idx: int, val: GT) -> bool:
+        """
+        Update an element at the given index by the given value.
+
+        Note:
+            The update will not perform if the index is not valid or the value
+            does not fit the order at the index.
+
+        Args:
+            idx: the index to update
+            val: the new value
+
+        Returns:
+            `True` if update is successful or `False` otherwise
+        """
+        if 0 <= idx < self.curr_size and self._fits(idx, idx + 1, (val,)):
+            return super().update_at(idx, val)
+        return False
+
+    def push(self, val: GT) -> None:
+        """
+        Insert a value at its sorted position, after all its equals.
+
+        Args:
+            val: the value to push in
+        """
+        super().insert_at(
+            BinarySearch.search_insertion_right(self, val, self.comparer), val)
+
+    def insert_many(self, idx: int, vals: Iterable[GT]) -> bool:
+        vals = list(vals)
+        if 0 <= idx <= self.curr_size and self._fits(idx, idx, vals):
+            return super().insert_many(idx, vals)
+        return False
+
+    def update_range(self, lo: int, vals: Iterable[GT]) -> bool:
+        vals = list(vals)
+        if 0 <= lo and lo + len(vals) <= self.curr_size and \
+                self._fits(lo, lo + len(vals), vals):
+            return super().update_range(lo, vals)
+        return False
+
+    def update_many(
+            self, idxes: Iterable[int], vals: Iterable[GT]
+        ) -> List[bool]:
+        return [self.update_at(i, val) for i, val in zip(idxes, vals)]
+
+    def extend(self, vals: Iterable[GT]) -> bool:
+        """
+        Insert all the given values at their sorted positions.
+
+        Args:
+            vals: the values to insert
+
+        Returns:
+            `True` as the insertion is always successful
+        """
+        self.merge_insert(vals)
+        return True
+
+    def merge_insert(self, vals: Iterable[GT]) -> None:
+        """
+        Insert a batch of values at their sorted positions by merging it with
+        the elements in one pass, in O(n + k) for a pre-sorted batch of k
+        values instead of O(k * n) by pushing them one by one.
+
+        The elements before the position of the smallest value of the batch are
+        not moved, and the internal list is resized at most once.
+
+        Args:
+            vals: the values to insert, better already sorted
+        """
+        key = cmp_to_key(self.comparer)
+        # sorting an already sorted batch is linear
+        vals = sorted(vals, key=key)
+        if not vals:
+            return
+        start = BinarySearch.search_insertion_right(
+            self, vals[0], self.comparer)
+        merged = list(merge(self.data[start:self.curr_size], vals, key=key))
+        needed = self.curr_size + len(vals)
+        if needed > len(self.data):
+            capacity = self.policy.grow(len(self.data), needed)
+            self._reallocate(capacity, start, self.curr_size, merged)
+        else:
+            self.data[start:needed] = merged
+            self.curr_size = needed
+            self._version += 1
@@ -0,0 +1,364 @@
+"""Custom implementation of a sparse array.
+
+This module implements an array which only stores its non-empty slots, so that
+a huge array with few populated slots takes memory in proportion to the
+populated slots instead of its size. It has no practical usage but only serves
+as an data structure exercise.
+"""
+from bisect import bisect_left, bisect_right
+from typing import TypeVar, Optional, Sequence, Iterator, List, Tuple
+from ..custom_sequence import CustomSequence
+
+
+GT = TypeVar('GT')
+"""type: The generic type to use in the SparseArray definition."""
+
+
+class SparseArray(CustomSequence[GT]):
+    """
+    `SparseArray[T](n)` -> an empty sparse array of maximum size `n` for values
+    of type `T`.
+    `SparseArray[T](n, m)` -> a sparse array of maximum size `n` for values of
+    type `T` with `m` empty slots.
+    `SparseArray[T](n, m, b)` -> the same with blocks of at most `b` populated
+    slots.
+
+    An empty slot holds `None` like in `FixedArray`, but is not stored.
+
+    This is a custom implementation of a Sparse Array for learning purpose. The
+    populated slots are kept in sorted coordinate blocks of at most `b` slots.
+    A block starts at a base index and keeps the offsets of its slots from the
+    base in a sorted list, alongside a list of their values. The bases are kept
+    sorted in a list too, so a slot is found by two binary searches. For k
+    populated slots, the costs are:
+
+    - `value_at` is O(log k).
+    - `update_at` is O(log k + b): filling an empty slot inserts into a single
+      block, which is split in two when it exceeds `b` slots. A split inserts
+      a base into the list of the k/b bases, a memory move done once every b/2
+      fills of the block at most.
+    - `insert_at` and `delete_at` are O(log k + b + k/b): the offsets after the
+      index are shifted in its block and the bases of all the later blocks are
+      shifted by one, regardless of the size of the array.
+    - `index_of`, `items` and `traverse` walk the blocks in O(k), plus the
+      empty slots for `traverse`.
+
+    Args:
+        max_size: the maximum size of the array
+        size: the initial size of the array, whose slots are all empty
+        block_size: the maximum number of populated slots in a block
+
+    Attributes:
+        bases (List[int]): the sorted base indexes of the blocks, the first
+            one being 0
+        keys (List[List[int]]): the sorted offsets of the populated slots of
+            each block from its base
+        vals (List[List[GT]]): the values of the populated slots of each
+            block, in the same order
+        max_size (int): the maximum size of the array
+        curr_size (int): the current size of the array
+        block_size (int): the maximum number of populated slots in a block
+    """
+
+    def __init__(self, max_size: int, size: int = 0, block_size: int = 64):
+        super().__init__()
+        self.bases: List[int] = []
+        self.keys: List[List[int]] = []
+        self.vals: List[List[GT]] = []
+        self.max_size = max_size
+        self.curr_size = max(0, min(size, max_size))
+        self.block_size = max(2, block_size)
+        self._populated = 0
+
+    def _find(self, idx: int) -> Tuple[int, int, bool]:
+        """
+        Find the position of a slot in the populated slots.
+
+        Args:
+            idx: the index of the slot
+
+        Returns:
+            The block covering the slot or -1 if no block, the position of the
+            slot in the block, or where it would be inserted, and if the slot
+            is populated
+        """
+        blk = bisect_right(self.bases, idx) - 1
+        if blk < 0:
+            return blk, 0, False
+        keys, off = self.keys[blk], idx - self.bases[blk]
+        pos = bisect_left(keys, off)
+        return blk, pos, pos < len(keys) and keys[pos] == off
+
+    def _fill(self, idx: int, val: GT) -> None:
+        """
+        Store a value into an empty slot, splitting its block if full.
+
+        Args:
+            idx: the index of the empty slot
+            val: the value to store
+        """
+        blk, pos, _ = self._find(idx)
+        if blk < 0:
+            self.bases.append(0)
+            self.keys.append([idx])
+            self.vals.append([val])
+        else:
+            self.keys[blk].insert(pos, idx - self.bases[blk])
+            self.vals[blk].insert(pos, val)
+            if len(self.keys[blk]) > self.block_size:
+                self._split(blk)
+        self._populated += 1
+
+    def _split(self, blk: int) -> None:
+        """
+        Split a block in two halves, the second one based at its first slot.
+
+        Args:
+            blk: the block to split
+        """
+        keys, vals = self.keys[blk], self.vals[blk]
+        half = len(keys) // 2
+        off = keys[half]
+        self.bases.insert(blk + 1, self.bases[blk] + off)
+        self.keys.insert(blk + 1, [key - off for key in keys[half:]])
+        self.vals.insert(blk + 1, vals[half:])
+        del keys[half:]
+        del vals[half:]
+
+    def _empty(self, blk: int, pos: int) -> None:
+        """
+        Remove a populated slot from its block, dropping the block if empty.
+
+        Args:
+            blk: the block of the slot
+            pos: the position of the slot in the block
+        """
+        del self.keys[blk][pos]
+        del self.vals[blk][pos]
+        self._populated -= 1
+        if self.keys[blk]:
+            return
+        del self.bases[blk]
+        del self.keys[blk]
+        del self.vals[blk]
+        if blk == 0 and self.bases:
+            # keep the first block based at 0 to cover the leading slots
+            off = self.bases[0]
+            self.keys[0] = [key + off for key in self.keys[0]]
+            self.bases[0] = 0
+
+    def _shift(self, idx: int, delta: int) -> None:
+        """
+        Shift the indexes of the populated slots from the given index on.
+
+        Args:
+            idx: the index of the first slot to shift
+            delta: the number to add to the indexes
+        """
+        blk = bisect_right(self.bases, idx) - 1
+        if blk < 0:
+            return
+        keys = self.keys[blk]
+        for pos in range(bisect_left(keys, idx - self.bases[blk]), len(keys)):
+            keys[pos] += delta
+        for nxt in range(blk + 1, len(self.bases)):
+            self.bases[nxt] += delta
+
+    def get_size(self) -> int:
+        """
+        Get the current size of the array.
+
+        Returns:
+            The current size of the array
+        """
+        return self.curr_size
+
+    def get_populated(self) -> int:
+        """
+        Get the number of the populated slots of the array.
+
+        Returns:
+            The number of the populated slots
+        """
+        return self._populated
+
+    def index_of(self, val: GT) -> int:
+        """
+        Get the index of a value, or -1 if not found.
+
+        Looking for `None` gives the first empty slot.
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the value or -1 if not found
+        """
+        if val is None:
+            # the first empty slot is where the indexes skip a number
+            for i, (key, _) in enumerate(self.items()):
+                if key != i:
+                    return i
+            return self._populated \
+                if self._populated < self.curr_size else -1
+        for key, tmp in self.items():
+            if tmp == val:
+                return key
+        return -1
+
+    def value_at(self, idx: int) -> Optional[GT]:
+        """
+        Get the value at the given index.
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The value at the given index or `None` if index not valid or the
+            slot is empty
+        """
+        if 0 <= idx < self.curr_size:
+            blk, pos, found = self._find(idx)
+            if found:
+                return self.vals[blk][pos]
+        return None
+
+    def insert_at(self, idx: int, val: GT) -> bool:
+        """
+        Insert a value at the given index.
+
+        Note:
+            The value will not be inserted if the index is not valid or the
+            array is already full.
+
+        Args:
+            idx: the index to insert at
+            val: the value to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        if 0 <= idx <= self.curr_size < self.max_size:
+            self._shift(idx, 1)
+            if val is not None:
+                self._fill(idx, val)
+            self.curr_size += 1
+            return True
+        return False
+
+    def delete_at(self, idx: int) -> bool:
+        """
+        Delete an element at the given index.
+
+        Note:
+            The deletion will not perform if the index is not valid.
+
+        Args:
+            idx: the index to perform deletion
+
+        Returns:
+            `True` if deletion is successful or `False` otherwise
+        """
+        if 0 <= idx < self.curr_size:
+            blk, pos, found = self._find(idx)
+            if found:
+                self._empty(blk, pos)
+            self._shift(idx, -1)
+            self.curr_size -= 1
+            return True
+        return False
+
+    def update_at(self, idx: int, val: GT) -> bool:
+        """
+        Update an element at the given index by the given value.
+
+        Note:
+            The update will not perform if the index is not valid. Updating a
+            slot by `None` empties it.
+
+        Args:
+            idx: the index to update
+            val: the new value
+
+        Returns:
+            `True` if update is successful or `False` otherwise
+        """
+        if 0 <= idx < self.curr_size:
+            blk, pos, found = self._find(idx)
+            if val is None:
+                if found:
+                    self._empty(blk, pos)
+            elif found:
+                self.vals[blk][pos] = val
+            else:
+                self._fill(idx, val)
+            return True
+        return False
+
+    def push(self, val: GT) -> None:
+        """
+        Push a value into the array's end.
+
+        Note:
+            Nothing will happen if the array is already full.
+
+        Args:
+            val: the value to push in
+        """
+        self.insert_at(self.curr_size, val)
+
+    def pop(self) -> Optional[GT]:
+        """
+        Pop a value out of the array's end and return the value.
+
+        Returns:
+            The popped value or `None` if empty array or the slot is empty
+        """
+        if not self.curr_size:
+            return None
+        val = self.value_at(self.curr_size - 1)
+        self.delete_at(self.curr_size - 1)
+        return val
+
+    def items(self) -> Iterator[Tuple[int, GT]]:
+        """
+        Iterate only the populated slots in order, in O(k) regardless of the
+        size of the array.
+
+        Returns:
+            An iterator of the index and the value of each populated slot
+        """
+        for base, keys, vals in zip(self.bases, self.keys, self.vals):
+            for key, val in zip(keys, vals):
+                yield base + key, val
+
+    def traverse(self) -> Sequence[GT]:
+        """
+        Traverse all elements in the array and return them in a list.
+
+        Note:
+            The list has all the empty slots, use `items()` instead to stream
+            only the populated ones.
+
+        Returns:
+            A list containing all elements of the array in order
+        """
+        return list(self)
+
+    def __iter__(self) -> Iterator[GT]:
+        prev = 0
+        for key, val in self.items():
+            yield from (None for _ in range(prev, key))
+            yield val
+            prev = key + 1
+        yield from (None for _ in range(prev, self.curr_size))
+
+    def __reversed__(self) -> Iterator[GT]:
+        prev = self.curr_size
+        for base, keys, vals in zip(
+                reversed(self.bases), reversed(self.keys), reversed(self.vals)):
+            for key, val in zip(reversed(keys), reversed(vals)):
+                yield from (None for _ in range(base + key + 1, prev))
+                yield val
+                prev = base + key
+        yield from (None for _ in range(prev))
@@ -0,0 +1,185 @@
+"""Custom implementation of a dynamic array of a fixed numeric type.
+
+This module implements a dynamic array which stores its values unboxed in a
+contiguous NumPy buffer instead of a list of Python objects. It is only for
+learning purpose and serves as an exercise of trading flexibility for memory and
+speed.
+"""
+from typing import TypeVar, Optional, Sequence, Union, Iterator, Iterable, \
+    List
+import numpy as np
+from .dynamic_array import DynamicArray
+from .growth_policy import GrowthPolicy
+
+
+GT = TypeVar('GT')
+"""type: The generic type to represent the type of the array element."""
+
+
+class TypedDynamicArray(DynamicArray[GT]):
+    """
+    `TypedDynamicArray[T](dtype)` -> a dynamic array for values of type `T`
+    stored as the NumPy data type `dtype`.
+    `TypedDynamicArray[T](dtype, policy)` -> the same but resizes by the given
+    growth policy.
+
+    This is a custom implementation of a Dynamic Array for numeric values. The
+    values are stored in a contiguous NumPy buffer of a fixed data type, which
+    costs only the size of the data type per slot instead of a pointer plus a
+    Python object. The resizes are done by buffer copies, and the scans, like
+    `index_of`, run in the vectorized NumPy routines.
+
+    Note:
+        The values are converted to the data type of the buffer when stored,
+        e.g. a float stored in an integer array is truncated.
+
+    Args:
+        dtype: the NumPy data type of the values, `int64` by default
+        policy: the growth policy to decide the resizes, or the default policy
+            if not given
+
+    Attributes:
+        dtype (numpy.dtype): the data type of the values
+        data (numpy.ndarray): the buffer to store data
+        curr_size (int): the current size of the array
+    """
+
+    def __init__(
+            self,
+            dtype: Union[str, np.dtype] = 'int64',
+            policy: Optional[GrowthPolicy] = None
+        ):
+        self.dtype = np.dtype(dtype)
+        super().__init__(policy)
+
+    def _allocate(self, length: int) -> np.ndarray:
+        return np.zeros(length, dtype=self.dtype)
+
+    def index_of(self, val: GT) -> int:
+        """
+        Get the index of a value, or -1 if not found.
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the value or -1 if not found
+        """
+        found = np.flatnonzero(self.data[:self.curr_size] == val)
+        return int(found[0]) if found.size else -1
+
+    def value_at(self, idx: int) -> Optional[GT]:
+        """
+        Get the value at the given index.
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The value at the given index as a Python scalar or `None` if index
+            not valid
+        """
+        if 0 <= idx < self.curr_size:
+            return self.data[idx].item()
+        return None
+
+    def value_at_many(self, idxes: Iterable[int]) -> List[Optional[GT]]:
+        """
+        Get the values at the given indexes by a single NumPy fancy indexing.
+
+        Args:
+            idxes: the indexes to fetch
+
+        Returns:
+            A list of the value at each index or `None` if the index not valid
+        """
+        idxes = np.fromiter(idxes, dtype=np.intp)
+        valid = (idxes >= 0) & (idxes < self.curr_size)
+        if valid.all():
+            return self.data[idxes].tolist()
+        ret = [None] * len(idxes)
+        for i, val in zip(np.flatnonzero(valid).tolist(),
+                          self.data[idxes[valid]].tolist()):
+            ret[i] = val
+        return ret
+
+    def update_many(
+            self, idxes: Iterable[int], vals: Iterable[GT]
+        ) -> List[bool]:
+        """
+        Update the elements at the given indexes by the given values pairwise
+        by a single NumPy fancy indexing.
+
+        Note:
+            The update will not perform for an index not valid. For a repeated
+            index, the last value is kept.
+
+        Args:
+            idxes: the indexes to update
+            vals: the new values, one for each index
+
+        Returns:
+            A list of `True` for each successful update or `False` otherwise
+        """
+        idxes = np.fromiter(idxes, dtype=np.intp)
+        vals = np.asarray(list(vals), dtype=self.dtype)[:len(idxes)]
+        idxes = idxes[:len(vals)]
+        valid = (idxes >= 0) & (idxes < self.curr_size)
+        self.data[idxes[valid]] = vals[valid]
+        return valid.tolist()
+
+    def insert_at(self, idx: int, val: GT) -> bool:
+        """
+        Insert a value at the given index.
+
+        Note:
+            The value will not be inserted if the index is not valid
+
+        Args:
+            idx: the index to insert at
+            val: the value to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        # shift the elements by a buffer copy instead of one by one
+        return self.insert_many(idx, (val,))
+
+    def delete_at(self, idx: int) -> bool:
+        """
+        Delete an element at the given index.
+
+        Note:
+            The deletion will not perform if the index is not valid.
+
+        Args:
+            idx: the index to perform deletion
+
+        Returns:
+            `True` if deletion is successful or `False` otherwise
+        """
+        # shift the elements by a buffer copy instead of one by one
+        return self.delete_range(idx, idx + 1)
+
+    def traverse(self) -> Sequence[GT]:
+        """
+        Traverse all elements in the array and return them in a read-only view.
+
+        Note:
+            The view shares the buffer of the array, so it reflects the later
+            in-place changes until the array is resized.
+
+        Returns:
+            A read-only NumPy view of all elements of the array in order
+        """
+        view = self.data[:self.curr_size]
+        view.flags.writeable = False
+        return view
+
+    def __iter__(self) -> Iterator[GT]:
+        for val in self.data[:self.curr_size]:
+            yield val.item()
+
+    def __reversed__(self) -> Iterator[GT]:
+        for val in self.data[self.curr_size - 1::-1] if self.curr_size else ():
+            yield val.item()
@@ -4,9 +4,14 @@ sequence-like data structures, like arrays and linked lists.
 This module defines the abstract base class and the operations available on its
 sub-classes. All its sub classes are only implemented for learning purpose and
 have no practical usage.
+
+Besides the abstract operations, the base class implements the Python sequence
+protocol, `len()`, iteration, subscription, `in` and `reversed()`, on top of
+them. The sub classes override the iteration to walk their own storage once.
 """
-from typing import TypeVar, Generic, Optional, Sequence
+from typing import TypeVar, Generic, Optional, Sequence, Iterator, Union, List
 from abc import ABC, abstractmethod
+from itertools import islice
 
 
 GT = TypeVar('GT')
@@ -137,3 +142,64 @@ class CustomSequence(Generic[GT], ABC):
             A list containing all elements in order
         """
         return []
+
+    def __len__(self) -> int:
+        return self.get_size()
+
+    def __iter__(self) -> Iterator[GT]:
+        """
+        Iterate all elements in order.
+
+        Note:
+            This default implementation calls `value_at` for each index, the
+            sub classes override it to walk their storage only once.
+        """
+        for i in range(self.get_size()):
+            yield self.value_at(i)
+
+    def __reversed__(self) -> Iterator[GT]:
+        """
+        Iterate all elements in reverse order.
+
+        Note:
+            This default implementation calls `value_at` for each index.
+        """
+        for i in range(self.get_size() - 1, -1, -1):
+            yield self.value_at(i)
+
+    def __contains__(self, val: GT) -> bool:
+        return self.index_of(val) != -1
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[GT, List[GT]]:
+        """
+        Get the value at an index or the list of values in a slice, following
+        the Python semantics of negative indexes and slices.
+
+        Note:
+            A slice is collected in a single pass of the iteration.
+
+        Args:
+            idx: the index or the slice to fetch
+
+        Returns:
+            The value at the index or a list of the values in the slice
+
+        Raises:
+            IndexError: if the index is out of range
+        """
+        if isinstance(idx, slice):
+            indexes = range(*idx.indices(self.get_size()))
+            if not indexes:
+                return []
+            if indexes.step > 0:
+                return list(islice(
+                    self, indexes.start, indexes.stop, indexes.step))
+            # collect the covered range in order then step backwards
+            vals = list(islice(self, indexes[-1], indexes.start + 1))
+            return vals[::indexes.step]
+        size = self.get_size()
+        if idx < 0:
+            idx += size
+        if not 0 <= idx < size:
+            raise IndexError('sequence index out of range')
+        return self.value_at(idx)
@@ -0,0 +1,293 @@
+"""Custom implementation of an arena-backed doubly linked list.
+
+This module implements a doubly linked list without node objects, by storing
+the values and the links of all nodes in parallel arrays and referring to a
+node by its integer position in them. It has no practical usage but only serves
+as an data structure exercise.
+"""
+from array import array
+from typing import TypeVar, Optional, Sequence, Iterator, List
+from ..custom_sequence import CustomSequence
+
+
+GT = TypeVar('GT')
+"""type: The generic type to represent the element type of the linked list."""
+
+
+class ArenaLinkedList(CustomSequence[GT]):
+    """
+    `ArenaLinkedList[T]()` -> an empty arena-backed doubly linked list of type
+    `T`.
+
+    This is a custom implementation of a doubly linked list for learning
+    purpose, which works like `DoublyLinkedList` but keeps its nodes in an
+    arena. A node is an integer handle, the index of its value in the list
+    `vals` and of its links in the typed arrays `nexts` and `prevs`, and -1
+    stands for no node. So the list creates no Python object per element except
+    the values themselves, and takes 16 bytes of links per element instead of a
+    node object.
+
+    The handles of the deleted nodes are chained in a free-list through
+    `nexts` and reused by the next insertions, so the arrays only grow when all
+    the slots are taken.
+
+    Attributes:
+        vals (List[Optional[T]]): the values of the nodes
+        nexts (array): the handle of the next node of each node
+        prevs (array): the handle of the previous node of each node
+        head (int): the handle of the head node or -1 if empty list
+        tail (int): the handle of the tail node or -1 if empty list
+        size (int): the size of the linked list
+    """
+
+    _NIL: int = -1
+    """The handle standing for no node."""
+
+    def __init__(self):
+        super().__init__()
+        self.vals: List[Optional[GT]] = []
+        self.nexts = array('l')
+        self.prevs = array('l')
+        self.head = self._NIL
+        self.tail = self._NIL
+        self.size = 0
+        # the head of the chain of the free handles
+        self._free = self._NIL
+
+    def _alloc(self, val: GT) -> int:
+        """
+        Take a free handle, or a new one if none, for a node of the value.
+
+        Args:
+            val: the value of the node
+
+        Returns:
+            The handle of the new node, not linked to any other node
+        """
+        if self._free != self._NIL:
+            handle = self._free
+            self._free = self.nexts[handle]
+            self.vals[handle] = val
+            self.nexts[handle] = self._NIL
+            return handle
+        self.vals.append(val)
+        self.nexts.append(self._NIL)
+        self.prevs.append(self._NIL)
+        return len(self.vals) - 1
+
+    def _release(self, handle: int) -> None:
+        """
+        Put the handle of a deleted node into the free-list.
+
+        Args:
+            handle: the handle of the node deleted from the list
+        """
+        self.vals[handle] = None
+        self.prevs[handle] = self._NIL
+        self.nexts[handle] = self._free
+        self._free = handle
+
+    def _link_before(self, handle: int, succ: int) -> None:
+        """
+        Link a new node before the given node, or as the tail if -1.
+
+        Args:
+            handle: the handle of the new node
+            succ: the handle of the node to link before
+        """
+        pred = self.prevs[succ] if succ != self._NIL else self.tail
+        self.prevs[handle] = pred
+        self.nexts[handle] = succ
+        if pred != self._NIL:
+            self.nexts[pred] = handle
+        else:
+            self.head = handle
+        if succ != self._NIL:
+            self.prevs[succ] = handle
+        else:
+            self.tail = handle
+        self.size += 1
+
+    def _unlink(self, handle: int) -> None:
+        """
+        Remove the given node from the list and release its handle.
+
+        Args:
+            handle: the handle of the node to remove
+        """
+        pred, succ = self.prevs[handle], self.nexts[handle]
+        if pred != self._NIL:
+            self.nexts[pred] = succ
+        else:
+            self.head = succ
+        if succ != self._NIL:
+            self.prevs[succ] = pred
+        else:
+            self.tail = pred
+        self.size -= 1
+        self._release(handle)
+
+    def handle_at(self, idx: int) -> int:
+        """
+        Get the handle of the node at the given index, walking from the closer
+        end.
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The handle of the node at the given index or -1 if index not valid
+        """
+        if not 0 <= idx < self.size:
+            return self._NIL
+        if idx < self.size // 2:
+            handle = self.head
+            for _ in range(idx):
+                handle = self.nexts[handle]
+        else:
+            handle = self.tail
+            for _ in range(self.size - 1 - idx):
+                handle = self.prevs[handle]
+        return handle
+
+    def get_size(self) -> int:
+        """
+        Get the current size.
+
+        Returns:
+            The current size
+        """
+        return self.size
+
+    def index_of(self, val: GT) -> int:
+        """
+        Get the index of a value, or -1 if not found.
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the value or -1 if not found
+        """
+        for i, tmp in enumerate(self):
+            if tmp == val:
+                return i
+        return -1
+
+    def value_at(self, idx: int) -> Optional[GT]:
+        """
+        Get the value at the given index.
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The value at the given index or `None` if index not valid
+        """
+        handle = self.handle_at(idx)
+        return self.vals[handle] if handle != self._NIL else None
+
+    def insert_at(self, idx: int, val: GT) -> bool:
+        """
+        Insert a value at the given index.
+
+        Note:
+            The value will not be inserted if the index is not valid.
+
+        Args:
+            idx: the index to insert at
+            val: the value to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        if idx == self.size:
+            self.push(val)
+            return True
+        succ = self.handle_at(idx)
+        if succ != self._NIL:
+            self._link_before(self._alloc(val), succ)
+            return True
+        return False
+
+    def delete_at(self, idx: int) -> bool:
+        """
+        Delete an element at the given index.
+
+        Note:
+            The deletion will not perform if the index is not valid.
+
+        Args:
+            idx: the index to perform deletion
+
+        Returns:
+            `True` if deletion is successful or `False` otherwise
+        """
+        handle = self.handle_at(idx)
+        if handle != self._NIL:
+            self._unlink(handle)
+            return True
+        return False
+
+    def update_at(self, idx: int, val: GT) -> bool:
+        """
+        Update an element at the given index by the given value.
+
+        Note:
+            The update will not perform if the index is not valid.
+
+        Args:
+            idx: the index to update
+            val: the new value
+
+        Returns:
+            `True` if update is successful or `False` otherwise
+        """
+        handle = self.handle_at(idx)
+        if handle != self._NIL:
+            self.vals[handle] = val
+            return True
+        return False
+
+    def push(self, val: GT) -> None:
+        """
+        Push a value into the list's end.
+
+        Args:
+            val: the value to push in
+        """
+        self._link_before(self._alloc(val), self._NIL)
+
+    def pop(self) -> Optional[GT]:
+        """
+        Pop a value out from the list's end and return the value.
+
+        Returns:
+            The popped value or `None` if empty
+        """
+        if self.size == 0:
+            return None
+        val = self.vals[self.tail]
+        self._unlink(self.tail)
+        return val
+
+    def traverse(self) -> Sequence[GT]:
+        """
+        Traverse all elements and return them in a list.
+
+        Returns:
+            A list containing all elements in order
+        """
+        return list(self)
+
+    def __iter__(self) -> Iterator[GT]:
+        handle = self.head
+        while handle != self._NIL:
+            yield self.vals[handle]
+            handle = self.nexts[handle]
+
+    def __reversed__(self) -> Iterator[GT]:
+        handle = self.tail
+        while handle != self._NIL:
+            yield self.vals[handle]
+            handle = self.prevs[handle]
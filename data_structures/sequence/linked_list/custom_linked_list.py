@@ -1,12 +1,13 @@
 """The implementation of a linked list mixin for the sequence-like linked list
 data structures.
 
-This module defines two common operations of a linked list and the node classes
-for the singly and doubly linked lists. All these classes are only implemented
+This module defines the common operations of a linked list, including the
+optional recycling of the deleted nodes, and the node classes for the singly and
+doubly linked lists. All these classes are only implemented
 for learning purpose and have no practical usage.
 """
 from __future__ import annotations
-from typing import TypeVar, Generic, Optional
+from typing import TypeVar, Generic, Optional, List
 
 
 GT = TypeVar('GT')
@@ -15,8 +16,25 @@ GT = TypeVar('GT')
 
 class LinkedListMixin(Generic[GT]):
     """
-    The mixin class to provide implementations of two common operations, to get
-    the head node and to get the node at a specific index, for linked lists.
+    The mixin class to provide implementations of the common operations, to get
+    the head node, to get the node at a specific index and to create or release
+    a node, for linked lists.
+
+    The nodes are slot-based, so that they take no per-instance `__dict__`. A
+    list can keep up to `pool_size` of its deleted nodes in a free-list and
+    reuse them for the next insertions instead of creating new nodes.
+
+    The last node got by `node_at()` is cached with its index as a finger, and
+    the next lookup walks from it instead of the head if it is not after the
+    index, so that an access near the previous one, like in a sequential loop,
+    costs O(1). The lists keep the finger valid through their modifications.
+
+    Args:
+        pool_size: the maximum number of the deleted nodes to keep for reuse,
+            0 to disable the recycling
+
+    Attributes:
+        pool_size (int): the maximum number of the deleted nodes to keep
     """
 
     class Node(Generic[GT]):
@@ -24,6 +42,7 @@ class LinkedListMixin(Generic[GT]):
         """
         The basic node structure for a singly linked list.
         """
+        __slots__ = ('val', 'next')
 
         def __init__(self, val: GT):
             self.val = val
@@ -34,14 +53,50 @@ class LinkedListMixin(Generic[GT]):
         """
         The basic node structure for a doubly linked list.
         """
+        __slots__ = ('prev',)
 
         def __init__(self, val: GT):
             super().__init__(val)
             self.prev = None
 
-    def __init__(self):
+    def __init__(self, pool_size: int = 0):
         self.head = None
         self.size = 0
+        self.pool_size = pool_size
+        self._pool: List[Node[GT]] = []
+        # the last accessed node and its index
+        self._finger: Optional[LinkedListMixin.Node[GT]] = None
+        self._finger_idx = 0
+
+    def _new_node(self, val: GT) -> Node[GT]:
+        """
+        Create a node of the given value, reusing a deleted node if any.
+
+        Args:
+            val: the value of the node
+
+        Returns:
+            The new node, not linked to any other node
+        """
+        if self._pool:
+            node = self._pool.pop()
+            node.val = val
+            return node
+        return self.Node(val)
+
+    def _free_node(self, node: Node[GT]) -> None:
+        """
+        Release a deleted node, keeping it for reuse if the free-list is not
+        full.
+
+        Args:
+            node: the node deleted from the list
+        """
+        if len(self._pool) < self.pool_size:
+            # reset the value and the links so that the free-list keeps no
+            # other object alive
+            node.__init__(None)
+            self._pool.append(node)
 
     def get_head(self) -> Optional[Node[GT]]:
         """
@@ -66,8 +121,40 @@ class LinkedListMixin(Generic[GT]):
             return None
         i = 0
         node = self.head
+        # start from the finger if it is on the way
+        if self._finger and self._finger_idx <= idx:
+            i = self._finger_idx
+            node = self._finger
         while node and i < idx:
             node = node.next
             i += 1
         # node is None if idx >= self.size
+        if node:
+            self._set_finger(node, idx)
         return node
+
+    def _set_finger(self, node: Optional[Node[GT]], idx: int) -> None:
+        """
+        Cache the given node as the finger, or drop the finger if `None`.
+
+        Args:
+            node: the node to cache
+            idx: the index of the node
+        """
+        self._finger = node
+        self._finger_idx = idx
+
+    def _shift_finger(self, idx: int, delta: int) -> None:
+        """
+        Keep the finger valid after a node is inserted at or deleted from the
+        given index.
+
+        Args:
+            idx: the index of the inserted or deleted node
+            delta: 1 for an insertion or -1 for a deletion
+        """
+        if self._finger and self._finger_idx >= idx:
+            if delta < 0 and self._finger_idx == idx:
+                self._set_finger(None, 0)
+            else:
+                self._finger_idx += delta
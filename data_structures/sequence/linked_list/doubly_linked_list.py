@@ -7,7 +7,7 @@ between the implementations of singly and doubly linked lists. This
 implementation has no practical usage but only serves as an data structure
 exercise.
 """
-from typing import TypeVar, Optional
+from typing import TypeVar, Optional, Iterator, Callable, Any
 from .singly_linked_list import SinglyLinkedList
 from .custom_linked_list import LinkedListMixin
 
@@ -20,13 +20,25 @@ class DoublyLinkedList(SinglyLinkedList[GT]):
     # pylint: disable=duplicate-code
     """
     `DoublyLinkedList[T]()` -> an empty doubly linked list of type `T`
+    `DoublyLinkedList[T](pool_size)` -> an empty doubly linked list of type `T`
+    which keeps up to `pool_size` deleted nodes for reuse
 
     This is a custom implementation of a doubly linked list for learning
     purpose. It inherits from SinglyLinkedList and only implements the changes
     in order to highlight the changes.
 
     The implementation uses the `DoublyNode` implemented inside
-    `LinkedListMixin` as the nodes in the list.
+    `LinkedListMixin` as the nodes in the list. A node is looked up by walking
+    from the closest of the head, the tail and the finger, forwards or
+    backwards. Whole lists are moved in or out by `concat()`, `split_at()` and
+    `splice()`, which relink the nodes at the ends instead of moving the
+    elements one by one. The nodes themselves can be linked, unlinked and moved
+    to the end in O(1) by `append_node()`, `remove_node()` and `move_to_end()`,
+    for the structures keeping the nodes, like caches.
+
+    Args:
+        pool_size: the maximum number of the deleted nodes to keep for reuse,
+            0 to disable the recycling
 
     Attributes:
         head (Optional[Node[T]]): the head node of the doubly linked list
@@ -37,16 +49,38 @@ class DoublyLinkedList(SinglyLinkedList[GT]):
     Node = LinkedListMixin.DoublyNode
     """type: An alias for the correspondent node type."""
 
-    def __init__(self):
-        super().__init__()
-        self.tail = None
+    def node_at(self, idx: int) -> Optional[Node[GT]]:
+        """
+        Get the node at the given index, walking from the closest of the head,
+        the tail and the finger.
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The node at the given index or `None` if index not valid
+        """
+        if not 0 <= idx < self.size:
+            return None
+        # the start node and its index, from the head by default
+        node, i = self.head, 0
+        if self.size - 1 - idx < idx:
+            node, i = self.tail, self.size - 1
+        if self._finger and abs(self._finger_idx - idx) < abs(i - idx):
+            node, i = self._finger, self._finger_idx
+        while i < idx:
+            node = node.next
+            i += 1
+        while i > idx:
+            node = node.prev
+            i -= 1
+        self._set_finger(node, idx)
+        return node
 
     def _insert_head(self, val: GT) -> None:
         super()._insert_head(val)
         if self.head.next:
             self.head.next.prev = self.head
-        else:
-            self.tail = self.head
 
     def _insert_after(self, val: GT, prev_node: Node[GT]) -> None:
         super()._insert_after(val, prev_node)
@@ -54,22 +88,16 @@ class DoublyLinkedList(SinglyLinkedList[GT]):
         new_node.prev = prev_node
         if new_node.next:
             new_node.next.prev = new_node
-        else:
-            self.tail = new_node
 
     def _delete_head(self) -> None:
         super()._delete_head()
         if self.head:
             self.head.prev = None
-        else:
-            self.tail = None
 
     def _delete_after(self, prev_node: Node[GT]) -> None:
         super()._delete_after(prev_node)
         if prev_node.next:
             prev_node.next.prev = prev_node
-        else:
-            self.tail = prev_node
 
     def push(self, val: GT) -> None:
         """
@@ -78,7 +106,7 @@ class DoublyLinkedList(SinglyLinkedList[GT]):
         Args:
             val: the value to push in
         """
-        new_node = self.Node[GT](val)
+        new_node = self._new_node(val)
         if self.size:
             self.tail.next = new_node
             new_node.prev = self.tail
@@ -97,12 +125,204 @@ class DoublyLinkedList(SinglyLinkedList[GT]):
             The popped value or `None` if empty
         """
         if self.size:
-            val = self.tail.val
-            self.tail = self.tail.prev
+            node = self.tail
+            val = node.val
+            self.tail = node.prev
             if self.tail:
                 self.tail.next = None
             else:
                 self.head = None
             self.size -= 1
+            if self._finger is node:
+                self._set_finger(None, 0)
+            self._free_node(node)
             return val
         return None
+
+    def append_node(self, node: Node[GT]) -> None:
+        """
+        Link a node, which is not in any list, at the end of the list in O(1).
+
+        Args:
+            node: the node to link
+        """
+        node.next = None
+        node.prev = self.tail
+        if self.tail:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+        self.size += 1
+
+    def remove_node(self, node: Node[GT]) -> None:
+        """
+        Unlink a node of the list in O(1), without looking for its index.
+
+        Note:
+            The node is neither cleared nor recycled, so that it can be linked
+            again by `append_node()`, in this list or another one.
+
+        Args:
+            node: the node to unlink, which must be in the list
+        """
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+        self.size -= 1
+        # the index of the node is unknown, so the finger may have shifted
+        self._set_finger(None, 0)
+
+    def move_to_end(self, node: Node[GT]) -> None:
+        """
+        Move a node of the list to the end of the list in O(1).
+
+        Args:
+            node: the node to move, which must be in the list
+        """
+        if node is not self.tail:
+            self.remove_node(node)
+            self.append_node(node)
+
+    def _take_all(self, other: 'DoublyLinkedList[GT]'):
+        """
+        Take all the nodes of another list, leaving it empty.
+
+        Args:
+            other: the list to take the nodes from
+
+        Returns:
+            The head node, the tail node and the number of the nodes taken
+        """
+        nodes = other.head, other.tail, other.size
+        other.head = other.tail = None
+        other.size = 0
+        other._set_finger(None, 0)  # pylint: disable=protected-access
+        return nodes
+
+    def concat(self, other: 'DoublyLinkedList[GT]') -> None:
+        """
+        Move all the elements of another list to the end of this list in O(1),
+        by relinking the nodes.
+
+        Note:
+            The other list becomes empty.
+
+        Args:
+            other: the list to move the elements from
+        """
+        if other is self or not other.size:
+            return
+        head, tail, size = self._take_all(other)
+        if self.size:
+            self.tail.next = head
+            head.prev = self.tail
+        else:
+            self.head = head
+        self.tail = tail
+        self.size += size
+
+    def split_at(self, idx: int) -> Optional['DoublyLinkedList[GT]']:
+        """
+        Move the elements from the given index on into a new list, by cutting
+        the links before the node at the index.
+
+        Note:
+            Only the node at the index is walked to, from the closer end or the
+            finger, and no node is created.
+
+        Args:
+            idx: the index of the first element to move
+
+        Returns:
+            The new list of the moved elements or `None` if index not valid
+        """
+        if not 0 <= idx <= self.size:
+            return None
+        other = type(self)(self.pool_size)
+        if idx == self.size:
+            return other
+        node = self.node_at(idx)
+        other.head, other.tail = node, self.tail
+        other.size = self.size - idx
+        self.tail = node.prev
+        if self.tail:
+            self.tail.next = None
+        else:
+            self.head = None
+        node.prev = None
+        self.size = idx
+        self._set_finger(None, 0)
+        return other
+
+    def splice(self, idx: int, other: 'DoublyLinkedList[GT]') -> bool:
+        """
+        Move all the elements of another list into this list before the given
+        index, by relinking the nodes.
+
+        Note:
+            The other list becomes empty. Nothing will happen if the index is
+            not valid or the other list is this list.
+
+        Args:
+            idx: the index to insert the elements at
+            other: the list to move the elements from
+
+        Returns:
+            `True` if splice is successful or `False` otherwise
+        """
+        if other is self or not 0 <= idx <= self.size:
+            return False
+        if idx == self.size:
+            self.concat(other)
+            return True
+        succ = self.node_at(idx)
+        head, tail, size = self._take_all(other)
+        if not size:
+            return True
+        tail.next = succ
+        head.prev = succ.prev
+        if succ.prev:
+            succ.prev.next = head
+        else:
+            self.head = head
+        succ.prev = tail
+        self.size += size
+        self._shift_finger(idx, size)
+        return True
+
+    def sort(
+            self,
+            key: Optional[Callable[[GT], Any]] = None,
+            reverse: bool = False
+        ) -> None:
+        """
+        Sort the list in place by a stable bottom-up merge sort, which relinks
+        the existing nodes in O(n log n) with O(1) extra memory.
+
+        The merges only relink the next pointers, and the previous pointers
+        are fixed in a final pass.
+
+        Args:
+            key: the function to get the value to compare of each element, or
+                `None` to compare the elements themselves
+            reverse: `True` to sort in the descending order
+        """
+        super().sort(key, reverse)
+        prev_node = None
+        node = self.head
+        while node:
+            node.prev = prev_node
+            prev_node, node = node, node.next
+
+    def __reversed__(self) -> Iterator[GT]:
+        node = self.tail
+        while node:
+            yield node.val
+            node = node.prev
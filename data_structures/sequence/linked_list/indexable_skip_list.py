@@ -0,0 +1,312 @@
+"""Custom implementation of an indexable skip list.
+
+This module implements a skip list whose links record how many positions they
+skip, so that it can locate an element by its index in expected O(log n)
+instead of walking a linked list node by node. It has no practical usage but
+only serves as an data structure exercise.
+"""
+from random import Random
+from typing import TypeVar, Generic, Optional, Sequence, Iterator, List
+from ..custom_sequence import CustomSequence
+
+
+GT = TypeVar('GT')
+"""type: The generic type to represent the element type of the skip list."""
+
+
+class IndexableSkipList(CustomSequence[GT]):
+    """
+    `IndexableSkipList[T]()` -> an empty indexable skip list of type `T`.
+    `IndexableSkipList[T](p, max_level, seed)` -> an empty indexable skip list
+    of type `T` whose nodes go up a level with probability `p`, to at most
+    `max_level` levels, randomised from the given seed.
+
+    This is a custom implementation of an indexable skip list for learning
+    purpose. The elements are kept in order in a linked list, and each node
+    also links forwards on a random number of upper levels, every level
+    skipping more nodes than the one below it. Each link records its span, the
+    number of positions it moves forwards, so that a position is located by
+    taking the longest links not going past it from the top level down. A link
+    to nowhere spans to the end of the list.
+
+    The positional operations cost expected O(log n). Looking for a value still
+    scans the bottom level in O(n), as the values are not ordered.
+
+    Args:
+        p: the probability for a node to go up one more level
+        max_level: the maximum number of levels
+        seed: the seed of the random levels, or a random seed if not given
+
+    Attributes:
+        head (Node[T]): the sentinel node before the first element, which has
+            all the levels
+        level (int): the number of levels in use
+        size (int): the size of the skip list
+    """
+
+    class Node(Generic[GT]):
+        # pylint: disable=too-few-public-methods
+        """
+        The node structure for an indexable skip list, with a forward link and
+        its span on each of its levels.
+        """
+        __slots__ = ('val', 'next', 'span')
+
+        def __init__(self, val: GT, level: int):
+            self.val = val
+            self.next: List[Optional[IndexableSkipList.Node[GT]]] = \
+                [None] * level
+            self.span = [0] * level
+
+    def __init__(
+            self,
+            p: float = 0.5,
+            max_level: int = 32,
+            seed: Optional[int] = None
+        ):
+        super().__init__()
+        self.p = p
+        self.max_level = max_level
+        self._rand = Random(seed)
+        self.head = self.Node(None, max_level)
+        self.level = 1
+        self.size = 0
+
+    def _random_level(self) -> int:
+        """Draw the number of levels of a new node."""
+        level = 1
+        while level < self.max_level and self._rand.random() < self.p:
+            level += 1
+        return level
+
+    def _predecessors(self, idx: int):
+        """
+        Find the last node before the given index on each level.
+
+        Args:
+            idx: the index to look for
+
+        Returns:
+            The last node before the index on each level, and its position
+            where the head is at 0 and the element at index `i` at `i + 1`
+        """
+        prevs = [self.head] * self.max_level
+        ranks = [0] * self.max_level
+        node, pos = self.head, 0
+        for lvl in range(self.level - 1, -1, -1):
+            while node.next[lvl] and pos + node.span[lvl] <= idx:
+                pos += node.span[lvl]
+                node = node.next[lvl]
+            prevs[lvl] = node
+            ranks[lvl] = pos
+        return prevs, ranks
+
+    def get_head(self) -> Optional[Node[GT]]:
+        """
+        Get the first node of the skip list.
+
+        Returns:
+            The first node of the skip list or `None` if empty list
+        """
+        return self.head.next[0]
+
+    def node_at(self, idx: int) -> Optional[Node[GT]]:
+        """
+        Get the node at the given index in expected O(log n).
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The node at the given index or `None` if index not valid
+        """
+        if 0 <= idx < self.size:
+            node, pos = self.head, 0
+            for lvl in range(self.level - 1, -1, -1):
+                while node.next[lvl] and pos + node.span[lvl] <= idx + 1:
+                    pos += node.span[lvl]
+                    node = node.next[lvl]
+                if pos == idx + 1:
+                    return node
+        return None
+
+    def get_size(self) -> int:
+        """
+        Get the current size.
+
+        Returns:
+            The current size
+        """
+        return self.size
+
+    def index_of(self, val: GT) -> int:
+        """
+        Get the index of a value, or -1 if not found.
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the value or -1 if not found
+        """
+        for i, tmp in enumerate(self):
+            if tmp == val:
+                return i
+        return -1
+
+    def value_at(self, idx: int) -> Optional[GT]:
+        """
+        Get the value at the given index.
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The value at the given index or `None` if index not valid
+        """
+        node = self.node_at(idx)
+        return node.val if node else None
+
+    def insert_at(self, idx: int, val: GT) -> bool:
+        """
+        Insert a value at the given index.
+
+        Note:
+            The value will not be inserted if the index is not valid.
+
+        Args:
+            idx: the index to insert at
+            val: the value to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        if not 0 <= idx <= self.size:
+            return False
+        prevs, ranks = self._predecessors(idx)
+        level = self._random_level()
+        if level > self.level:
+            # the new levels start from the head with a link to nowhere
+            for lvl in range(self.level, level):
+                self.head.span[lvl] = self.size
+            self.level = level
+        node = self.Node(val, level)
+        for lvl in range(level):
+            prev = prevs[lvl]
+            # the number of positions from the previous node to the new node
+            dist = ranks[0] - ranks[lvl] + 1
+            node.next[lvl] = prev.next[lvl]
+            node.span[lvl] = prev.span[lvl] - dist + 1
+            prev.next[lvl] = node
+            prev.span[lvl] = dist
+        # the links above the new node skip one more position
+        for lvl in range(level, self.level):
+            prevs[lvl].span[lvl] += 1
+        self.size += 1
+        return True
+
+    def delete_at(self, idx: int) -> bool:
+        """
+        Delete an element at the given index.
+
+        Note:
+            The deletion will not perform if the index is not valid.
+
+        Args:
+            idx: the index to perform deletion
+
+        Returns:
+            `True` if deletion is successful or `False` otherwise
+        """
+        if not 0 <= idx < self.size:
+            return False
+        prevs, _ = self._predecessors(idx)
+        node = prevs[0].next[0]
+        for lvl in range(self.level):
+            prev = prevs[lvl]
+            if prev.next[lvl] is node:
+                prev.span[lvl] += node.span[lvl] - 1
+                prev.next[lvl] = node.next[lvl]
+            else:
+                prev.span[lvl] -= 1
+        while self.level > 1 and not self.head.next[self.level - 1]:
+            self.level -= 1
+        self.size -= 1
+        return True
+
+    def update_at(self, idx: int, val: GT) -> bool:
+        """
+        Update an element at the given index by the given value.
+
+        Note:
+            The update will not perform if the index is not valid.
+
+        Args:
+            idx: the index to update
+            val: the new value
+
+        Returns:
+            `True` if update is successful or `False` otherwise
+        """
+        node = self.node_at(idx)
+        if node:
+            node.val = val
+            return True
+        return False
+
+    def push(self, val: GT) -> None:
+        """
+        Push a value into the list's end.
+
+        Args:
+            val: the value to push in
+        """
+        self.insert_at(self.size, val)
+
+    def pop(self) -> Optional[GT]:
+        """
+        Pop a value out from the list's end and return the value.
+
+        Returns:
+            The popped value or `None` if empty
+        """
+        if self.size == 0:
+            return None
+        val = self.value_at(self.size - 1)
+        self.delete_at(self.size - 1)
+        return val
+
+    def traverse(self) -> Sequence[GT]:
+        """
+        Traverse all elements and return them in a list.
+
+        Returns:
+            A list containing all elements in order
+        """
+        return list(self)
+
+    def __iter__(self) -> Iterator[GT]:
+        node = self.head.next[0]
+        while node:
+            yield node.val
+            node = node.next[0]
+
+    def level_distribution(self) -> List[int]:
+        """
+        Count the nodes of each number of levels, to check the tuning of `p`
+        and `max_level`.
+
+        For a well tuned list, about a fraction `p` of the nodes with at least
+        `k` levels also have the level `k + 1`, and `max_level` is above
+        `log(n) / log(1 / p)`.
+
+        Returns:
+            The number of the nodes with `i + 1` levels at the index `i`, up to
+            the levels in use
+        """
+        counts = [0] * self.level
+        node = self.head.next[0]
+        while node:
+            counts[len(node.next) - 1] += 1
+            node = node.next[0]
+        return counts
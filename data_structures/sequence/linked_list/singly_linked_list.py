@@ -4,7 +4,8 @@ This module illustrates the foundation knowledge of a singly linked list by
 implementing it. It has no practical usage but only serves as an data structure
 exercise.
 """
-from typing import TypeVar, Optional, Sequence
+from operator import lt, gt
+from typing import TypeVar, Optional, Sequence, Iterator, Callable, Any
 from ..custom_sequence import CustomSequence
 from .custom_linked_list import LinkedListMixin
 
@@ -16,24 +17,34 @@ GT = TypeVar('GT')
 class SinglyLinkedList(LinkedListMixin[GT], CustomSequence[GT]):
     """
     `SinglyLinkedList[T]()` -> an empty singly linked list of type `T`
+    `SinglyLinkedList[T](pool_size)` -> an empty singly linked list of type `T`
+    which keeps up to `pool_size` deleted nodes for reuse
 
     This is a custom implementation of a singly linked list for learning
     purpose.
 
     The implementation uses the `Node` implemented inside `LinkedListMixin` as
-    the nodes in the list.
+    the nodes in the list. The list keeps a pointer to its tail node, so that a
+    push appends in O(1) instead of walking the whole list, and together with
+    `append_left()` and `pop_left()` at the head it can serve as a FIFO queue.
+
+    Args:
+        pool_size: the maximum number of the deleted nodes to keep for reuse,
+            0 to disable the recycling
 
     Attributes:
         head (Optional[Node[T]]): the head node of the singly linked list
+        tail (Optional[Node[T]]): the tail node of the singly linked list
         size (int): the size of the singly linked list
     """
 
     Node = LinkedListMixin.Node
     """type: An alias for the correspondent node type."""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, pool_size: int = 0):
+        super().__init__(pool_size)
         self.head = None
+        self.tail = None
         self.size = 0
 
     def get_size(self) -> int:
@@ -78,15 +89,22 @@ class SinglyLinkedList(LinkedListMixin[GT], CustomSequence[GT]):
         return node.val if node else None
 
     def _insert_head(self, val: GT) -> None:
-        new_head = self.Node[GT](val)
+        new_head = self._new_node(val)
         new_head.next = self.head
         self.head = new_head
+        if not new_head.next:
+            self.tail = new_head
         self.size += 1
+        self._shift_finger(0, 1)
 
     def _insert_after(self, val: GT, prev_node: Node[GT]) -> None:
-        new_node = self.Node[GT](val)
+        # the finger is at or before the previous node, got by `node_at()` or
+        # being the tail, so its index is unchanged
+        new_node = self._new_node(val)
         new_node.next = prev_node.next
         prev_node.next = new_node
+        if not new_node.next:
+            self.tail = new_node
         self.size += 1
 
     def insert_at(self, idx: int, val: GT) -> bool:
@@ -107,6 +125,10 @@ class SinglyLinkedList(LinkedListMixin[GT], CustomSequence[GT]):
         if idx == 0:
             self._insert_head(val)
             return True
+        # case to append after the tail, so no need to walk
+        if idx == self.size:
+            self._insert_after(val, self.tail)
+            return True
         # get the previous node if index is valid
         prev_node = self.node_at(idx - 1)
         # insert if there is a previous node
@@ -117,12 +139,23 @@ class SinglyLinkedList(LinkedListMixin[GT], CustomSequence[GT]):
         return False
 
     def _delete_head(self) -> None:
-        self.head = self.head.next
+        node = self.head
+        self.head = node.next
+        if not self.head:
+            self.tail = None
         self.size -= 1
+        self._shift_finger(0, -1)
+        self._free_node(node)
 
     def _delete_after(self, prev_node: Node[GT]) -> None:
-        prev_node.next = prev_node.next.next
+        # the finger is at or before the previous node, got by `node_at()`, so
+        # its index is unchanged
+        node = prev_node.next
+        prev_node.next = node.next
+        if not prev_node.next:
+            self.tail = prev_node
         self.size -= 1
+        self._free_node(node)
 
     def delete_at(self, idx: int) -> bool:
         """
@@ -172,16 +205,42 @@ class SinglyLinkedList(LinkedListMixin[GT], CustomSequence[GT]):
 
     def push(self, val: GT) -> None:
         """
-        Push a value into the list.
+        Push a value into the list's end in O(1).
 
         Args:
             val: the value to push in
         """
         self.insert_at(self.size, val)
 
+    def append_left(self, val: GT) -> None:
+        """
+        Push a value into the list's head in O(1).
+
+        Args:
+            val: the value to push in
+        """
+        self._insert_head(val)
+
+    def pop_left(self) -> Optional[GT]:
+        """
+        Pop a value out from the list's head in O(1) and return the value.
+
+        Returns:
+            The popped value or `None` if empty
+        """
+        if self.size == 0:
+            return None
+        val = self.head.val
+        self._delete_head()
+        return val
+
     def pop(self) -> Optional[GT]:
         """
-        Pop a value out from the list and return the value.
+        Pop a value out from the list's end and return the value.
+
+        Note:
+            The previous node of the tail can only be found by walking the
+            list, so a pop costs O(n), use `pop_left()` for a FIFO instead.
 
         Returns:
             The popped value or `None` if empty
@@ -200,6 +259,128 @@ class SinglyLinkedList(LinkedListMixin[GT], CustomSequence[GT]):
         self._delete_after(prev_node)
         return val
 
+    @staticmethod
+    def _cut(node: Node[GT], length: int) -> Optional[Node[GT]]:
+        """
+        Cut a chain of nodes after its first `length` nodes.
+
+        Args:
+            node: the first node of the chain
+            length: the number of nodes to keep in the chain
+
+        Returns:
+            The first node of the rest of the chain or `None` if none
+        """
+        for _ in range(length - 1):
+            if not node.next:
+                return None
+            node = node.next
+        rest = node.next
+        node.next = None
+        return rest
+
+    @staticmethod
+    def _merge(
+            left: Optional[Node[GT]],
+            right: Optional[Node[GT]],
+            prev_node: Node[GT],
+            before: Callable[[GT, GT], bool]
+        ) -> Node[GT]:
+        """
+        Merge two sorted chains of nodes after the given node, taking the left
+        node on ties so that the merge is stable.
+
+        Args:
+            left: the first node of the left chain
+            right: the first node of the right chain
+            prev_node: the node to link the merged chain after
+            before: the function to check if a value goes strictly before
+                another one
+
+        Returns:
+            The last node of the merged chain
+        """
+        while left and right:
+            if before(right.val, left.val):
+                prev_node.next, right = right, right.next
+            else:
+                prev_node.next, left = left, left.next
+            prev_node = prev_node.next
+        prev_node.next = left or right
+        while prev_node.next:
+            prev_node = prev_node.next
+        return prev_node
+
+    def sort(
+            self,
+            key: Optional[Callable[[GT], Any]] = None,
+            reverse: bool = False
+        ) -> None:
+        """
+        Sort the list in place by a stable bottom-up merge sort, which relinks
+        the existing nodes in O(n log n) with O(1) extra memory.
+
+        The sorted runs of 1, 2, 4... nodes are merged pairwise in passes over
+        the list, until a pass merges the whole list at once.
+
+        Args:
+            key: the function to get the value to compare of each element, or
+                `None` to compare the elements themselves
+            reverse: `True` to sort in the descending order
+        """
+        compare = gt if reverse else lt
+        before = compare if not key else \
+            lambda val_a, val_b: compare(key(val_a), key(val_b))
+
+        # a dummy node before the head, so that the head is relinked like
+        # any other node
+        dummy = self.Node(None)
+        dummy.next = self.head
+        width = 1
+        while True:
+            node = dummy.next
+            prev_node = dummy
+            n_merges = 0
+            while node:
+                left = node
+                right = self._cut(left, width)
+                node = self._cut(right, width) if right else None
+                prev_node = self._merge(left, right, prev_node, before)
+                n_merges += 1
+            if n_merges <= 1:
+                break
+            width *= 2
+        self.head = dummy.next
+        self.tail = prev_node if self.head else None
+        self._set_finger(None, 0)
+
+    def dedupe_sorted(
+            self, key: Optional[Callable[[GT], Any]] = None
+        ) -> int:
+        """
+        Delete the elements equal to their previous ones in O(n), which leaves
+        each element only once in a sorted list.
+
+        Args:
+            key: the function to get the value to compare of each element, or
+                `None` to compare the elements themselves
+
+        Returns:
+            The number of the deleted elements
+        """
+        # the finger may be after the deleted nodes
+        self._set_finger(None, 0)
+        n_deleted = 0
+        node = self.head
+        while node and node.next:
+            if (key(node.val) == key(node.next.val)) if key else \
+                    node.val == node.next.val:
+                self._delete_after(node)
+                n_deleted += 1
+            else:
+                node = node.next
+        return n_deleted
+
     def traverse(self) -> Sequence[GT]:
         """
         Traverse all elements and return them in a list.
@@ -213,3 +394,14 @@ class SinglyLinkedList(LinkedListMixin[GT], CustomSequence[GT]):
             ret.append(node.val)
             node = node.next
         return ret
+
+    def __iter__(self) -> Iterator[GT]:
+        node = self.head
+        while node:
+            yield node.val
+            node = node.next
+
+    def __reversed__(self) -> Iterator[GT]:
+        # a singly linked list can only be walked forwards, so the values are
+        # collected in one pass before being yielded backwards
+        return reversed(self.traverse())
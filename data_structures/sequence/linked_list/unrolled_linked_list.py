@@ -0,0 +1,309 @@
+"""Custom implementation of an unrolled linked list.
+
+This module implements a doubly linked list whose nodes each hold a small array
+of values instead of a single one, so that it takes fewer objects and pointers
+per element and walks a whole block of values per node. It has no practical
+usage but only serves as an data structure exercise.
+"""
+from typing import TypeVar, Generic, Optional, Sequence, Iterator, List, \
+    Tuple
+from ..custom_sequence import CustomSequence
+
+
+GT = TypeVar('GT')
+"""type: The generic type to represent the element type of the linked list."""
+
+
+class UnrolledLinkedList(CustomSequence[GT]):
+    """
+    `UnrolledLinkedList[T]()` -> an empty unrolled linked list of type `T`.
+    `UnrolledLinkedList[T](capacity)` -> an empty unrolled linked list of type
+    `T` whose nodes hold at most `capacity` values.
+
+    This is a custom implementation of an unrolled linked list for learning
+    purpose. The elements are stored in order in the blocks of the nodes, each
+    a list of at most `capacity` values, and the nodes are doubly linked. An
+    index is located by walking the nodes from the closer end and skipping
+    their blocks, so a positional operation costs O(n / capacity + capacity).
+
+    A full block splits in halves on an insertion, except at the end of the
+    list where a push starts a new block to keep the blocks full. A block below
+    half full after a deletion merges with the next block if they fit in one,
+    or borrows values from it otherwise, so that all the blocks but the last
+    one stay at least half full.
+
+    Args:
+        capacity: the maximum number of values in a block
+
+    Attributes:
+        head (Optional[Node[T]]): the first node of the linked list
+        tail (Optional[Node[T]]): the last node of the linked list
+        size (int): the size of the linked list
+        capacity (int): the maximum number of values in a block
+    """
+
+    class Node(Generic[GT]):
+        # pylint: disable=too-few-public-methods
+        """
+        The node structure for an unrolled linked list, holding a block of
+        values.
+        """
+        __slots__ = ('vals', 'next', 'prev')
+
+        def __init__(self, vals: List[GT]):
+            self.vals = vals
+            self.next = None
+            self.prev = None
+
+    _DEFAULT_CAPACITY: int = 64
+    """The default maximum number of values in a block."""
+
+    def __init__(self, capacity: int = _DEFAULT_CAPACITY):
+        super().__init__()
+        self.capacity = max(capacity, 2)
+        self.head = None
+        self.tail = None
+        self.size = 0
+
+    def _link_after(self, node: Optional[Node[GT]], new: Node[GT]) -> None:
+        """Link a new node after the given node, or as the head if `None`."""
+        new.prev = node
+        new.next = node.next if node else self.head
+        if new.next:
+            new.next.prev = new
+        else:
+            self.tail = new
+        if node:
+            node.next = new
+        else:
+            self.head = new
+
+    def _unlink(self, node: Node[GT]) -> None:
+        """Remove the given node from the linked list."""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+
+    def _locate(self, idx: int) -> Tuple[Node[GT], int]:
+        """
+        Find the node holding the given valid index, walking from the closer
+        end.
+
+        Args:
+            idx: the index to locate
+
+        Returns:
+            The node and the offset of the index in its block
+        """
+        if idx < self.size // 2:
+            node = self.head
+            while idx >= len(node.vals):
+                idx -= len(node.vals)
+                node = node.next
+            return node, idx
+        # the number of values from the index to the end
+        idx = self.size - idx
+        node = self.tail
+        while idx > len(node.vals):
+            idx -= len(node.vals)
+            node = node.prev
+        return node, len(node.vals) - idx
+
+    def _rebalance(self, node: Node[GT]) -> None:
+        """
+        Merge or refill a block after a deletion if it is below half full.
+
+        Args:
+            node: the node whose block lost a value
+        """
+        if len(node.vals) >= self.capacity // 2:
+            return
+        nxt = node.next
+        if nxt:
+            if len(node.vals) + len(nxt.vals) <= self.capacity:
+                node.vals.extend(nxt.vals)
+                self._unlink(nxt)
+            else:
+                # borrow values so that both blocks are at least half full
+                n_moved = (len(nxt.vals) - len(node.vals)) // 2
+                node.vals.extend(nxt.vals[:n_moved])
+                del nxt.vals[:n_moved]
+        elif node.prev and \
+                len(node.prev.vals) + len(node.vals) <= self.capacity:
+            node.prev.vals.extend(node.vals)
+            self._unlink(node)
+        elif not node.vals:
+            self._unlink(node)
+
+    def get_size(self) -> int:
+        """
+        Get the current size.
+
+        Returns:
+            The current size
+        """
+        return self.size
+
+    def index_of(self, val: GT) -> int:
+        """
+        Get the index of a value, or -1 if not found.
+
+        Args:
+            val: the value to look for
+
+        Returns:
+            The index of the value or -1 if not found
+        """
+        i = 0
+        node = self.head
+        while node:
+            if val in node.vals:
+                return i + node.vals.index(val)
+            i += len(node.vals)
+            node = node.next
+        return -1
+
+    def value_at(self, idx: int) -> Optional[GT]:
+        """
+        Get the value at the given index.
+
+        Args:
+            idx: the index to fetch
+
+        Returns:
+            The value at the given index or `None` if index not valid
+        """
+        if 0 <= idx < self.size:
+            node, offset = self._locate(idx)
+            return node.vals[offset]
+        return None
+
+    def insert_at(self, idx: int, val: GT) -> bool:
+        """
+        Insert a value at the given index.
+
+        Note:
+            The value will not be inserted if the index is not valid.
+
+        Args:
+            idx: the index to insert at
+            val: the value to insert
+
+        Returns:
+            `True` if insertion is successful or `False` otherwise
+        """
+        if idx == self.size:
+            self.push(val)
+            return True
+        if 0 <= idx < self.size:
+            node, offset = self._locate(idx)
+            if len(node.vals) == self.capacity:
+                half = self.capacity // 2
+                self._link_after(node, self.Node(node.vals[half:]))
+                del node.vals[half:]
+                if offset > half:
+                    node, offset = node.next, offset - half
+            node.vals.insert(offset, val)
+            self.size += 1
+            return True
+        return False
+
+    def delete_at(self, idx: int) -> bool:
+        """
+        Delete an element at the given index.
+
+        Note:
+            The deletion will not perform if the index is not valid.
+
+        Args:
+            idx: the index to perform deletion
+
+        Returns:
+            `True` if deletion is successful or `False` otherwise
+        """
+        if 0 <= idx < self.size:
+            node, offset = self._locate(idx)
+            del node.vals[offset]
+            self.size -= 1
+            self._rebalance(node)
+            return True
+        return False
+
+    def update_at(self, idx: int, val: GT) -> bool:
+        """
+        Update an element at the given index by the given value.
+
+        Note:
+            The update will not perform if the index is not valid.
+
+        Args:
+            idx: the index to update
+            val: the new value
+
+        Returns:
+            `True` if update is successful or `False` otherwise
+        """
+        if 0 <= idx < self.size:
+            node, offset = self._locate(idx)
+            node.vals[offset] = val
+            return True
+        return False
+
+    def push(self, val: GT) -> None:
+        """
+        Push a value into the list's end.
+
+        Args:
+            val: the value to push in
+        """
+        if self.tail and len(self.tail.vals) < self.capacity:
+            self.tail.vals.append(val)
+        else:
+            self._link_after(self.tail, self.Node([val]))
+        self.size += 1
+
+    def pop(self) -> Optional[GT]:
+        """
+        Pop a value out from the list's end and return the value.
+
+        Returns:
+            The popped value or `None` if empty
+        """
+        if self.size == 0:
+            return None
+        val = self.tail.vals.pop()
+        if not self.tail.vals:
+            self._unlink(self.tail)
+        self.size -= 1
+        return val
+
+    def traverse(self) -> Sequence[GT]:
+        """
+        Traverse all elements and return them in a list.
+
+        Returns:
+            A list containing all elements in order
+        """
+        ret = []
+        node = self.head
+        while node:
+            ret.extend(node.vals)
+            node = node.next
+        return ret
+
+    def __iter__(self) -> Iterator[GT]:
+        node = self.head
+        while node:
+            yield from node.vals
+            node = node.next
+
+    def __reversed__(self) -> Iterator[GT]:
+        node = self.tail
+        while node:
+            yield from reversed(node.vals)
+            node = node.prev
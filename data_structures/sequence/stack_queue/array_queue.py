@@ -5,7 +5,7 @@ fixed length array. The implementation does not use Python's language advantages
 and looks dumb, because it only serves as an data structure exercise and has no
 practical usage.
 """
-from typing import TypeVar, Optional, Sequence
+from typing import TypeVar, Optional, Sequence, Iterable, List
 from .custom_stack_queue import CustomQueue
 from .size_mixin import SizeMixin
 
@@ -21,24 +21,73 @@ class ArrayQueue(SizeMixin, CustomQueue[GT]):
     This is a custom implementation of a queue based on an array for learning
     purpose. This implementation uses a list to mimic a fixed length array to
     store data. Only the creation of a list of given length and the
-    access/assignment of element by index/subscription are permitted.
+    access/assignment of element by index/subscription are permitted, plus the
+    slice copies for the bulk operations.
 
     To save space, the technique of circular array has been applied in the
-    implementation.
+    implementation. The length of the internal list is always a power of two,
+    so that a position wraps around by masking its low bits instead of a
+    modulo. The values of a batch are contiguous in the circular array except
+    at most one wrap-around, so `push_many()`, `pop_many()` and `peek_many()`
+    move them by at most two slice copies, and so does a resize.
 
     Attributes:
         data (List[Optional[GT]]): the list to store data
+        head (int): the position of the first value in the list
+        mask (int): the length of the list minus 1, to wrap the positions
         size (int): the current size of the queue
     """
 
     BASE_SIZE = 8
-    """The starting size of the internal list."""
+    """The starting size of the internal list, a power of two."""
 
     def __init__(self):
         super().__init__()
         self.data = [None] * self.BASE_SIZE
         self.head = 0
-        self.tail = -1
+        self.mask = self.BASE_SIZE - 1
+
+    def _segments(self, start: int, length: int):
+        """
+        Split a run of positions of the circular array into at most two
+        contiguous slices of the list.
+
+        Args:
+            start: the position of the first value of the run
+            length: the number of values in the run
+
+        Returns:
+            The slice from the start to the end of the list or of the run, and
+            the slice from the beginning of the list for the wrapped values
+        """
+        first = min(length, len(self.data) - start)
+        return slice(start, start + first), slice(0, length - first)
+
+    def _resize(self, capacity: int) -> None:
+        """
+        Move the values into a new internal list of the given length, from its
+        beginning, by at most two slice copies.
+
+        Args:
+            capacity: the length of the new list, a power of two
+        """
+        tmp = [None] * capacity
+        seg_a, seg_b = self._segments(self.head, self.size)
+        first = seg_a.stop - seg_a.start
+        tmp[:first] = self.data[seg_a]
+        tmp[first:self.size] = self.data[seg_b]
+        self.data = tmp
+        self.head = 0
+        self.mask = capacity - 1
+
+    def _shrink(self) -> None:
+        """Halve the internal list while at most a quarter of it is used, down
+        to the starting size, and reset the head to its start if resized."""
+        capacity = len(self.data)
+        while capacity > self.BASE_SIZE and self.size <= capacity // 4:
+            capacity //= 2
+        if capacity != len(self.data):
+            self._resize(capacity)
 
     def push(self, val: GT) -> None:
         """Push a value into the end of the queue.
@@ -49,17 +98,31 @@ class ArrayQueue(SizeMixin, CustomQueue[GT]):
         # double the size of the storage array if it's full and
         # reset the head to the start of array during array doubling
         if self.size == len(self.data):
-            tmp = [None] * (len(self.data) * 2)
-            for i in range(self.size):
-                tmp[i] = self.data[(self.head + i) % len(self.data)]
-            self.data = tmp
-            self.head = 0
-            self.tail = self.size - 1
+            self._resize(len(self.data) * 2)
         # push value into the circular array
-        self.tail = (self.tail + 1) % len(self.data)
-        self.data[self.tail] = val
+        self.data[(self.head + self.size) & self.mask] = val
         self.size += 1
 
+    def push_many(self, vals: Iterable[GT]) -> None:
+        """Push all the given values into the end of the queue in order, by at
+        most two slice copies.
+
+        Args:
+            vals: the values to push in
+        """
+        vals = list(vals)
+        capacity = len(self.data)
+        while capacity < self.size + len(vals):
+            capacity *= 2
+        if capacity != len(self.data):
+            self._resize(capacity)
+        seg_a, seg_b = self._segments(
+            (self.head + self.size) & self.mask, len(vals))
+        first = seg_a.stop - seg_a.start
+        self.data[seg_a] = vals[:first]
+        self.data[seg_b] = vals[first:]
+        self.size += len(vals)
+
     def pop(self) -> Optional[GT]:
         """Pop a value out from the start of the queue.
 
@@ -71,27 +134,65 @@ class ArrayQueue(SizeMixin, CustomQueue[GT]):
             return None
         # retrieve value and decrease size
         val = self.data[self.head]
-        self.head = (self.head + 1) % len(self.data)
+        self.data[self.head] = None
+        self.head = (self.head + 1) & self.mask
         self.size -= 1
-        # reset head and tail if no more stored value
+        # reset head if no more stored value
         if self.size == 0:
             self.head = 0
-            self.tail = -1
-        # shrink the circular array if too many empty slots and
-        # reset the head to the start of array during array doubling
-        elif self.BASE_SIZE < self.size <= len(self.data) // 4:
-            tmp = [None] * (len(self.data) // 2)
-            for i in range(self.size):
-                tmp[i] = self.data[(self.head + i) % len(self.data)]
-            self.data = tmp
-            self.head = 0
-            self.tail = self.size - 1
+        # shrink the circular array if too many empty slots
+        self._shrink()
         return val
 
+    def pop_many(self, k: int) -> List[GT]:
+        """Pop at most `k` values out from the start of the queue, by at most
+        two slice copies.
+
+        Args:
+            k: the maximum number of values to pop
+
+        Returns:
+            A Python `list` of the popped values in order, shorter than `k` if
+            not enough values in the queue
+        """
+        vals = self.peek_many(k)
+        seg_a, seg_b = self._segments(self.head, len(vals))
+        # clear the popped slots so that the queue does not keep them alive
+        self.data[seg_a] = [None] * (seg_a.stop - seg_a.start)
+        self.data[seg_b] = [None] * seg_b.stop
+        self.head = (self.head + len(vals)) & self.mask
+        self.size -= len(vals)
+        if self.size == 0:
+            self.head = 0
+        self._shrink()
+        return vals
+
+    def peek(self) -> Optional[GT]:
+        """Get the value at the start of the queue without popping it.
+
+        Returns:
+            The first value or `None` if an empty queue
+        """
+        return self.data[self.head] if self.size else None
+
+    def peek_many(self, k: int) -> List[GT]:
+        """Get at most `k` values at the start of the queue without popping
+        them, by at most two slice copies.
+
+        Args:
+            k: the maximum number of values to get
+
+        Returns:
+            A Python `list` of the first values in order, shorter than `k` if
+            not enough values in the queue
+        """
+        seg_a, seg_b = self._segments(self.head, max(0, min(k, self.size)))
+        return self.data[seg_a] + self.data[seg_b]
+
     def traverse(self) -> Sequence[GT]:
         """Traverse all values in the queue and return as a Python `list`.
 
         Returns:
             A Python `list` containing all values in the queue
         """
-        return [self.data[(self.head + i) % len(self.data)] for i in range(self.size)]
+        return self.peek_many(self.size)
@@ -39,7 +39,7 @@ class LinkedMixin(Generic[GT]):
         Args:
             val: the value to push in
         """
-        node = self.Node[GT](val)
+        node = self.Node(val)
         if self.size:
             self.tail.next = node
             node.prev = self.tail
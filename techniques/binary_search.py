@@ -281,3 +281,68 @@ class BinarySearch(Generic[T]):
             else:
                 j = mid - 1
         return -1
+
+    @staticmethod
+    def search_insertion_left(
+            seq: Sequence[T],
+            val: T,
+            comparer: Callable[[T, T], bool] = lambda a, b: a - b
+        ) -> int:
+        """Binary search for the position to insert a value into an ordered
+        list permitting repeating element, before all the elements equal to the
+        value. It is the count of the elements less than the value as well.
+
+        This implementation uses an exclusive right boundary, as the position
+        after the last element is a valid result.
+
+        Args:
+            seq: a list to search in
+            val: the value to insert
+            comparer: the function to compare the element in the list and the
+                target value
+
+        Returns:
+            The index of the first element not less than the value, or the
+            length of the list if there is no such element
+        """
+        i, j = 0, len(seq)
+        while i < j:
+            mid = (i + j) // 2
+            if comparer(seq[mid], val) < 0:
+                i = mid + 1
+            else:
+                j = mid
+        return i
+
+    @staticmethod
+    def search_insertion_right(
+            seq: Sequence[T],
+            val: T,
+            comparer: Callable[[T, T], bool] = lambda a, b: a - b
+        ) -> int:
+        """Binary search for the position to insert a value into an ordered
+        list permitting repeating element, after all the elements equal to the
+        value. It is the count of the elements not greater than the value as
+        well.
+
+        This implementation uses an exclusive right boundary, as the position
+        after the last element is a valid result.
+
+        Args:
+            seq: a list to search in
+            val: the value to insert
+            comparer: the function to compare the element in the list and the
+                target value
+
+        Returns:
+            The index of the first element greater than the value, or the
+            length of the list if there is no such element
+        """
+        i, j = 0, len(seq)
+        while i < j:
+            mid = (i + j) // 2
+            if comparer(seq[mid], val) <= 0:
+                i = mid + 1
+            else:
+                j = mid
+        return i
@@ -7,7 +7,7 @@ in the unit tests of the custom implementations of the sequence-like data
 structures.
 """
 from enum import Enum
-from typing import TypeVar, Optional, List, Any
+from typing import TypeVar, Optional, List, Any, Iterable
 from data_structures.sequence import CustomSequence
 
 
@@ -102,6 +102,31 @@ class RefArray(CustomSequence[GT]):
         self.delete_at(len(self.data) - 1)
         return val
 
+    def extend(self, vals: Iterable[GT]) -> bool:
+        return self.insert_many(len(self.data), vals)
+
+    def insert_many(self, idx: int, vals: Iterable[GT]) -> bool:
+        vals = list(vals)
+        if self.max_size and len(self.data) + len(vals) > self.max_size:
+            return False
+        if 0 <= idx <= len(self.data):
+            self.data[idx:idx] = vals
+            return True
+        return False
+
+    def delete_range(self, lo: int, hi: int) -> bool:
+        if 0 <= lo <= hi <= len(self.data):
+            self.data[lo:hi] = []
+            return True
+        return False
+
+    def update_range(self, lo: int, vals: Iterable[GT]) -> bool:
+        vals = list(vals)
+        if 0 <= lo and lo + len(vals) <= len(self.data):
+            self.data[lo:lo + len(vals)] = vals
+            return True
+        return False
+
     def __eq__(self, value: Any) -> bool:
         """
         Overwritten to permit the comparison in format [RefArray == Array]. It
@@ -109,5 +134,5 @@ class RefArray(CustomSequence[GT]):
         """
         if isinstance(value, CustomSequence):
             return len(self.data) == value.get_size() and \
-                self.data == value.traverse()
+                self.data == list(value.traverse())
         return super().__eq__(value)
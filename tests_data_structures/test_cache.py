@@ -0,0 +1,170 @@
+"""Test suite for the sub classes of the CustomCache abstract base class.
+
+These sub classes are the custom implementations of the caches. Each cache is
+tested against a naive reference implementation of the same eviction policy,
+which finds the entry to evict by a linear scan, by comparing the results of
+the operations, the cached keys and the counters after each operation.
+"""
+from random import randint
+import pytest
+from data_structures.cache import CustomCache, LRUCache, LFUCache, memoize
+
+
+class RefCache():
+    """
+    The naive reference cache, which evicts the entry of the smallest rank, the
+    rank being the time of the last use for LRU, or the number of uses then the
+    time of the last use for LFU.
+    """
+
+    def __init__(self, capacity, size_of, lfu):
+        self.capacity = capacity
+        self.size_of = size_of or (lambda _: 1)
+        self.lfu = lfu
+        self.entries = {}
+        self.time = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def _use(self, key, freq):
+        self.time += 1
+        val = self.entries[key][0]
+        self.entries[key] = (val, freq, self.time)
+
+    def _weight(self):
+        return sum(self.size_of(val) for val, _, _ in self.entries.values())
+
+    def _evict(self):
+        key = min(self.entries, key=lambda k: (
+            self.entries[k][1] if self.lfu else 0, self.entries[k][2]))
+        del self.entries[key]
+        self.evictions += 1
+
+    def get(self, key):
+        if key not in self.entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._use(key, self.entries[key][1] + 1)
+        return self.entries[key][0]
+
+    def put(self, key, val):
+        weight = self.size_of(val)
+        freq = 1
+        if key in self.entries:
+            # an update keeps the entry while evicting the others
+            freq = self.entries.pop(key)[1] + 1
+        if weight > self.capacity:
+            return
+        while self._weight() + weight > self.capacity:
+            self._evict()
+        self.entries[key] = (val, freq, 0)
+        self._use(key, freq)
+
+
+class TestCache():
+    """
+    The test suite class for the subclasses of CustomCache.
+    """
+
+    @staticmethod
+    def _check_same(cache: CustomCache, ref: RefCache):
+        assert cache.get_size() == len(cache) == len(ref.entries)
+        for key in ref.entries:
+            assert key in cache
+        assert cache.weight == ref._weight()  # pylint: disable=protected-access
+        assert cache.weight <= cache.capacity
+        assert (cache.hits, cache.misses, cache.evictions) == \
+            (ref.hits, ref.misses, ref.evictions)
+
+    @pytest.mark.parametrize(
+        'cls,lfu',
+        [(LRUCache, False), (LFUCache, True)],
+    )
+    @pytest.mark.parametrize(
+        'capacity,size_of',
+        [(1, None), (8, None), (64, None), (32, lambda val: val % 10)],
+    )
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_cache(self, cls, lfu, capacity, size_of, n_ops: int):
+        """
+        Test the correctness of the caches against the reference cache.
+        """
+        cache = cls(capacity, size_of)
+        ref = RefCache(capacity, size_of, lfu)
+        for _ in range(n_ops):
+            key = randint(0, capacity * 2)
+            op = randint(0, 5)
+            if op < 3:
+                assert cache.get(key) == ref.get(key)
+            elif op < 5:
+                val = randint(0, 100)
+                cache.put(key, val)
+                ref.put(key, val)
+            else:
+                assert cache.delete(key) == (key in ref.entries)
+                ref.entries.pop(key, None)
+            self._check_same(cache, ref)
+
+    @pytest.mark.parametrize(
+        'cls,lfu',
+        [(LRUCache, False), (LFUCache, True)],
+    )
+    def test_update_while_full(self, cls, lfu):
+        """
+        Test updating a stored key of a full cache evicts only the others.
+        """
+        cache = cls(4, lambda val: val)
+        ref = RefCache(4, lambda val: val, lfu)
+        ops = [
+            ('put', 'a', 1), ('put', 'b', 1), ('put', 'c', 2),
+            ('get', 'b'), ('get', 'b'), ('get', 'c'),
+            # the entry of 'a' is alone at the lowest frequency
+            ('put', 'a', 3), ('get', 'a'),
+            ('put', 'd', 1), ('put', 'd', 4), ('get', 'd'), ('get', 'a'),
+        ]
+        for op, key, *val in ops:
+            if op == 'put':
+                cache.put(key, *val)
+                ref.put(key, *val)
+                assert key in cache
+            else:
+                assert cache.get(key) == ref.get(key)
+            self._check_same(cache, ref)
+        assert cache.get('d') == 4 and len(cache) == 1
+
+    @pytest.mark.parametrize(
+        'cls',
+        [LRUCache, LFUCache],
+    )
+    def test_memoize(self, cls):
+        """
+        Test memoizing a function by the caches.
+        """
+        calls = []
+
+        @memoize(cls(64))
+        def fib(n: int, scale: int = 1):
+            calls.append(n)
+            return n * scale if n < 2 else fib(n - 1, scale=scale) + \
+                fib(n - 2, scale=scale)
+
+        assert fib(30) == 832040
+        # each argument is computed once
+        assert sorted(calls) == list(range(31))
+        assert fib.cache.hits == 28 and fib.cache.misses == 31
+        assert fib(30) == 832040 and len(calls) == 31
+        assert fib(10, scale=2) == 110
+        assert fib.__name__ == 'fib'
+
+        # None is a cached value
+        @memoize(cls(4))
+        def nothing(_):
+            calls.append(None)
+
+        calls.clear()
+        nothing(1)
+        nothing(1)
+        assert calls == [None]
@@ -9,10 +9,16 @@ is imported to test the correctness of the above custom implementations by
 comparing the results of the operations and the stored data after each
 operation. The results and stored data should always be the same.
 """
+import os
+import struct
 from random import choice, randint
+from bisect import bisect_left, bisect_right, insort
 import pytest
 from data_structures.sequence import FixedArray, DynamicArray, \
-    SinglyLinkedList, DoublyLinkedList
+    TypedDynamicArray, IncrementalDynamicArray, IndexedDynamicArray, \
+    SortedArray, SparseArray, BitArray, PersistentArray, GrowthPolicy, \
+    GapBuffer, ChunkedSequence, MmapFixedArray, SinglyLinkedList, \
+    DoublyLinkedList, IndexableSkipList, UnrolledLinkedList, ArenaLinkedList
 from .ref_array import RefArray, Op
 
 
@@ -88,7 +94,7 @@ class TestSequenceImpl():
 
     @staticmethod
     def _check_op_traverse(arr, alt):
-        assert arr.traverse() == alt.traverse()
+        assert list(arr.traverse()) == alt.traverse()
 
     @staticmethod
     def _check_op_push(arr, alt, i):
@@ -129,6 +135,29 @@ class TestSequenceImpl():
             # check two array implementations are same after any operation
             assert alt == arr
 
+    @staticmethod
+    def _check_bulk_ops_randomly(arr, alt, n_ops, max_batch=8):
+        # list of bulk operations to test
+        ops = ['extend', 'insert_many', 'delete_range', 'update_range']
+        for i in range(n_ops):
+            op_to_check = choice(ops)
+            size = alt.get_size()
+            vals = list(range(i, i + randint(0, max_batch)))
+            if op_to_check == 'extend':
+                assert arr.extend(vals) == alt.extend(vals)
+            elif op_to_check == 'insert_many':
+                idx = randint(-1, size + 1)
+                assert arr.insert_many(idx, vals) == alt.insert_many(idx, vals)
+            elif op_to_check == 'delete_range':
+                lo = randint(-1, size + 1)
+                hi = randint(lo - 1, lo + max_batch)
+                assert arr.delete_range(lo, hi) == alt.delete_range(lo, hi)
+            elif op_to_check == 'update_range':
+                lo = randint(-1, size)
+                assert arr.update_range(lo, vals) == alt.update_range(lo, vals)
+            # check two array implementations are same after any operation
+            assert alt == arr
+
     @pytest.mark.parametrize(
         'max_size',
         [1, 4, 16],
@@ -148,6 +177,166 @@ class TestSequenceImpl():
         # randomly test the operations
         self._check_op_randomly(arr, alt, n_ops, max_size)
 
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_persistent_array(self, n_ops: int):
+        """
+        Test the correctness of the PersistentArray class and its snapshots.
+        """
+        arr = PersistentArray[int]()
+        alt = RefArray()
+        self._check_op_randomly(arr, alt, n_ops)
+        # the snapshots never see the later writes
+        snaps = []
+        for i in range(n_ops):
+            if i % (n_ops // 10) == 0:
+                snaps.append((arr.snapshot(), list(alt.traverse())))
+            if randint(0, 2):
+                self._check_op_push(arr, alt, i)
+            else:
+                self._check_op_pop(arr, alt)
+            if arr.get_size() > 0:
+                # an update copies at most the nodes on the path to the value
+                copies = arr.copy_count
+                idx = randint(0, arr.get_size() - 1)
+                assert arr.update_at(idx, -i) == alt.update_at(idx, -i)
+                assert arr.copy_count - copies <= arr.shift // 5 + 1
+        assert alt == arr
+        for snap, vals in snaps:
+            assert snap.traverse() == vals
+        # a snapshot can be written without changing the array
+        snap, vals = snaps[-1]
+        snap.push(-1)
+        snap.delete_at(0)
+        assert snap.traverse() == vals[1:] + [-1]
+        assert alt == arr
+
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_bit_array(self, n_ops: int):
+        """
+        Test the correctness of the BitArray class against a list of booleans.
+        """
+        arr = BitArray(n_ops // 2)
+        ref = []
+        for i in range(n_ops):
+            val = bool(randint(0, 1))
+            idx = randint(-1, len(ref) + 1)
+            op = randint(0, 4)
+            if op < 2:
+                ret = 0 <= idx <= len(ref) < n_ops // 2
+                assert arr.insert_at(idx, val) == ret
+                if ret:
+                    ref.insert(idx, val)
+            elif op < 3:
+                ret = 0 <= idx < len(ref)
+                assert arr.delete_at(idx) == ret
+                if ret:
+                    del ref[idx]
+            elif op < 4:
+                ret = 0 <= idx < len(ref)
+                assert arr.update_at(idx, val) == ret
+                if ret:
+                    ref[idx] = val
+            else:
+                assert arr.pop() == (ref.pop() if ref else None)
+            assert arr.get_size() == len(ref)
+            assert arr.value_at(idx) == \
+                (ref[idx] if 0 <= idx < len(ref) else None)
+            assert arr.index_of(val) == \
+                (ref.index(val) if val in ref else -1)
+            if i % 10 == 0:
+                assert arr.traverse() == ref
+                assert list(reversed(arr)) == ref[::-1]
+                assert arr.popcount() == sum(ref)
+                assert arr.find_first_set() == arr.index_of(True)
+                assert arr.rank(idx) == sum(ref[:max(idx, 0)])
+                ones = [j for j, bit in enumerate(ref) if bit]
+                k = randint(0, len(ones))
+                assert arr.select(k) == (ones[k] if k < len(ones) else -1)
+        assert arr.index_of(None) == arr.index_of(2) == -1
+        # the searches and the counts over many cleared chunks
+        big = BitArray(n_ops * 10)
+        for _ in range(n_ops * 10):
+            big.push(False)
+        assert big.find_first_set() == big.select(0) == -1
+        ones = sorted({randint(0, n_ops * 10 - 1) for _ in range(5)})
+        for j in ones:
+            big.update_at(j, True)
+        assert big.find_first_set() == ones[0]
+        assert [big.select(k) for k in range(len(ones) + 1)] == ones + [-1]
+        assert [big.rank(j) for j in ones] == list(range(len(ones)))
+        assert big.popcount() == len(ones)
+        assert (~big).index_of(False) == big.index_of(True) == ones[0]
+        # the bitwise operators
+        other = BitArray(n_ops)
+        ref_other = [bool(randint(0, 1)) for _ in ref]
+        for val in ref_other:
+            other.push(val)
+        assert (arr & other).traverse() == \
+            [a and b for a, b in zip(ref, ref_other)]
+        assert (arr | other).traverse() == \
+            [a or b for a, b in zip(ref, ref_other)]
+        assert (arr ^ other).traverse() == \
+            [a != b for a, b in zip(ref, ref_other)]
+        assert (~arr).traverse() == [not a for a in ref]
+        assert (~arr).popcount() == len(ref) - sum(ref)
+        other.push(True)
+        with pytest.raises(ValueError):
+            arr & other  # pylint: disable=pointless-statement
+
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_sparse_array(self, n_ops: int):
+        """
+        Test the correctness of the SparseArray class.
+        """
+        # small blocks to split and drop them often
+        arr = SparseArray[int](n_ops, 0, 4)
+        alt = RefArray(n_ops)
+        self._check_op_randomly(arr, alt, n_ops)
+        # empty slots in between the populated ones
+        for i in range(n_ops // 10):
+            if arr.get_size() > 0:
+                idx = randint(0, arr.get_size() - 1)
+                assert arr.update_at(idx, None) == alt.update_at(idx, None)
+            self._check_op_insert_at(arr, alt, None, n_ops)
+            self._check_op_insert_at(arr, alt, i, n_ops)
+            if i % 3 == 0:
+                self._check_op_pop(arr, alt)
+            assert arr.index_of(None) == alt.index_of(None)
+            assert list(reversed(arr)) == list(reversed(alt.traverse()))
+            assert alt == arr
+        assert list(arr.items()) == \
+            [(i, val) for i, val in enumerate(alt.traverse())
+             if val is not None]
+        assert arr.get_populated() == len(list(arr.items())) == \
+            sum(len(keys) for keys in arr.keys)
+        # the blocks are bounded, non-empty and cover disjoint ranges
+        assert not arr.bases or arr.bases[0] == 0
+        for blk, keys in enumerate(arr.keys):
+            assert 0 < len(keys) <= arr.block_size
+            assert keys == sorted(set(keys)) and keys[0] >= 0
+            if blk + 1 < len(arr.bases):
+                assert arr.bases[blk] + keys[-1] < arr.bases[blk + 1]
+        # a huge array only stores its populated slots
+        arr = SparseArray[int](10 ** 9, 10 ** 8)
+        for i in range(0, 10 ** 8, 10 ** 6):
+            assert arr.update_at(i, i)
+        arr.insert_at(0, 1)
+        assert arr.get_size() == 10 ** 8 + 1
+        assert arr.get_populated() == 101
+        assert len(arr.bases) > 1
+        assert arr.value_at(10 ** 6 + 1) == 10 ** 6
+        assert arr.value_at(10 ** 6) is None
+        assert arr.index_of(10 ** 6) == 10 ** 6 + 1
+
     @pytest.mark.parametrize(
         'n_ops',
         [100, 1000, 10000],
@@ -163,6 +352,508 @@ class TestSequenceImpl():
         # randomly test the operations
         self._check_op_randomly(arr, alt, n_ops)
 
+    def test_dynamic_array_default_policy(self):
+        """
+        Test the resizes of the DynamicArray class by the default policy.
+        """
+        arr = DynamicArray[int]()
+        capacities = []
+        for i in range(33):
+            arr.push(i)
+            capacities.append(arr.get_capacity())
+        assert capacities == [8] * 8 + [16] * 8 + [32] * 16 + [64]
+        capacities = {}
+        while arr.get_size():
+            arr.pop()
+            capacities[arr.get_size()] = arr.get_capacity()
+        # halves once the size after the deletion is a quarter, down to 8
+        assert [capacities[size] for size in (17, 16, 9, 8, 5, 4, 1, 0)] == \
+            [64, 32, 32, 16, 16, 8, 8, 8]
+        assert (arr.grow_count, arr.shrink_count) == (3, 3)
+
+    @pytest.mark.parametrize(
+        'max_size',
+        [1, 16, 64],
+    )
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000],
+    )
+    def test_fixed_array_bulk_ops(self, max_size: int, n_ops: int):
+        """
+        Test the correctness of the bulk operations of the FixedArray class.
+        """
+        arr = FixedArray[int](max_size)
+        alt = RefArray(max_size)
+        self._check_bulk_ops_randomly(arr, alt, n_ops)
+
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000],
+    )
+    def test_dynamic_array_bulk_ops(self, n_ops: int):
+        """
+        Test the correctness of the bulk operations of the DynamicArray class.
+        """
+        arr = DynamicArray[int]()
+        alt = RefArray()
+        self._check_bulk_ops_randomly(arr, alt, n_ops, max_batch=64)
+
+    @pytest.mark.parametrize(
+        'factor, min_capacity, shrink_load',
+        [(1.5, 1, 0.5), (2, 8, 0.25), (4, 2, 0.1)],
+    )
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_dynamic_array_growth_policy(
+            self, factor: float, min_capacity: int, shrink_load: float,
+            n_ops: int
+        ):
+        """
+        Test the correctness of the DynamicArray class with a growth policy.
+        """
+        policy = GrowthPolicy(factor, min_capacity, shrink_load)
+        arr = DynamicArray[int](policy)
+        alt = RefArray()
+        self._check_op_randomly(arr, alt, n_ops)
+        assert arr.get_size() <= arr.get_capacity()
+        assert arr.get_capacity() >= min_capacity
+        self._check_bulk_ops_randomly(arr, alt, n_ops // 10, max_batch=64)
+        assert arr.get_size() <= arr.get_capacity()
+        assert arr.get_capacity() >= min_capacity
+
+    def test_dynamic_array_reserve_shrink_to_fit(self):
+        """
+        Test the explicit resizes and the resize counters of the DynamicArray
+        class.
+        """
+        arr = DynamicArray[int](GrowthPolicy(2, 4, 0.25))
+        assert arr.get_capacity() == 4
+        arr.reserve(100)
+        assert arr.get_capacity() == 100
+        assert (arr.grow_count, arr.shrink_count, arr.copy_count) == (1, 0, 0)
+        # no resize for pushes within the reserved capacity
+        for i in range(100):
+            arr.push(i)
+        assert (arr.grow_count, arr.get_capacity()) == (1, 100)
+        # a smaller reservation does nothing
+        arr.reserve(10)
+        assert arr.get_capacity() == 100
+        for _ in range(70):
+            arr.pop()
+        assert arr.get_capacity() == 100
+        arr.shrink_to_fit()
+        assert arr.get_capacity() == 30
+        assert (arr.shrink_count, arr.copy_count) == (1, 30)
+        assert arr.traverse() == list(range(30))
+        for _ in range(30):
+            arr.pop()
+        arr.shrink_to_fit()
+        assert arr.get_capacity() == 4
+
+    @pytest.mark.parametrize(
+        'args',
+        [(1, 8, 0.25), (2, 0, 0.25), (2, 8, 0.5), (2, 8, -0.1)],
+    )
+    def test_growth_policy_invalid(self, args):
+        """
+        Test the invalid arguments of the GrowthPolicy class.
+        """
+        with pytest.raises(ValueError):
+            GrowthPolicy(*args)
+
+    @pytest.mark.parametrize(
+        'factor, min_capacity, shrink_load',
+        [(1.5, 1, 0.5), (2, 8, 0.25), (4, 2, 0.1)],
+    )
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_incremental_dynamic_array(
+            self, factor: float, min_capacity: int, shrink_load: float,
+            n_ops: int
+        ):
+        """
+        Test the correctness of the IncrementalDynamicArray class.
+        """
+        policy = GrowthPolicy(factor, min_capacity, shrink_load)
+        arr = IncrementalDynamicArray[int](policy)
+        alt = RefArray()
+        self._check_op_randomly(arr, alt, n_ops)
+        # only the operations which keep the migration going on
+        for i in range(n_ops):
+            op_to_check = choice([Op.PUSH, Op.PUSH, Op.POP, Op.VALUE_AT])
+            if op_to_check == Op.PUSH:
+                self._check_op_push(arr, alt, i)
+            elif op_to_check == Op.POP:
+                self._check_op_pop(arr, alt)
+            else:
+                self._check_op_value_at(arr, alt)
+                if arr.get_size():
+                    idx = randint(0, arr.get_size() - 1)
+                    assert arr.update_at(idx, -i) == alt.update_at(idx, -i)
+            # a push or a pop copies a few elements regardless of the size
+            assert arr._step <= 4 * factor  # pylint: disable=protected-access
+        assert alt == arr
+        self._check_bulk_ops_randomly(arr, alt, n_ops // 10, max_batch=64)
+
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_indexed_dynamic_array(self, n_ops: int):
+        """
+        Test the correctness of the IndexedDynamicArray class.
+        """
+        arr = IndexedDynamicArray[int]()
+        alt = RefArray()
+        self._check_op_randomly(arr, alt, n_ops)
+        # the repeating values and the bulk operations
+        self._check_bulk_ops_randomly(arr, alt, n_ops // 10, max_batch=64)
+        # the size can never reach this bound, so the insertions all succeed
+        max_size = n_ops + n_ops // 10 * (64 + 1) + 1
+        for i in range(n_ops // 10):
+            val = randint(0, 20)
+            assert arr.index_of(val) == alt.index_of(val)
+            self._check_op_insert_at(arr, alt, val, max_size)
+            self._check_op_update_at(arr, alt, randint(0, 20))
+            self._check_op_delete_at(arr, alt)
+            if i % 3 == 0:
+                self._check_op_pop(arr, alt)
+        # the index holds exactly the positions of each value
+        positions = {}
+        for i, val in enumerate(alt.traverse()):
+            positions.setdefault(val, []).append(i)
+        assert arr.positions == positions
+        # an unhashable value changes neither the array nor the index
+        if arr.get_size():
+            val = arr.value_at(arr.get_size() - 1)
+            writes = [
+                lambda: arr.insert_at(0, []),
+                lambda: arr.push([]),
+                lambda: arr.update_at(0, []),
+                lambda: arr.insert_many(0, [1, []]),
+                lambda: arr.extend([1, []]),
+                lambda: arr.update_range(0, [1, []]),
+                lambda: arr.update_many([0, 1], [1, []]),
+            ]
+            for write in writes:
+                with pytest.raises(TypeError):
+                    write()
+                assert alt == arr and arr.positions == positions
+                assert arr.index_of(val) == alt.index_of(val)
+
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_sorted_array(self, n_ops: int):
+        """
+        Test the correctness of the SortedArray class against a sorted list.
+        """
+        arr = SortedArray[int](policy=GrowthPolicy(2, 1, 0.25))
+        ref = []
+        for i in range(n_ops):
+            val = randint(-n_ops // 10, n_ops // 10)
+            op = randint(0, 9)
+            if op < 5:
+                arr.push(val)
+                insort(ref, val)
+            elif op < 6:
+                batch = [randint(-n_ops // 10, n_ops // 10)
+                         for _ in range(randint(0, 16))]
+                arr.merge_insert(batch)
+                ref = sorted(ref + batch)
+            elif op < 8 and ref:
+                idx = randint(0, len(ref) - 1)
+                assert arr.delete_at(idx)
+                del ref[idx]
+            elif op < 9:
+                assert arr.pop() == (ref.pop() if ref else None)
+            # an insertion or an update is only permitted if sorted
+            idx = randint(0, len(ref))
+            fits = (idx == 0 or ref[idx - 1] <= val) and \
+                (idx == len(ref) or val <= ref[idx])
+            assert arr.insert_at(idx, val) == fits
+            if fits:
+                ref.insert(idx, val)
+            if i % 10 == 0:
+                assert list(arr.traverse()) == ref
+            lo = bisect_left(ref, val)
+            hi = bisect_right(ref, val)
+            assert arr.index_of(val) == (lo if lo < hi else -1)
+            assert arr.count(val) == hi - lo
+            assert arr.rank(val) == lo
+            assert list(arr.range(val, val + 3)) == \
+                ref[lo:bisect_left(ref, val + 3)]
+            assert list(arr.range(val, val - 3)) == []
+        assert list(arr.traverse()) == ref
+
+    @pytest.mark.parametrize(
+        'cls',
+        [DynamicArray, TypedDynamicArray, IncrementalDynamicArray,
+         IndexedDynamicArray],
+    )
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000],
+    )
+    def test_array_gather_scatter(self, cls, n_ops: int):
+        """
+        Test the batched value_at_many and update_many of the array classes.
+        """
+        arr = cls[int]()
+        alt = RefArray()
+        for i in range(n_ops):
+            self._check_op_push(arr, alt, i)
+            if randint(0, 2) == 0:
+                self._check_op_pop(arr, alt)
+            size = alt.get_size()
+            idxes = [randint(-2, size + 1) for _ in range(randint(0, 16))]
+            assert arr.value_at_many(idxes) == \
+                [alt.value_at(idx) for idx in idxes]
+            vals = [-randint(0, n_ops) for _ in idxes]
+            assert arr.update_many(idxes, vals) == \
+                [alt.update_at(idx, val) for idx, val in zip(idxes, vals)]
+            assert alt == arr
+        # all indexes valid
+        idxes = list(range(alt.get_size()))
+        assert arr.value_at_many(idxes) == alt.traverse()
+        assert FixedArray[int](4).value_at_many([0, -1]) == [None, None]
+
+    @pytest.mark.parametrize(
+        'cls',
+        [DynamicArray, TypedDynamicArray, IncrementalDynamicArray],
+    )
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000],
+    )
+    def test_array_view(self, cls, n_ops: int):
+        """
+        Test the correctness of the views of the array classes.
+        """
+        arr = cls[int]()
+        ref = []
+        for i in range(n_ops):
+            arr.push(i)
+            ref.append(i)
+            lo, hi = randint(-i - 2, i + 2), randint(-i - 2, i + 2)
+            step = choice([None, 1, 2, 3, -1, -2])
+            view = arr.view(lo, hi, step)
+            assert view.traverse() == ref[lo:hi:step]
+            assert view.get_size() == len(ref[lo:hi:step])
+            if view.get_size():
+                idx = randint(0, view.get_size() - 1)
+                assert view.value_at(idx) == ref[lo:hi:step][idx]
+                assert view.index_of(view.value_at(idx)) == idx
+                # a view of a view
+                sub = view.view(1, None, 2)
+                assert sub.traverse() == ref[lo:hi:step][1::2]
+                # in-place updates are visible through the views
+                arr.update_at(i, -i)
+                ref[i] = -i
+                assert view.traverse() == ref[lo:hi:step]
+            assert view.value_at(view.get_size()) is None
+            assert view.index_of(-n_ops) == -1
+            # any resize of the parent makes the views stale
+            assert view.is_valid()
+            if randint(0, 1):
+                arr.push(n_ops + i)
+                arr.pop()
+            else:
+                arr.insert_at(0, i)
+                arr.delete_at(0)
+            assert not view.is_valid()
+            with pytest.raises(RuntimeError):
+                view.get_size()
+
+    @pytest.mark.parametrize(
+        'dtype',
+        ['int64', 'float64'],
+    )
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_typed_dynamic_array(self, dtype: str, n_ops: int):
+        """
+        Test the correctness of the TypedDynamicArray class.
+        """
+        arr = TypedDynamicArray[int](dtype)
+        alt = RefArray()
+        self._check_op_randomly(arr, alt, n_ops)
+        self._check_bulk_ops_randomly(arr, alt, n_ops // 10, max_batch=64)
+
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_gap_buffer(self, n_ops: int):
+        """
+        Test the correctness of the GapBuffer class.
+        """
+        arr = GapBuffer[int](GrowthPolicy(2, 1, 0.25))
+        alt = RefArray()
+        self._check_op_randomly(arr, alt, n_ops)
+        # the edits around a moving cursor
+        cursor = 0
+        for i in range(n_ops):
+            cursor = min(max(cursor + randint(-3, 3), 0), alt.get_size())
+            if randint(0, 2):
+                assert arr.insert_at(cursor, i) == alt.insert_at(cursor, i)
+            else:
+                assert arr.delete_at(cursor) == alt.delete_at(cursor)
+            assert alt == arr
+
+    @pytest.mark.parametrize(
+        'chunk_size',
+        [4, 5, 64],
+    )
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_chunked_sequence(self, chunk_size: int, n_ops: int):
+        """
+        Test the correctness of the ChunkedSequence class.
+        """
+        arr = ChunkedSequence[int](chunk_size)
+        alt = RefArray()
+        self._check_op_randomly(arr, alt, n_ops)
+        # grow a deep tree and shrink it back to empty
+        for i in range(n_ops):
+            self._check_op_insert_at(arr, alt, i, 2 * n_ops + 1)
+        assert alt == arr
+        while arr.get_size():
+            self._check_op_delete_at(arr, alt)
+            self._check_op_value_at(arr, alt)
+        assert alt == arr
+
+    @pytest.mark.parametrize(
+        'max_size',
+        [1, 4, 16],
+    )
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_mmap_fixed_array(self, max_size: int, n_ops: int, tmp_path):
+        """
+        Test the correctness of the MmapFixedArray class.
+        """
+        path = str(tmp_path / 'array.bin')
+        alt = RefArray(max_size)
+        with MmapFixedArray[int](path, '<q', max_size) as arr:
+            self._check_op_randomly(arr, alt, n_ops, max_size)
+        # the array persists in the file
+        with MmapFixedArray[int](path, '<q') as arr:
+            assert alt == arr
+            for _ in range(max_size + 1):
+                self._check_op_pop(arr, alt)
+            for i in range(max_size + 1):
+                self._check_op_push(arr, alt, -i)
+            assert alt == arr
+        # a file of records of another width or format is refused
+        for fmt in ('<i', '<d', '<Q', '<8s'):
+            with pytest.raises(ValueError):
+                MmapFixedArray[int](path, fmt)
+        # a file too short for its header or its slots is refused
+        with open(path, 'r+b') as file:
+            file.truncate(os.path.getsize(path) - 1)
+        with pytest.raises(ValueError):
+            MmapFixedArray[int](path, '<q')
+        with open(path, 'r+b') as file:
+            file.truncate(8)
+        with pytest.raises(ValueError):
+            MmapFixedArray[int](path, '<q')
+
+    def test_mmap_fixed_array_records(self, tmp_path):
+        """
+        Test the MmapFixedArray class with records of several fields.
+        """
+        path = str(tmp_path / 'records.bin')
+        with MmapFixedArray[tuple](path, '<dq', 8) as arr:
+            for i in range(8):
+                arr.push((i / 2, i))
+            assert arr.insert_at(0, (0.5, 1)) is False
+            assert arr.delete_at(2) and arr.insert_at(0, (-1.0, -1))
+            assert arr.update_at(1, (9.5, 9))
+            assert arr.index_of((3.0, 6)) == 6
+            assert arr.traverse() == [
+                (-1.0, -1), (9.5, 9), (0.5, 1), (1.5, 3), (2.0, 4), (2.5, 5),
+                (3.0, 6), (3.5, 7)]
+        with MmapFixedArray[tuple](path, '<dq') as arr:
+            assert arr.pop() == (3.5, 7)
+            assert arr.get_size() == 7
+
+    def test_mmap_fixed_array_unpackable(self, tmp_path):
+        """
+        Test an unpackable value leaves the MmapFixedArray unchanged.
+        """
+        path = str(tmp_path / 'array.bin')
+        with MmapFixedArray[int](path, 'i', 8) as arr:
+            for i in range(4):
+                arr.push(i)
+            for write in (lambda: arr.insert_at(1, 'x'),
+                          lambda: arr.push(2 ** 40),
+                          lambda: arr.update_at(2, None)):
+                with pytest.raises(struct.error):
+                    write()
+                assert arr.traverse() == [0, 1, 2, 3]
+                assert arr.get_size() == 4
+        with MmapFixedArray[tuple](path + '2', '<dq', 8) as arr:
+            arr.push((0.5, 1))
+            with pytest.raises(struct.error):
+                arr.update_at(0, (1.5, 'x'))
+            with pytest.raises(struct.error):
+                arr.insert_at(0, (1.5, 'x'))
+            assert arr.traverse() == [(0.5, 1)]
+
+    @pytest.mark.parametrize(
+        'factory',
+        [
+            lambda _: FixedArray[int](64),
+            lambda _: DynamicArray[int](),
+            lambda _: TypedDynamicArray[int](),
+            lambda _: IncrementalDynamicArray[int](),
+            lambda _: GapBuffer[int](),
+            lambda _: ChunkedSequence[int](4),
+            lambda tmp_path: MmapFixedArray[int](
+                str(tmp_path / 'array.bin'), '<q', 64),
+            lambda _: SinglyLinkedList[int](),
+            lambda _: DoublyLinkedList[int](),
+        ],
+    )
+    def test_sequence_protocol(self, factory, tmp_path):
+        """
+        Test the Python sequence protocol of the CustomSequence sub classes.
+        """
+        arr = factory(tmp_path)
+        ref = []
+        assert not arr and len(arr) == 0 and list(arr) == []
+        for i in range(60):
+            idx = randint(0, len(ref))
+            arr.insert_at(idx, i)
+            ref.insert(idx, i)
+            assert len(arr) == len(ref)
+            assert list(arr) == ref
+            assert list(reversed(arr)) == ref[::-1]
+            idx = randint(-len(ref), len(ref) - 1)
+            assert arr[idx] == ref[idx]
+            val = randint(-10, 70)
+            assert (val in arr) == (val in ref)
+            lo, hi = randint(-70, 70), randint(-70, 70)
+            step = choice([None, 1, 3, -1, -4])
+            assert arr[lo:hi:step] == ref[lo:hi:step]
+        with pytest.raises(IndexError):
+            arr[len(ref)]  # pylint: disable=pointless-statement
+        with pytest.raises(IndexError):
+            arr[-len(ref) - 1]  # pylint: disable=pointless-statement
+
     @pytest.mark.parametrize(
         'n_ops',
         [100, 1000, 10000],
@@ -192,3 +883,324 @@ class TestSequenceImpl():
         alt = RefArray()
         # randomly test the operations
         self._check_op_randomly(arr, alt, n_ops)
+
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_arena_linked_list(self, n_ops: int):
+        """
+        Test the correctness of the ArenaLinkedList class.
+        """
+        arr = ArenaLinkedList[int]()
+        alt = RefArray()
+        self._check_op_randomly(arr, alt, n_ops)
+        assert list(reversed(arr)) == alt.traverse()[::-1]
+        # the deleted handles are reused before the arrays grow
+        for i in range(100):
+            self._check_op_push(arr, alt, i)
+        n_slots = len(arr.vals)
+        for _ in range(50):
+            self._check_op_delete_at(arr, alt)
+        for i in range(50):
+            self._check_op_insert_at(arr, alt, i, 2 * n_ops)
+        assert len(arr.vals) == len(arr.nexts) == len(arr.prevs) == n_slots
+        assert alt == arr
+
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    @pytest.mark.parametrize(
+        'capacity',
+        [2, 5, 64],
+    )
+    def test_unrolled_linked_list(self, n_ops: int, capacity: int):
+        """
+        Test the correctness of the UnrolledLinkedList class.
+        """
+        arr = UnrolledLinkedList[int](capacity)
+        alt = RefArray()
+        self._check_op_randomly(arr, alt, n_ops)
+        for i in range(n_ops):
+            self._check_op_push(arr, alt, i)
+        for i in range(n_ops // 10):
+            self._check_op_insert_at(arr, alt, i, 3 * n_ops)
+            self._check_op_delete_at(arr, alt)
+            self._check_op_delete_at(arr, alt)
+            # all the blocks but the last one are at least half full
+            node = arr.head
+            while node:
+                assert capacity // 2 <= len(node.vals) <= capacity or \
+                    (node is arr.tail and node.vals)
+                assert node.next is None or node.next.prev is node
+                node = node.next
+        assert list(reversed(arr)) == alt.traverse()[::-1]
+        assert alt == arr
+
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    @pytest.mark.parametrize(
+        'p',
+        [0.25, 0.5],
+    )
+    def test_indexable_skip_list(self, n_ops: int, p: float):
+        """
+        Test the correctness of the IndexableSkipList class.
+        """
+        arr = IndexableSkipList[int](p, seed=n_ops)
+        alt = RefArray()
+        self._check_op_randomly(arr, alt, n_ops)
+        # the positional operations on a larger list
+        for i in range(n_ops):
+            self._check_op_push(arr, alt, i)
+        for i in range(n_ops):
+            self._check_op_value_at(arr, alt)
+            self._check_op_insert_at(arr, alt, i, 3 * n_ops)
+            self._check_op_update_at(arr, alt, i)
+            self._check_op_delete_at(arr, alt)
+        assert alt == arr
+        # the nodes of each number of levels
+        counts = arr.level_distribution()
+        assert sum(counts) == arr.get_size()
+        assert len(counts) == arr.level
+        assert counts[-1] > 0
+        # the nodes with at least 2 levels are about a fraction p of all
+        assert abs(sum(counts[1:]) / sum(counts) - p) < 0.1 + 10 / sum(counts)
+
+    @pytest.mark.parametrize(
+        'cls',
+        [SinglyLinkedList, DoublyLinkedList],
+    )
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_linked_list_tail(self, cls, n_ops: int):
+        """
+        Test the linked lists keeping their tail through all the operations,
+        and the operations at the head.
+        """
+        arr = cls[int]()
+        alt = RefArray()
+        for i in range(n_ops):
+            op = randint(0, 5)
+            if op == 0:
+                arr.append_left(i)
+                alt.insert_at(0, i)
+            elif op == 1:
+                assert arr.pop_left() == alt.value_at(0)
+                alt.delete_at(0)
+            elif op == 2:
+                self._check_op_push(arr, alt, i)
+            elif op == 3:
+                self._check_op_pop(arr, alt)
+            elif op == 4:
+                self._check_op_insert_at(arr, alt, i, n_ops)
+            else:
+                self._check_op_delete_at(arr, alt)
+            # the tail is the last node
+            if alt.get_size():
+                assert arr.tail is arr.node_at(arr.get_size() - 1)
+                assert arr.tail.next is None
+            else:
+                assert arr.head is arr.tail is None
+            assert alt == arr
+
+    @pytest.mark.parametrize(
+        'cls',
+        [SinglyLinkedList, DoublyLinkedList],
+    )
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000],
+    )
+    def test_linked_list_finger(self, cls, n_ops: int):
+        """
+        Test the linked lists keeping their cached finger node valid.
+        """
+        # pylint: disable=protected-access
+        arr = cls[int](4)
+        alt = RefArray()
+        ops = [Op.INSERT_AT, Op.DELETE_AT, Op.PUSH, Op.POP, Op.VALUE_AT,
+               Op.UPDATE_AT, 'append_left', 'pop_left', 'scan']
+        for i in range(n_ops):
+            op = choice(ops)
+            if op == Op.INSERT_AT:
+                self._check_op_insert_at(arr, alt, i, n_ops)
+            elif op == Op.DELETE_AT:
+                self._check_op_delete_at(arr, alt)
+            elif op == Op.PUSH:
+                self._check_op_push(arr, alt, i)
+            elif op == Op.POP:
+                self._check_op_pop(arr, alt)
+            elif op == Op.VALUE_AT:
+                self._check_op_value_at(arr, alt)
+            elif op == Op.UPDATE_AT:
+                self._check_op_update_at(arr, alt, i)
+            elif op == 'append_left':
+                arr.append_left(i)
+                alt.insert_at(0, i)
+            elif op == 'pop_left':
+                assert arr.pop_left() == alt.value_at(0)
+                alt.delete_at(0)
+            else:
+                # the sequential accesses in both directions
+                size = alt.get_size()
+                assert [arr.value_at(j) for j in range(size)] == \
+                    [arr.value_at(size - 1 - j) for j in range(size)][::-1] \
+                    == alt.traverse()
+            # the finger is the node at its index
+            if arr._finger:
+                node = arr.head
+                for _ in range(arr._finger_idx):
+                    node = node.next
+                assert node is arr._finger
+            assert alt == arr
+
+    @pytest.mark.parametrize(
+        'cls',
+        [SinglyLinkedList, DoublyLinkedList],
+    )
+    @pytest.mark.parametrize(
+        'size',
+        [0, 1, 2, 3, 100, 1000, 10000],
+    )
+    def test_linked_list_sort(self, cls, size: int):
+        """
+        Test sorting and deduplicating the linked lists in place.
+        """
+        arr = cls[int]()
+        ref = [randint(0, size // 4) for _ in range(size)]
+        for val in ref:
+            arr.push(val)
+        nodes = set()
+        node = arr.head
+        while node:
+            nodes.add(node)
+            node = node.next
+        arr.value_at(size // 2)
+        # stable on the keys, and by relinking the same nodes
+        arr.sort(key=lambda val: val % 7, reverse=True)
+        assert arr.traverse() == sorted(ref, key=lambda val: val % 7,
+                                        reverse=True)
+        arr.sort()
+        assert arr.traverse() == sorted(ref)
+        node = arr.head
+        while node:
+            assert node in nodes
+            node = node.next
+        assert arr.get_size() == size
+        assert list(reversed(arr)) == sorted(ref, reverse=True)
+        assert size == 0 or arr.tail.val == max(ref)
+        assert arr.value_at(size // 2) == \
+            (sorted(ref)[size // 2] if size else None)
+        # each value only once
+        uniques = sorted(set(ref))
+        assert arr.dedupe_sorted() == size - len(uniques)
+        assert arr.traverse() == uniques
+        assert list(reversed(arr)) == uniques[::-1]
+        assert arr.get_size() == len(uniques)
+        assert arr.value_at(len(uniques) - 1) == (uniques[-1] if ref else None)
+        arr.push(-1)
+        assert arr.traverse() == uniques + [-1]
+
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000],
+    )
+    def test_doubly_linked_list_splice(self, n_ops: int):
+        """
+        Test moving the elements between the doubly linked lists by relinking
+        the nodes.
+        """
+        # pylint: disable=protected-access
+        lists = [DoublyLinkedList[int]() for _ in range(3)]
+        refs = [[] for _ in range(3)]
+        for i in range(n_ops):
+            a, b = randint(0, 2), randint(0, 2)
+            arr, ref = lists[a], refs[a]
+            op = randint(0, 4)
+            if op == 0:
+                arr.push(i)
+                ref.append(i)
+            elif op == 1:
+                arr.concat(lists[b])
+                if a != b:
+                    ref += refs[b]
+                    refs[b] = []
+            elif op == 2:
+                idx = randint(-1, len(ref) + 1)
+                part = arr.split_at(idx)
+                if 0 <= idx <= len(ref):
+                    # keep the moved part in place of another list
+                    c = (a + 1) % 3
+                    lists[c], refs[c] = part, ref[idx:]
+                    del ref[idx:]
+                else:
+                    assert part is None
+            elif op == 3:
+                idx = randint(-1, len(ref) + 1)
+                ret = a != b and 0 <= idx <= len(ref)
+                assert arr.splice(idx, lists[b]) == ret
+                if ret:
+                    ref[idx:idx] = refs[b]
+                    refs[b] = []
+            else:
+                # move the finger around
+                if ref:
+                    idx = randint(0, len(ref) - 1)
+                    assert arr.value_at(idx) == ref[idx]
+            for arr, ref in zip(lists, refs):
+                assert arr.traverse() == ref
+                assert list(reversed(arr)) == ref[::-1]
+                assert arr.get_size() == len(ref)
+                assert (arr.head is None) == (arr.tail is None) == (not ref)
+                if arr._finger:
+                    assert arr._finger.val == ref[arr._finger_idx]
+
+    @pytest.mark.parametrize(
+        'cls',
+        [SinglyLinkedList, DoublyLinkedList],
+    )
+    @pytest.mark.parametrize(
+        'pool_size',
+        [1, 16],
+    )
+    def test_linked_list_node_pool(self, cls, pool_size: int):
+        """
+        Test the linked lists recycling their deleted nodes.
+        """
+        arr = cls[int](pool_size)
+        alt = RefArray()
+        self._check_op_randomly(arr, alt, 1000)
+        # the nodes are slot-based
+        assert not hasattr(arr.Node(0), '__dict__')
+        for i in range(100):
+            self._check_op_push(arr, alt, i)
+        # keep the nodes alive so that their ids are not taken by new ones
+        nodes = []
+        node = arr.get_head()
+        while node:
+            nodes.append(node)
+            node = node.next
+        ids = {id(node) for node in nodes}
+        for _ in range(50):
+            self._check_op_delete_at(arr, alt)
+        # the free-list is bounded and holds cleared nodes
+        assert len(arr._pool) == pool_size  # pylint: disable=protected-access
+        for node in arr._pool:  # pylint: disable=protected-access
+            assert node.val is None and node.next is None
+        # the next insertions reuse the deleted nodes
+        for i in range(pool_size):
+            self._check_op_insert_at(arr, alt, i, 1000)
+        assert not arr._pool  # pylint: disable=protected-access
+        node = arr.get_head()
+        reused = 0
+        while node:
+            reused += id(node) in ids
+            node = node.next
+        assert reused == arr.get_size()
+        assert alt == arr
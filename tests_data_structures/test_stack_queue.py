@@ -8,7 +8,7 @@ implementations.
 """
 from collections import deque
 from enum import Enum
-from random import choice
+from random import choice, randint
 import pytest
 from data_structures.sequence import CustomStackQueue, CustomStack
 from data_structures.sequence import LinkedStack, ArrayStack, QueuedStack
@@ -135,3 +135,51 @@ class TestStackQueue():
         tar = StackedQueue[int]()
         ref = deque()
         self._check_op_randomly(tar, ref, n_ops)
+
+    @pytest.mark.parametrize(
+        'n_ops',
+        [100, 1000, 10000],
+    )
+    def test_array_queue_bulk(self, n_ops: int):
+        """Test the bulk and peek operations of the ArrayQueue class."""
+        tar = ArrayQueue[int]()
+        ref = deque()
+        for i in range(n_ops):
+            k = randint(0, 40)
+            op = randint(0, 4)
+            if op == 0:
+                vals = list(range(i * 100, i * 100 + k))
+                tar.push_many(iter(vals))
+                ref.extend(vals)
+            elif op == 1:
+                expected = [ref.popleft() for _ in range(min(k, len(ref)))]
+                assert tar.pop_many(k) == expected
+            elif op == 2:
+                assert tar.peek_many(k) == list(ref)[:k]
+            elif op == 3:
+                assert tar.peek() == (ref[0] if ref else None)
+            else:
+                self._check_op_pop(tar, ref)
+            capacity = len(tar.data)
+            assert capacity >= ArrayQueue.BASE_SIZE
+            assert capacity & (capacity - 1) == 0
+            self._check_op_traverse(tar, ref)
+            self._check_op_get_size(tar, ref)
+
+    @pytest.mark.parametrize(
+        'k',
+        [1, 500, 992, 995, 1000, 2000],
+    )
+    def test_array_queue_bulk_shrink(self, k: int):
+        """Test a bulk drain of ArrayQueue shrinks like single pops."""
+        tar = ArrayQueue[int]()
+        alt = ArrayQueue[int]()
+        tar.push_many(range(1000))
+        alt.push_many(range(1000))
+        assert len(tar.data) == 1024
+        assert tar.pop_many(k) == [alt.pop() for _ in range(min(k, 1000))]
+        assert len(tar.data) == len(alt.data)
+        assert len(tar.data) <= max(ArrayQueue.BASE_SIZE, 4 * tar.size)
+        assert tar.traverse() == alt.traverse()
+        if k >= 1000:
+            assert len(tar.data) == ArrayQueue.BASE_SIZE
@@ -151,3 +151,26 @@ class TestBinarySearch():
             self._generate_repeat_ordered_list,
             self._calc_correct_search_right_bound_idx,
         )
+
+    SEARCH_INSERTION_FUNCTIONS = [
+        ('search_insertion_left', bisect_left),
+        ('search_insertion_right', bisect_right),
+    ]
+    """The pairs of binary search implementations for the insertion position
+    and their counterparts in the `bisect` module.
+    """
+
+    @pytest.mark.parametrize('n_diff_elms', (0, 1, 2, 3, 5, 10,))
+    @pytest.mark.parametrize('n_checks', (10,))
+    @pytest.mark.parametrize('func, ref_func', SEARCH_INSERTION_FUNCTIONS)
+    def test_search_insertion(self, n_diff_elms, n_checks, func, ref_func):
+        """Test the correctness of the binary search implementations for the
+        position to insert a value into an ordered list.
+        """
+        search_func = getattr(BinarySearch, func)
+        for _ in range(n_checks):
+            _list = self._generate_repeat_ordered_list(n_diff_elms)
+            lo = _list[0] - 10 if _list else -10
+            hi = _list[-1] + 10 if _list else 10
+            for val in range(lo, hi + 1):
+                assert search_func(_list, val) == ref_func(_list, val)